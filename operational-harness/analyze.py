@@ -8,7 +8,9 @@ navigate internal modules. Outputs JSON/CSV receipts.
 
 import os
 import json
+import inspect
 import argparse
+from contextlib import nullcontext
 from datetime import datetime
 
 # Force non-GUI plotting backend (prevents macOS blocking)
@@ -17,23 +19,28 @@ os.environ.setdefault("MPLBACKEND", "Agg")
 def _now_iso() -> str:
     return datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
 
-def simple_extraction(text: str, quiet: bool = False, as_json: bool = False) -> int:
+def simple_extraction(text: str, quiet: bool = False, as_json: bool = False, mode: str = "spacy") -> int:
     """Simple commitment extraction (default mode)."""
     try:
         from src.extraction import extract_hard_commitments
-        import spacy
+        from src.models import get_spacy_model
     except ImportError as e:
         print(f"Import error: {e}", file=__import__('sys').stderr)
         return 1
     
-    try:
-        nlp = spacy.load("en_core_web_sm")
-    except OSError:
-        print("Error: spaCy model 'en_core_web_sm' not found.", file=__import__('sys').stderr)
-        print("Install with: python -m spacy download en_core_web_sm", file=__import__('sys').stderr)
-        return 1
+    nlp = None
+    if mode == "spacy":
+        try:
+            nlp = get_spacy_model("en_core_web_sm")
+        except ImportError as e:
+            print(f"Import error: {e}", file=__import__('sys').stderr)
+            return 1
+        except OSError:
+            print("Error: spaCy model 'en_core_web_sm' not found.", file=__import__('sys').stderr)
+            print("Install with: python -m spacy download en_core_web_sm", file=__import__('sys').stderr)
+            return 1
     
-    commitments = extract_hard_commitments(text, nlp)
+    commitments = extract_hard_commitments(text, nlp, mode=mode)
     
     if as_json:
         import json
@@ -73,9 +80,11 @@ def run_simple_extraction() -> int:
     p.add_argument("text", help="Text to analyze")
     p.add_argument("--quiet", "-q", action="store_true", help="Output only commitments (no headers)")
     p.add_argument("--json", action="store_true", help="Output as JSON")
+    p.add_argument("--mode", choices=["spacy", "fast"], default="spacy",
+                   help="Extractor: spaCy sentence parsing (default) or regex-only fast path")
     
     args = p.parse_args()
-    return simple_extraction(args.text, quiet=args.quiet, as_json=args.json)
+    return simple_extraction(args.text, quiet=args.quiet, as_json=args.json, mode=args.mode)
 
 def run_experiment() -> int:
     """Experimental harness CLI."""
@@ -87,20 +96,31 @@ def run_experiment() -> int:
 
     sub = p.add_subparsers(dest="experiment", required=True)
 
+    # instrumentation shared by every experiment (src/timing.py)
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--timing", action="store_true",
+                        help="Record per-stage wall/CPU time and call counts in the receipt.")
+    common.add_argument("--profile", metavar="PATH",
+                        help="Run under cProfile and dump stats to PATH (.prof).")
+    common.add_argument("--flamegraph", metavar="PATH",
+                        help="Write folded stage stacks to PATH (flamegraph.pl/speedscope); implies --timing.")
+
     # compression experiment
-    pc = sub.add_parser("compression", help="Run compression sweep on a signal.")
+    pc = sub.add_parser("compression", parents=[common], help="Run compression sweep on a signal.")
     pc.add_argument("--signal", required=True, help="Input signal text.")
+    pc.add_argument("--reuse-encoder", action="store_true", default=None,
+                    help="Encode the signal once and decode every sigma from cached encoder states.")
     pc.add_argument("--out", default="outputs/compression_receipt.json", help="Output receipt path (json).")
 
     # recursion experiment
-    pr = sub.add_parser("recursion", help="Run recursion test on a signal.")
+    pr = sub.add_parser("recursion", parents=[common], help="Run recursion test on a signal.")
     pr.add_argument("--signal", required=True, help="Input signal text.")
     pr.add_argument("--depth", type=int, default=8, help="Recursion depth.")
     pr.add_argument("--enforced", action="store_true", help="Use enforcement mode.")
     pr.add_argument("--out", default="outputs/recursion_receipt.json", help="Output receipt path (json).")
 
     # full pipeline
-    pf = sub.add_parser("full", help="Run the deterministic pipeline (if available).")
+    pf = sub.add_parser("full", parents=[common], help="Run the deterministic pipeline (if available).")
     pf.add_argument("--out", default="outputs/full_receipt.json", help="Output receipt path (json).")
 
     # Remove 'run' from argv so argparse sees the subcommand correctly
@@ -128,8 +148,34 @@ def run_experiment() -> int:
         },
     }
 
+    from src.timing import TIMER, dump_json, profile
+    if args.timing or args.flamegraph:
+        TIMER.enable()
+    with profile(args.profile) if args.profile else nullcontext():
+        run_selected(args, receipt, compression_sweep, recursion_test, deterministic_pipeline)
+
+    from src.cache import EXTRACTION_CACHE, TRANSFORM_CACHE
+    receipt["extraction_cache"] = EXTRACTION_CACHE.stats()
+    receipt["transform_cache"] = TRANSFORM_CACHE.stats()
+    if args.flamegraph:
+        receipt["flamegraph"] = args.flamegraph
+    if args.profile:
+        receipt["profile"] = args.profile
+
+    # adds receipt["timing"] while timing is on
+    dump_json(receipt, args.out, indent=2, ensure_ascii=False)
+    if args.flamegraph:
+        TIMER.write_folded(args.flamegraph)
+
+    if TIMER.enabled:
+        print(TIMER.summary())
+    print(f"✓ Wrote receipt: {args.out}")
+    return 0
+
+def run_selected(args, receipt, compression_sweep, recursion_test, deterministic_pipeline) -> None:
+    """Run the chosen experiment and add its results to the receipt."""
     if args.experiment == "compression":
-        sigma_vals, fid_vals = compression_sweep(args.signal)
+        sigma_vals, fid_vals = compression_sweep(args.signal, reuse_encoder=args.reuse_encoder)
         receipt.update({
             "input_signal": args.signal,
             "n": len(fid_vals),
@@ -138,11 +184,13 @@ def run_experiment() -> int:
         })
 
     elif args.experiment == "recursion":
-        deltas = recursion_test(args.signal, depth=args.depth, enforced=args.enforced) if hasattr(recursion_test, '__code__') and 'enforced' in recursion_test.__code__.co_varnames else recursion_test(args.signal, depth=args.depth)
+        # signature() follows the timing decorator to the wrapped function
+        has_enforced = 'enforced' in inspect.signature(recursion_test).parameters
+        deltas = recursion_test(args.signal, depth=args.depth, enforced=args.enforced) if has_enforced else recursion_test(args.signal, depth=args.depth)
         receipt.update({
             "input_signal": args.signal,
             "depth": args.depth,
-            "enforced": args.enforced if hasattr(recursion_test, '__code__') and 'enforced' in recursion_test.__code__.co_varnames else False,
+            "enforced": args.enforced if has_enforced else False,
             "deltas": deltas,
         })
 
@@ -152,11 +200,5 @@ def run_experiment() -> int:
         result = deterministic_pipeline()
         receipt.update({"result": result})
 
-    with open(args.out, "w", encoding="utf-8") as f:
-        json.dump(receipt, f, indent=2, ensure_ascii=False)
-
-    print(f"✓ Wrote receipt: {args.out}")
-    return 0
-
 if __name__ == "__main__":
     raise SystemExit(main())
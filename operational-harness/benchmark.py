@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite CLI (src/bench.py).
+
+Run:
+  python benchmark.py run                         # outputs/benchmarks/bench_<ts>.json
+  python benchmark.py run --quick --group extraction --group metrics
+  python benchmark.py compare OLD.json NEW.json   # exit 1 on any regression
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+# Force non-GUI plotting backend (end-to-end benchmarks plot)
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+# Change to harness directory to make imports work
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+from src.bench import BENCHMARKS, REGRESSION_THRESHOLD, compare, run_suite
+
+def cmd_run(args) -> int:
+    groups = set(args.group) if args.group else None
+    print("=" * 70)
+    print(f"BENCHMARKS — {'quick' if args.quick else 'full'} run"
+          f"{'' if not groups else ' (' + ', '.join(sorted(groups)) + ')'}")
+    print("=" * 70)
+    result = run_suite(groups=groups, quick=args.quick)
+    out = args.out or f"outputs/benchmarks/bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(result, f, indent=2)
+    print("=" * 70)
+    print(f"✓ Results saved to: {out}")
+    return 0
+
+def cmd_compare(args) -> int:
+    with open(args.old) as f:
+        old = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    rows = compare(old, new, threshold=args.threshold)
+    print("=" * 70)
+    print(f"BENCHMARK COMPARISON — {old.get('git_commit')} → {new.get('git_commit')} "
+          f"(threshold ±{args.threshold:.0%})")
+    print("=" * 70)
+    marks = {"regression": "✗", "improved": "↑", "ok": " ", "new": "+", "removed": "-", "skipped": "?"}
+    for r in rows:
+        if r["ratio"] is None:
+            print(f"  {marks[r['status']]} {r['name']:42s} {r['status']}")
+        else:
+            print(f"  {marks[r['status']]} {r['name']:42s} {r['old_ms']:10.4f} → {r['new_ms']:10.4f} ms"
+                  f"  ({r['ratio']:.2f}x)  {r['status']}")
+    regressions = [r for r in rows if r["status"] == "regression"]
+    print("=" * 70)
+    print(f"{len(regressions)} regression(s)" if regressions else "No regressions")
+    return 1 if regressions else 0
+
+def main() -> int:
+    p = argparse.ArgumentParser(prog="benchmark", description="Harness benchmark suite.")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    pr = sub.add_parser("run", help="Run the benchmarks and save JSON results.")
+    pr.add_argument("--group", action="append",
+                    choices=sorted({g for g, _, _ in BENCHMARKS}), help="Only this group (repeatable).")
+    pr.add_argument("--quick", action="store_true", help="Fewer timed passes per benchmark.")
+    pr.add_argument("--out", help="Output path (json).")
+
+    pc = sub.add_parser("compare", help="Flag regressions between two result files.")
+    pc.add_argument("old", help="Baseline results (json).")
+    pc.add_argument("new", help="Candidate results (json).")
+    pc.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                    help="Median latency growth counted as a regression (default 0.15).")
+
+    args = p.parse_args()
+    return cmd_run(args) if args.command == "run" else cmd_compare(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
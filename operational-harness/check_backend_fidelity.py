@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Check an accelerated transform backend (int8 or ONNX) against fp32 PyTorch.
+
+Runs the transforms the harness uses — both summarizers over the sigma grid
+and en→de→en back-translation — on every canonical-corpus signal with the
+fp32 reference and with the candidate backend, then compares
+extract_hard_commitments on each pair of outputs. A backend is safe for
+experiments (Config.TRANSFORM_BACKEND) when every extraction matches; the
+text itself may differ in ways the extractor does not see.
+
+Run:
+  python check_backend_fidelity.py          # int8
+  python check_backend_fidelity.py onnx
+Exits non-zero on any extraction mismatch.
+"""
+import json
+import os
+import sys
+import time
+
+# Change to harness directory to make imports work
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+from src.cache import CachedPipeline, TransformCache
+from src.config import SIGMA_GRID
+from src.extraction import extract_hard_commitments, load_spacy_model
+
+CORPUS_PATH = "../corpus/canonical_corpus.json"
+BACKEND     = sys.argv[1] if len(sys.argv) > 1 else "int8"
+
+# (task, model, pipeline kwargs, min_length(sigma)) as built and called in
+# src/test_harness.py and src/deterministic_pipeline.py
+SUMMARIZERS = [("summarization", "sshleifer/distilbart-cnn-12-6", {}, lambda s: 5),
+               ("summarization", "facebook/bart-large-cnn", {"framework": "pt", "device": -1},
+                lambda s: max(5, s // 4))]
+EN_DE = ("translation", "Helsinki-NLP/opus-mt-en-de", {"tokenizer": "Helsinki-NLP/opus-mt-en-de", "framework": "pt"})
+DE_EN = ("translation", "Helsinki-NLP/opus-mt-de-en", {"tokenizer": "Helsinki-NLP/opus-mt-de-en", "framework": "pt"})
+
+with open(CORPUS_PATH) as f:
+    signals = [entry["signal"] for entry in json.load(f)["canonical_signals"]]
+
+def transforms(backend):
+    """Every transform output for the corpus, and the seconds it took."""
+    # fresh in-memory caches: nothing is reused between backends or from disk
+    make = lambda spec: CachedPipeline(spec[0], spec[1], cache=TransformCache(path=None),
+                                       backend=backend, **spec[2])
+    summarizers = [(make(s[:3]), s[3]) for s in SUMMARIZERS]
+    en_de, de_en = make(EN_DE), make(DE_EN)
+    for pipe in [s for s, _ in summarizers] + [en_de, de_en]:
+        pipe.pipeline  # load outside the timed region
+    outputs = []
+    start = time.perf_counter()
+    for summ, min_length in summarizers:
+        for sigma in SIGMA_GRID:
+            outs = summ(signals, max_length=sigma, min_length=min_length(sigma), do_sample=False)
+            outputs += [(f"{summ.model} σ={sigma}", s, o["summary_text"]) for s, o in zip(signals, outs)]
+    de = [o["translation_text"] for o in en_de(signals, max_length=400, do_sample=False)]
+    back = [o["translation_text"] for o in de_en(de, max_length=400, do_sample=False)]
+    outputs += [("back-translation", s, o) for s, o in zip(signals, back)]
+    return outputs, time.perf_counter() - start
+
+nlp = load_spacy_model()
+ref_out, ref_s = transforms("torch")
+cand_out, cand_s = transforms(BACKEND)
+
+mismatches = []
+same_text = 0
+for (label, signal, ref), (_, _, cand) in zip(ref_out, cand_out):
+    same_text += ref == cand
+    a, b = extract_hard_commitments(ref, nlp), extract_hard_commitments(cand, nlp)
+    if a != b:
+        mismatches.append({"transform": label, "signal": signal, "fp32": sorted(a), BACKEND: sorted(b)})
+
+print("=" * 70)
+print(f"TRANSFORM BACKEND FIDELITY — {BACKEND} vs fp32 (n={len(signals)} signals, {len(ref_out)} outputs)")
+print("=" * 70)
+print(f"  fp32    : {ref_s:8.1f} s")
+print(f"  {BACKEND:8s}: {cand_s:8.1f} s   ({ref_s / cand_s:.2f}x)")
+print(f"  Identical text:       {same_text}/{len(ref_out)}")
+print(f"  Identical extraction: {len(ref_out) - len(mismatches)}/{len(ref_out)}")
+for m in mismatches:
+    print(f"  ✗ [{m['transform']}] {m['signal'][:55]}")
+    print(f"      fp32:  {m['fp32']}")
+    print(f"      {BACKEND}: {m[BACKEND]}")
+print("=" * 70)
+
+os.makedirs("outputs", exist_ok=True)
+out_path = f"outputs/backend_fidelity_{BACKEND}.json"
+with open(out_path, "w") as f:
+    json.dump({
+        "backend": BACKEND,
+        "n_signals": len(signals),
+        "n_outputs": len(ref_out),
+        "fp32_seconds": ref_s,
+        "backend_seconds": cand_s,
+        "speedup": ref_s / cand_s,
+        "identical_text": same_text,
+        "identical_extraction": len(ref_out) - len(mismatches),
+        "mismatches": mismatches,
+    }, f, indent=2)
+
+print(f"✓ Fidelity report saved to: {out_path}")
+sys.exit(1 if mismatches else 0)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Check encoder-output reuse (src/sweep.py) against the plain pipeline call.
+
+For every canonical-corpus signal and every sigma in the grid, compares the
+summary summarize_across_sigmas decodes from one shared encoder pass with
+the summary the pipeline itself returns for summarizer(signal, max_length=
+sigma, ...), for both summarizers the sweeps use, each with the min_length
+its sweep passes. Reuse primes the transform cache under the pipeline's
+keys, so SWEEP_REUSE_ENCODER / --reuse-encoder is only safe while every
+summary here matches.
+
+Run:
+  python check_encoder_reuse.py
+Exits non-zero on any mismatch.
+"""
+import json
+import os
+import sys
+
+# Change to harness directory to make imports work
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+from src.config import SIGMA_GRID
+from src.models import get_local_pipeline
+from src.sweep import summarize_across_sigmas
+
+CORPUS_PATH = "../corpus/canonical_corpus.json"
+
+# (model, pipeline kwargs, min_length(sigma)) as compression_sweep uses them
+# in src/test_harness.py and src/deterministic_pipeline.py
+SUMMARIZERS = [("sshleifer/distilbart-cnn-12-6", {}, lambda s: 5),
+               ("facebook/bart-large-cnn", {"framework": "pt", "device": -1}, lambda s: max(5, s // 4))]
+
+with open(CORPUS_PATH) as f:
+    signals = [entry["signal"] for entry in json.load(f)["canonical_signals"]]
+
+mismatches = []
+checked = 0
+for model, kwargs, min_length in SUMMARIZERS:
+    pipe = get_local_pipeline("summarization", model, **kwargs)
+    for signal in signals:
+        reused = summarize_across_sigmas(pipe, signal, SIGMA_GRID, min_length)
+        for sigma in SIGMA_GRID:
+            direct = pipe(signal, max_length=sigma, min_length=min_length(sigma),
+                          do_sample=False)[0]["summary_text"]
+            checked += 1
+            if reused[sigma] != direct:
+                mismatches.append({"model": model, "sigma": sigma, "signal": signal,
+                                   "pipeline": direct, "reused": reused[sigma]})
+
+print("=" * 70)
+print(f"ENCODER REUSE — n={len(signals)} signals × {len(SIGMA_GRID)} sigmas × {len(SUMMARIZERS)} models")
+print("=" * 70)
+print(f"  Identical summaries: {checked - len(mismatches)}/{checked}")
+for m in mismatches:
+    print(f"  ✗ [{m['model']} σ={m['sigma']}] {m['signal'][:50]}")
+    print(f"      pipeline: {m['pipeline']}")
+    print(f"      reused:   {m['reused']}")
+print("=" * 70)
+
+os.makedirs("outputs", exist_ok=True)
+out_path = "outputs/encoder_reuse_check.json"
+with open(out_path, "w") as f:
+    json.dump({
+        "n_signals": len(signals),
+        "sigma_grid": SIGMA_GRID,
+        "models": [m for m, _, _ in SUMMARIZERS],
+        "checked": checked,
+        "identical": checked - len(mismatches),
+        "mismatches": mismatches,
+    }, f, indent=2)
+
+print(f"✓ Encoder reuse report saved to: {out_path}")
+sys.exit(1 if mismatches else 0)
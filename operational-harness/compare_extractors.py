@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Compare the spaCy and regex ("fast") extractor modes on the canonical corpus.
+Reports per-call latency, speedup and agreement so high-volume screening can
+decide whether the fast path is close enough.
+"""
+import json
+import os
+import sys
+import time
+
+from src.extraction import (_commitments_from_doc, extract_hard_commitments,
+                            extract_hard_commitments_fast, load_spacy_model)
+from src.metrics import jaccard
+
+CORPUS_PATH = "../corpus/canonical_corpus.json"
+OUT_PATH    = "outputs/extractor_comparison.json"
+REPEATS     = int(os.environ.get("EXTRACTOR_BENCH_REPEATS", "20"))
+
+def load_signals(path=CORPUS_PATH):
+    with open(path) as f:
+        return [entry["signal"] for entry in json.load(f)["canonical_signals"]]
+
+def time_per_call(fn, signals, repeats=REPEATS):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for s in signals:
+            fn(s)
+    return (time.perf_counter() - start) / (repeats * len(signals))
+
+def compare(signals, nlp, repeats=REPEATS):
+    """Latency of both modes and their agreement on `signals`."""
+    spacy_out = [extract_hard_commitments(s, nlp) for s in signals]
+    fast_out  = [extract_hard_commitments_fast(s) for s in signals]
+
+    # time the extraction work itself: extract_hard_commitments would serve
+    # every timed call from EXTRACTION_CACHE after the pass above
+    spacy_s = time_per_call(lambda s: _commitments_from_doc(nlp(s)), signals, repeats)
+    fast_s  = time_per_call(extract_hard_commitments_fast, signals, repeats)
+
+    jaccs = [jaccard(a, b) for a, b in zip(spacy_out, fast_out)]
+    return {
+        "n_signals": len(signals),
+        "repeats": repeats,
+        "spacy_ms_per_call": spacy_s * 1e3,
+        "fast_ms_per_call": fast_s * 1e3,
+        "speedup": spacy_s / fast_s,
+        "exact_agreement": sum(1 for a, b in zip(spacy_out, fast_out) if a == b),
+        "mean_jaccard": sum(jaccs) / len(jaccs),
+        "disagreements": [{"signal": s, "spacy": sorted(a), "fast": sorted(b)}
+                          for s, a, b in zip(signals, spacy_out, fast_out) if a != b],
+    }
+
+def main() -> int:
+    # Change to harness directory so the corpus and outputs paths resolve
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    signals = load_signals()
+    nlp = load_spacy_model()  # load outside the timed region
+    result = compare(signals, nlp)
+
+    print("=" * 70)
+    print(f"EXTRACTOR MODES — canonical corpus (n={result['n_signals']}, repeats={result['repeats']})")
+    print("=" * 70)
+    print(f"  spaCy : {result['spacy_ms_per_call']:8.3f} ms/call")
+    print(f"  fast  : {result['fast_ms_per_call']:8.3f} ms/call")
+    print(f"  Speedup:        {result['speedup']:8.1f}x")
+    print(f"  Exact agreement: {result['exact_agreement']}/{result['n_signals']} signals")
+    print(f"  Mean Jaccard:    {result['mean_jaccard']:.3f}")
+    for d in result["disagreements"]:
+        print(f"  ✗ {d['signal'][:60]}")
+        print(f"      spaCy: {d['spacy']}")
+        print(f"      fast:  {d['fast']}")
+    print("=" * 70)
+
+    os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
+    with open(OUT_PATH, "w") as f:
+        json.dump(result, f, indent=2)
+
+    print(f"✓ Comparison saved to: {OUT_PATH}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
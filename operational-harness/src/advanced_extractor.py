@@ -3,17 +3,16 @@ import re
 import json
 import hashlib
 import dateparser
-import spacy
-
-nlp = spacy.load("en_core_web_sm")
+from datetime import date
+from .cache import EXTRACTION_CACHE
+from .lexicon import MODAL_LEX, MODAL_MATCHER
+from .models import get_spacy_model, spacy_model_id
+from .timing import timed
 
 NUM_RE = re.compile(r'\$?\d{1,3}(?:[,\d]*)?(?:\.\d+)?')
 
-MODAL_LEX = {
-    "must": "OBLIGATION", "shall": "OBLIGATION", "required": "OBLIGATION",
-    "must not": "PROHIBITION", "shall not": "PROHIBITION", "cannot": "PROHIBITION",
-    "may": "PERMISSION", "is defined as": "DEFINITION", "means": "DEFINITION"
-}
+# MODAL_LEX lives in src.lexicon so all extractors share one cue automaton
+_LEX_ORDER = {cue: i for i, cue in enumerate(MODAL_LEX)}
 
 def normalize_text(s: str) -> str:
     s = s.strip()
@@ -31,18 +30,20 @@ def canonicalize_number(tok: str) -> str:
     return tok.lower()
 
 def sentence_candidates(text: str):
-    doc = nlp(normalize_text(text))
+    doc = get_spacy_model()(normalize_text(text))
     return [sent.text.strip() for sent in doc.sents]
 
 def cue_lookup(sent: str):
-    s = sent.lower()
-    for cue, mod in MODAL_LEX.items():
-        if cue in s:
-            return cue, mod
-    return None, None
+    # earliest MODAL_LEX entry among the cues present (word-boundary match)
+    cues = {m.cue for m in MODAL_MATCHER.finditer(sent, ("modal_lex",))}
+    if not cues:
+        return None, None
+    cue = min(cues, key=_LEX_ORDER.__getitem__)
+    return cue, MODAL_LEX[cue]
 
 def build_tuple_from_sentence(sent: str):
     cue, modality = cue_lookup(sent)
+    nlp = get_spacy_model()
     doc = nlp(sent)
     subj = None
     obj = None
@@ -78,6 +79,10 @@ def build_tuple_from_sentence(sent: str):
     key_hash = hashlib.sha256(key.encode("utf8")).hexdigest()[:12]
     return tup, key, key_hash
 
+@timed("extract.advanced")
+# dateparser resolves relative dates ("by Friday") against today, so the
+# reference date is part of the cache name alongside the spaCy model
+@EXTRACTION_CACHE.memoize(lambda: f"advanced:{spacy_model_id()}@{date.today().isoformat()}")
 def extract_hard(text: str):
     keys = []
     for sent in sentence_candidates(text):
@@ -0,0 +1,292 @@
+"""
+Benchmark suite for extraction, transforms, metrics and full sweeps.
+
+Every benchmark runs one fixed workload drawn from corpus/canonical_corpus.json
+(all 20 signals, in file order) for a number of timed passes after one
+untimed warm-up pass, which also loads any models. Extraction and transform
+caches are emptied and kept in memory before every pass, so timings measure
+the work itself, not cache hits from an earlier pass or run. End-to-end
+benchmarks run inside a temporary working directory, so the plots they save
+are discarded with it.
+
+Benchmarks whose dependencies are missing (spaCy model, transformers,
+matplotlib) are recorded as skipped rather than failing the suite.
+run_suite() returns a JSON-ready dict; compare() diffs two of them and flags
+benchmarks whose median per-call latency grew by more than a threshold.
+See benchmark.py for the CLI.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .cache import EXTRACTION_CACHE, TRANSFORM_CACHE
+
+ROOT          = Path(__file__).resolve().parents[2]
+CORPUS_PATH   = ROOT / "corpus" / "canonical_corpus.json"
+PAPER_HARNESS = ROOT / "paper_harness"
+
+# Timed passes per group (before --quick); one pass covers the whole fixture
+REPEATS = {"extraction": 20, "metrics": 200, "transforms": 3, "end_to_end": 1}
+REGRESSION_THRESHOLD = 0.15  # median latency growth flagged by compare()
+
+# Groups run from a throwaway cwd (they write plot files as a side effect)
+SCRATCH_GROUPS = {"end_to_end"}
+
+# Sizes of the heavier end-to-end fixtures (first N corpus signals)
+E2E_SIGNALS = 3
+E2E_DEPTH   = 4
+
+SUMMARIZER = "sshleifer/distilbart-cnn-12-6"
+EN_DE      = "Helsinki-NLP/opus-mt-en-de"
+DE_EN      = "Helsinki-NLP/opus-mt-de-en"
+
+BENCHMARKS = []
+
+def benchmark(group, name):
+    """
+    Register a benchmark. The decorated factory takes the corpus signals and
+    returns (run_one_pass, items_per_pass); setup cost stays in the factory.
+    """
+    def register(factory):
+        BENCHMARKS.append((group, f"{group}.{name}", factory))
+        return factory
+    return register
+
+def load_signals(path=CORPUS_PATH):
+    with open(path) as f:
+        return [entry["signal"] for entry in json.load(f)["canonical_signals"]]
+
+def _paper_harness():
+    if str(PAPER_HARNESS) not in sys.path:
+        sys.path.insert(0, str(PAPER_HARNESS))
+
+def _fixture_sets(signals):
+    """Fast-extractor commitment sets: stable, spaCy-free metric inputs."""
+    from .extraction import extract_hard_commitments_fast
+    return [extract_hard_commitments_fast(s) for s in signals]
+
+def _fixture_pairs(signals):
+    sets = _fixture_sets(signals)
+    return ([(a, b) for a, b in zip(sets, sets[1:] + sets[:1])]
+            + [(a, set(a)) for a in sets])
+
+# ── Extraction ────────────────────────────────────────────────────────────────
+
+@benchmark("extraction", "spacy")
+def _extraction_spacy(signals):
+    from .extraction import extract_hard_commitments, load_spacy_model
+    nlp = load_spacy_model()
+    return lambda: [extract_hard_commitments(s, nlp) for s in signals], len(signals)
+
+@benchmark("extraction", "spacy_batch")
+def _extraction_spacy_batch(signals):
+    from .extraction import extract_hard_commitments_batch, load_spacy_model
+    nlp = load_spacy_model()
+    return lambda: extract_hard_commitments_batch(signals, nlp), len(signals)
+
+@benchmark("extraction", "fast")
+def _extraction_fast(signals):
+    from .extraction import extract_hard_commitments
+    return lambda: [extract_hard_commitments(s, mode="fast") for s in signals], len(signals)
+
+@benchmark("extraction", "advanced")
+def _extraction_advanced(signals):
+    from .advanced_extractor import extract_hard
+    return lambda: [extract_hard(s) for s in signals], len(signals)
+
+@benchmark("extraction", "commitment_words")
+def _extraction_commitment_words(signals):
+    _paper_harness()
+    from run_convergence_v2 import extract_commitment_words
+    return lambda: [extract_commitment_words(s) for s in signals], len(signals)
+
+# ── Transforms ────────────────────────────────────────────────────────────────
+
+def _transform(task, model, kwargs, batched=False):
+    def factory(signals):
+        from .models import get_pipeline
+        pipe = get_pipeline(task, model)
+        if batched:
+            return lambda: pipe(signals, batch_size=8, **kwargs), len(signals)
+        return lambda: [pipe(s, **kwargs) for s in signals], len(signals)
+    return factory
+
+benchmark("transforms", "summarize_s40")(
+    _transform("summarization", SUMMARIZER, {"max_length": 40, "min_length": 5, "do_sample": False}))
+benchmark("transforms", "summarize_s40_batch")(
+    _transform("summarization", SUMMARIZER, {"max_length": 40, "min_length": 5, "do_sample": False},
+               batched=True))
+benchmark("transforms", "translate_en_de")(
+    _transform("translation", EN_DE, {"max_length": 400, "do_sample": False}))
+benchmark("transforms", "translate_de_en")(
+    _transform("translation", DE_EN, {"max_length": 400, "do_sample": False}))
+
+# ── Metrics ───────────────────────────────────────────────────────────────────
+
+def _pairwise(fn_name):
+    def factory(signals):
+        from . import metrics
+        fn, pairs = getattr(metrics, fn_name), _fixture_pairs(signals)
+        return lambda: [fn(a, b) for a, b in pairs], len(pairs)
+    return factory
+
+for _fn in ("jaccard", "jaccard_index", "hybrid_fidelity", "delta_hard"):
+    benchmark("metrics", _fn)(_pairwise(_fn))
+
+@benchmark("metrics", "jaccard_all_pairs_scalar")
+def _jaccard_all_pairs_scalar(signals):
+    from .metrics import jaccard
+    sets = _fixture_sets(signals)
+    return lambda: [[jaccard(a, b) for b in sets] for a in sets], len(sets) ** 2
+
+@benchmark("metrics", "jaccard_all_pairs_bitset")
+def _jaccard_all_pairs_bitset(signals):
+    _paper_harness()
+    from stability_engine import Vocab, jaccard_matrix
+    sets = _fixture_sets(signals)
+
+    def run():
+        bits = Vocab().pack(sets)
+        return jaccard_matrix(bits, bits)
+    return run, len(sets) ** 2
+
+# ── End to end ────────────────────────────────────────────────────────────────
+
+@benchmark("end_to_end", "compression_sweep")
+def _compression_sweep(signals):
+    from .test_harness import compression_sweep
+    sample = signals[:E2E_SIGNALS]
+    return lambda: [compression_sweep(s) for s in sample], len(sample)
+
+@benchmark("end_to_end", "recursion_test")
+def _recursion_test(signals):
+    from .test_harness import recursion_test
+    sample = signals[:E2E_SIGNALS]
+    return lambda: [recursion_test(s, depth=E2E_DEPTH) for s in sample], len(sample)
+
+# ── Running ───────────────────────────────────────────────────────────────────
+
+@contextmanager
+def _memory_only_caches():
+    """Detach the caches from their SQLite files for the duration."""
+    saved = [(c, c.path, c._db) for c in (EXTRACTION_CACHE, TRANSFORM_CACHE)]
+    for c, _, _ in saved:
+        c.path, c._db = None, None
+    try:
+        yield
+    finally:
+        for c, path, db in saved:
+            c.clear()
+            c.path, c._db = path, db
+
+@contextmanager
+def _scratch_cwd():
+    """Run from a temporary directory, removed (with whatever was written) afterwards."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="bench_") as tmp:
+        os.chdir(tmp)
+        try:
+            yield tmp
+        finally:
+            os.chdir(cwd)
+
+def _cold():
+    EXTRACTION_CACHE.clear()
+    TRANSFORM_CACHE.clear()
+
+def measure(run, items, repeats):
+    """Per-call latency stats (ms) over `repeats` cold passes, after a warm-up."""
+    _cold()
+    run()
+    passes = []
+    for _ in range(repeats):
+        _cold()
+        start = time.perf_counter()
+        run()
+        passes.append(time.perf_counter() - start)
+    per_call = [p / items * 1e3 for p in passes]
+    median_pass = statistics.median(passes)
+    return {
+        "items": items,
+        "repeats": repeats,
+        "median_ms": statistics.median(per_call),
+        "mean_ms": statistics.fmean(per_call),
+        "min_ms": min(per_call),
+        "stdev_ms": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+        "throughput_per_s": items / median_pass if median_pass else float("inf"),
+    }
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_suite(groups=None, quick=False, log=print):
+    """Run every registered benchmark (or those in `groups`); JSON-ready results."""
+    signals = load_signals()
+    results = {}
+    with _memory_only_caches():
+        for group, name, factory in BENCHMARKS:
+            if groups and group not in groups:
+                continue
+            repeats = max(1, REPEATS[group] // 5) if quick else REPEATS[group]
+            try:
+                with _scratch_cwd() if group in SCRATCH_GROUPS else nullcontext():
+                    run, items = factory(signals)
+                    res = dict(group=group, **measure(run, items, repeats))
+            except (ImportError, OSError) as e:
+                res = {"group": group, "skipped": f"{type(e).__name__}: {e}"}
+            results[name] = res
+            if log:
+                if "skipped" in res:
+                    log(f"  {name:42s} skipped ({res['skipped'][:60]})")
+                else:
+                    log(f"  {name:42s} {res['median_ms']:10.4f} ms/call  "
+                        f"{res['throughput_per_s']:12.1f}/s  (n={res['items']}×{res['repeats']})")
+    return {
+        "created": datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "corpus": {"path": str(CORPUS_PATH.relative_to(ROOT)), "n_signals": len(signals)},
+        "params": {"quick": quick, "repeats": REPEATS, "e2e_signals": E2E_SIGNALS,
+                   "e2e_depth": E2E_DEPTH},
+        "benchmarks": results,
+    }
+
+def compare(old, new, threshold=REGRESSION_THRESHOLD):
+    """
+    One row per benchmark name in either result: old/new median ms, the
+    new/old ratio and a status — "regression" (ratio > 1 + threshold),
+    "improved" (ratio < 1 - threshold), "ok", "new", "removed" or "skipped".
+    """
+    old_b, new_b = old["benchmarks"], new["benchmarks"]
+    rows = []
+    for name in list(old_b) + [n for n in new_b if n not in old_b]:
+        o, n = old_b.get(name), new_b.get(name)
+        row = {"name": name, "old_ms": None, "new_ms": None, "ratio": None}
+        if o is None:
+            row["status"] = "new"
+        elif n is None:
+            row["status"] = "removed"
+        elif "skipped" in o or "skipped" in n:
+            row["status"] = "skipped"
+        else:
+            row.update(old_ms=o["median_ms"], new_ms=n["median_ms"])
+            row["ratio"] = n["median_ms"] / o["median_ms"] if o["median_ms"] else float("inf")
+            row["status"] = ("regression" if row["ratio"] > 1 + threshold else
+                             "improved" if row["ratio"] < 1 - threshold else "ok")
+        rows.append(row)
+    return rows
@@ -0,0 +1,273 @@
+"""
+Content-addressed memoization for extraction and transform outputs.
+
+Sweeps and recursion tests extract the same strings many times (the base
+signal once per sigma, every paraphrase input again on the next step). The
+extraction cache keys each result by (extractor name, lexicon version,
+sha256(text)), keeps a bounded in-memory LRU and, optionally, a SQLite file
+so repeated runs over the canonical corpus reuse earlier extractions.
+
+The transform cache does the same for the deterministic summarizer and
+back-translation calls, persisted by default, so re-running a corpus only
+pays for new inputs and baseline/enforced passes share their summaries.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from .config import Config
+from .lexicon import LEXICON_VERSION
+from .timing import stage
+
+class _SQLiteLRU:
+    """Bounded in-memory LRU in front of an optional SQLite key/value table."""
+
+    table = None
+
+    def __init__(self, maxsize=4096, path=None):
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+    def _encode(self, value):
+        return json.dumps(value)
+
+    def _decode(self, raw):
+        return json.loads(raw)
+
+    def _conn(self):
+        if self._db is None and self.path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            # corpus worker processes share the file: wait out each other's writes
+            self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._db.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._db.commit()
+        return self._db
+
+    def get(self, key):
+        """Cached value for key, or None. Counts a hit or a miss."""
+        with self._lock:
+            value = self._lru.get(key)
+            if value is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return value
+            db = self._conn()
+            if db is not None:
+                row = db.execute(f"SELECT value FROM {self.table} WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    value = self._decode(row[0])
+                    self._remember(key, value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def contains(self, key):
+        """True if key is cached (memory or disk); does not touch the counters."""
+        with self._lock:
+            if key in self._lru:
+                return True
+            db = self._conn()
+            return db is not None and db.execute(
+                f"SELECT 1 FROM {self.table} WHERE key = ?", (key,)).fetchone() is not None
+
+    def put(self, key, value):
+        with self._lock:
+            self._remember(key, value)
+            db = self._conn()
+            if db is not None:
+                db.execute(f"INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)",
+                           (key, self._encode(value)))
+                db.commit()
+        return value
+
+    def _remember(self, key, value):
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._lru),
+        }
+
+    def clear(self, disk=False):
+        """Empty the in-memory LRU and reset counters (and the SQLite table if disk=True)."""
+        with self._lock:
+            self._lru.clear()
+            self.hits = self.misses = self.disk_hits = 0
+            db = self._conn()
+            if disk and db is not None:
+                db.execute(f"DELETE FROM {self.table}")
+                db.commit()
+
+class ExtractionCache(_SQLiteLRU):
+    table = "extractions"
+
+    def _encode(self, value):
+        return json.dumps(sorted(value))
+
+    def _decode(self, raw):
+        return frozenset(json.loads(raw))
+
+    @staticmethod
+    def key(extractor, text, version=LEXICON_VERSION):
+        digest = hashlib.sha256(text.encode("utf8")).hexdigest()
+        return f"{extractor}:{version}:{digest}"
+
+    def put(self, key, value):
+        return super().put(key, frozenset(value))
+
+    def lookup(self, extractor, text, compute):
+        """Return compute(text) through the cache, as a fresh set."""
+        key = self.key(extractor, text)
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, compute(text))
+        return set(value)
+
+    def memoize(self, extractor):
+        """
+        Decorator for single-argument extractors fn(text) -> set. `extractor`
+        is the cache name, or a zero-argument callable returning it on each
+        call (for names that depend on the loaded model or the date).
+        """
+        name = extractor if callable(extractor) else lambda: extractor
+
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(text):
+                return self.lookup(name(), text, fn)
+            wrapper.uncached = fn
+            return wrapper
+        return decorator
+
+class TransformCache(_SQLiteLRU):
+    """
+    Output text of deterministic Hugging Face pipeline calls, keyed by model
+    id, input text and generation kwargs (do_sample=False makes these pure).
+    """
+
+    table = "transforms"
+
+    @staticmethod
+    def key(model_id, text, gen_kwargs):
+        payload = json.dumps({"model": model_id, "text": text, "kwargs": gen_kwargs},
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf8")).hexdigest()
+
+# Pipeline call kwargs that do not change the generated text
+_NON_GENERATION_KWARGS = ("batch_size",)
+
+# CachedPipeline construction kwargs that do not change the generated text
+_NON_OUTPUT_PIPELINE_KWARGS = ("device",)
+
+_OUTPUT_KEYS = {"summarization": "summary_text", "text2text-generation": "generated_text"}
+
+class CachedPipeline:
+    """
+    Drop-in stand-in for a transformers pipeline whose calls go through a
+    TransformCache. The underlying pipeline is built lazily (src.models) on
+    the first cache miss, so a fully cached run never loads the model.
+
+    Accepts a single string or a list of strings, like the pipeline itself;
+    for a list only the uncached texts are sent to the model, in one call.
+
+    `backend` (default: Config.TRANSFORM_BACKEND) selects fp32, int8 or ONNX
+    inference; non-fp32 outputs are cached under their own model id.
+    """
+
+    def __init__(self, task, model, cache=None, backend=None, **pipeline_kwargs):
+        self.task = task
+        self.model = model
+        self.output_key = _OUTPUT_KEYS.get(task, "translation_text")
+        self.pipeline_kwargs = pipeline_kwargs
+        self._cache = cache
+        self._backend = backend
+
+    @property
+    def backend(self):
+        from .models import transform_backend
+        return self._backend or transform_backend()
+
+    @property
+    def cache_id(self):
+        backend = self.backend
+        return f"{self.task}:{self.model}" + ("" if backend == "torch" else f"@{backend}")
+
+    @property
+    def cache(self):
+        return self._cache if self._cache is not None else TRANSFORM_CACHE
+
+    @property
+    def pipeline(self):
+        from .models import get_pipeline
+        return get_pipeline(self.task, self.model, backend=self.backend, **self.pipeline_kwargs)
+
+    def _key(self, text, kwargs):
+        gen_kwargs = {k: v for k, v in kwargs.items() if k not in _NON_GENERATION_KWARGS}
+        # construction kwargs (tokenizer, framework, ...) can change the
+        # output too; device placement cannot
+        build_kwargs = {k: v for k, v in self.pipeline_kwargs.items() if k not in _NON_OUTPUT_PIPELINE_KWARGS}
+        if build_kwargs:
+            gen_kwargs = dict(gen_kwargs, pipeline=build_kwargs)
+        return self.cache.key(self.cache_id, text, gen_kwargs)
+
+    def is_cached(self, text, **kwargs):
+        """Whether self(text, **kwargs) would be served from the cache."""
+        return self.cache.contains(self._key(text, kwargs))
+
+    def prime(self, text, output, **kwargs):
+        """Record `output` as the result of self(text, **kwargs)."""
+        self.cache.put(self._key(text, kwargs), output)
+
+    def __call__(self, inputs, **kwargs):
+        with stage(f"transform.{self.task}"):
+            texts = [inputs] if isinstance(inputs, str) else list(inputs)
+            keys = [self._key(t, kwargs) for t in texts]
+            outputs = [self.cache.get(k) for k in keys]
+            todo = [i for i, out in enumerate(outputs) if out is None]
+            if todo:
+                batch = [texts[i] for i in todo]
+                with stage(f"model.{self.task}"):
+                    results = self.pipeline(batch if len(batch) > 1 else batch[0], **kwargs)
+                if isinstance(results, dict):
+                    results = [results]
+                for i, res in zip(todo, results):
+                    if isinstance(res, list):
+                        res = res[0]
+                    outputs[i] = self.cache.put(keys[i], res[self.output_key])
+
+            return [{self.output_key: out} for out in outputs]
+
+# Process-wide cache shared by every extractor
+EXTRACTION_CACHE = ExtractionCache(
+    maxsize=Config.EXTRACTION_CACHE_SIZE,
+    path=os.environ.get("COMMITMENT_EXTRACTION_CACHE") or Config.EXTRACTION_CACHE_PATH,
+)
+
+# Process-wide cache shared by every transform pipeline; "" disables the file
+TRANSFORM_CACHE = TransformCache(
+    maxsize=Config.TRANSFORM_CACHE_SIZE,
+    path=os.environ.get("COMMITMENT_TRANSFORM_CACHE", Config.TRANSFORM_CACHE_PATH) or None,
+)
@@ -2,10 +2,63 @@
 
 # Configuration settings for the commitment test harness project
 
+import os
+
+# operational-harness/, so default output paths do not depend on the cwd
+HARNESS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 class Config:
     # Model paths
     HUGGINGFACE_MODEL_PATH = "facebook/bart-large-cnn"  # Example model for summarization
     SPACY_MODEL = "en_core_web_sm"  # spaCy model for extraction
+    EXTRACTOR_MODE = "spacy"  # "spacy" (parser sentences) or "fast" (regex sentences, no spaCy)
+
+    # Extraction cache (src/cache.py): in-memory LRU size and optional SQLite
+    # file; COMMITMENT_EXTRACTION_CACHE overrides the path
+    EXTRACTION_CACHE_SIZE = 4096
+    EXTRACTION_CACHE_PATH = None
+
+    # Transform cache (src/cache.py): summarizer/translator outputs, persisted
+    # so reruns only pay for new inputs; COMMITMENT_TRANSFORM_CACHE overrides
+    # the path ("" keeps it in memory only)
+    TRANSFORM_CACHE_SIZE = 16384
+    TRANSFORM_CACHE_PATH = os.path.join(HARNESS_DIR, "outputs", "transform_cache.sqlite")
+
+    # Compression sweep: encode each signal once and decode every sigma from
+    # the cached encoder states (src/sweep.py); check_encoder_reuse.py
+    # compares it with plain pipeline calls on the corpus
+    SWEEP_REUSE_ENCODER = False
+
+    # Batched prefetch of sweep summaries before corpus runs (off by default:
+    # padded batch generation can differ from one-at-a-time calls, and the
+    # prefetched text is what the sweeps then read from the transform
+    # cache); COMMITMENT_PREFETCH_BATCHED=1 overrides
+    PREFETCH_BATCHED = False
+
+    # Corpus runs (src/corpus_runner.py): worker processes (1 = sequential
+    # in-process, 0 = one per CPU; COMMITMENT_CORPUS_WORKERS overrides) and
+    # torch intra-op threads per worker. Every worker loads its own
+    # summarizer and translators, so more than one worker needs that much
+    # memory per process unless MODEL_SERVER is set
+    CORPUS_WORKERS = 1
+    CORPUS_THREADS_PER_WORKER = 1
+
+    # Shared model server (src/model_server.py): Unix socket path; when set,
+    # transform pipelines run there instead of in-process.
+    # COMMITMENT_MODEL_SERVER overrides
+    MODEL_SERVER = None
+
+    # Transform inference backend (src/models.py): "torch" (fp32), or the
+    # experimental "int8" (dynamically quantized Linear layers) and "onnx"
+    # (ONNX Runtime export, needs optimum[onnxruntime]), whose outputs have
+    # not yet been checked against fp32 — run check_backend_fidelity.py on
+    # the corpus before using either for results;
+    # COMMITMENT_TRANSFORM_BACKEND overrides
+    TRANSFORM_BACKEND = "torch"
+
+    # Per-stage timing (src/timing.py): off by default; COMMITMENT_TIMING=1
+    # or `analyze.py run --timing` turns it on
+    TIMING = False
 
     # Extraction parameters
     EXTRACTION_PARAMS = {
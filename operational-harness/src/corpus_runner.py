@@ -0,0 +1,112 @@
+"""
+Process-pool runner for corpus experiments.
+
+A corpus run is a grid of independent jobs, one per (signal, mode, test):
+recursion_test and compression_sweep, baseline and enforced, for every
+signal. run_corpus() spreads those jobs over a pool of worker processes and
+hands the results back keyed by job, so callers assemble their output in
+corpus order exactly as the sequential loop did.
+
+Workers are started with "spawn" (torch is not fork-safe once the parent has
+run a model) and keep running for the whole corpus: each one builds its
+spaCy and Hugging Face pipelines once, on first use, through src.models, and
+reuses them for every job it picks up. Every worker pins torch to
+Config.CORPUS_THREADS_PER_WORKER intra-op threads, so N workers use N cores
+instead of fighting over all of them. Outputs land in the shared transform
+cache, so baseline/enforced jobs and reruns still reuse each other's
+summaries. While timing is on (src/timing.py), each job is timed on its own
+in whichever process ran it and its stage stats and folded stacks are added
+to the caller's TIMER, so breakdown() and fold() cover the whole corpus.
+
+The default is one worker (Config.CORPUS_WORKERS = 1): each worker holds its
+own BART summarizer and Marian translators, so N workers need N copies in
+memory. To run more, start the model server once and point the workers at
+it — they then load no transform models and send their transforms there:
+
+  python -m src.model_server --socket /tmp/commitment-models.sock &
+  COMMITMENT_MODEL_SERVER=/tmp/commitment-models.sock \
+  COMMITMENT_CORPUS_WORKERS=4 python compare_enforcement.py
+"""
+
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .config import Config
+from .timing import TIMER
+
+TESTS = ("recursion", "compression")
+MODES = (False, True)  # enforce
+
+def corpus_jobs(signals, depth):
+    """
+    (signal index, signal, enforce, test, depth) for every job of a corpus
+    run. Recursion jobs come first: they are the longest, and starting them
+    early keeps the pool busy to the end.
+    """
+    return [(idx, signal, enforce, test, depth)
+            for test in TESTS
+            for idx, signal in enumerate(signals)
+            for enforce in MODES]
+
+def run_job(job):
+    """
+    (result, timing) for one job: deltas (recursion) or per-sigma fidelities
+    (compression), and what TIMER.isolated() recorded ({} while timing is off).
+    """
+    _, signal, enforce, test, depth = job
+    from .test_harness import compression_sweep, recursion_test
+    with TIMER.isolated() as timing:
+        if test == "recursion":
+            result = recursion_test(signal, depth=depth, enforce=enforce)
+        else:
+            result = compression_sweep(signal, enforce=enforce)[1]
+    return result, timing
+
+def _init_worker(threads, timing=False):
+    os.environ["MPLBACKEND"] = "Agg"
+    if timing:
+        TIMER.enable()
+    if threads:
+        try:
+            import torch
+        except ImportError:
+            return
+        torch.set_num_threads(threads)
+
+def default_workers():
+    env = os.environ.get("COMMITMENT_CORPUS_WORKERS")
+    workers = int(env) if env else Config.CORPUS_WORKERS
+    return workers or os.cpu_count() or 1
+
+def run_jobs(jobs, fn=run_job, workers=None, threads=None, log=None):
+    """
+    Results of fn(job) for every job, in job order. workers=1 runs in this
+    process; otherwise jobs go to a spawn pool of `workers` processes.
+    """
+    workers = min(workers or default_workers(), len(jobs)) or 1
+    threads = Config.CORPUS_THREADS_PER_WORKER if threads is None else threads
+    if workers == 1:
+        return [fn(job) for job in jobs]
+    results = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn"),
+                             initializer=_init_worker, initargs=(threads, TIMER.enabled)) as pool:
+        futures = {pool.submit(fn, job): k for k, job in enumerate(jobs)}
+        for done, future in enumerate(as_completed(futures), 1):
+            results[futures[future]] = future.result()
+            if log:
+                log(f"  [{done}/{len(jobs)}] jobs done")
+    return results
+
+def run_corpus(signals, depth, workers=None, log=None):
+    """
+    {(signal index, enforce, test): result} for the full corpus grid, where
+    result is what recursion_test / compression_sweep's fidelities return.
+    Job timings are added to TIMER.
+    """
+    jobs = corpus_jobs(signals, depth)
+    results = run_jobs(jobs, workers=workers, log=log)
+    for _, timing in results:
+        TIMER.add(timing)
+    return {(idx, enforce, test): res
+            for (idx, _, enforce, test, _), (res, _) in zip(jobs, results)}
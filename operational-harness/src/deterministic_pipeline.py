@@ -1,17 +1,20 @@
 # ...new file...
 import os
-from transformers import pipeline
+from .cache import CachedPipeline
 from .extraction import extract_hard
 from .metrics import fid_hard, delta_hard
 from .plotting import plot_fid, plot_delta
+from .timing import timed
 from . import config
 
-# initialize deterministic pipelines (no sampling)
-SUMMARIZER = pipeline("summarization", model="facebook/bart-large-cnn", framework="pt", device=-1)
+# initialize deterministic pipelines (no sampling); built lazily and memoized
+# through the transform cache
+SUMMARIZER = CachedPipeline("summarization", "facebook/bart-large-cnn", framework="pt", device=-1)
 # back-translation paraphrase via Marian (en->de and de->en)
-EN_DE = pipeline("translation", model="Helsinki-NLP/opus-mt-en-de", tokenizer="Helsinki-NLP/opus-mt-en-de", framework="pt")
-DE_EN = pipeline("translation", model="Helsinki-NLP/opus-mt-de-en", tokenizer="Helsinki-NLP/opus-mt-de-en", framework="pt")
+EN_DE = CachedPipeline("translation", "Helsinki-NLP/opus-mt-en-de", tokenizer="Helsinki-NLP/opus-mt-en-de", framework="pt")
+DE_EN = CachedPipeline("translation", "Helsinki-NLP/opus-mt-de-en", tokenizer="Helsinki-NLP/opus-mt-de-en", framework="pt")
 
+@timed("transform_sieve")
 def transform_sieve(text, sigma):
     # Summarization (compression)
     summ = SUMMARIZER(text, max_length=sigma, min_length=max(5, sigma//4), do_sample=False)[0]['summary_text']
@@ -22,7 +25,13 @@ def transform_sieve(text, sigma):
     abstract = summ.split(".")[0].strip()
     return [summ, para, abstract]
 
-def compression_sweep(signal_text):
+@timed("compression_sweep")
+def compression_sweep(signal_text, reuse_encoder=None):
+    if config.Config.SWEEP_REUSE_ENCODER if reuse_encoder is None else reuse_encoder:
+        # encode once, decode every sigma (src/sweep.py)
+        from .sweep import prefetch_encoder_sweep
+        prefetch_encoder_sweep(SUMMARIZER, signal_text, config.SIGMA_GRID,
+                               min_length=lambda s: max(5, s//4))
     base = extract_hard(signal_text)
     sig_label = signal_text[:40].replace("\n"," ")
     sigma_vals = []
@@ -41,6 +50,32 @@ def compression_sweep(signal_text):
     plot_fid(sig_label, sigma_vals, fid_vals, outpath=f"fid_{hash(sig_label)}.png")
     return sigma_vals, fid_vals
 
+def prefetch_sieve(signals, sigma_grid=config.SIGMA_GRID, batch_size=8):
+    """
+    Warm the transform cache with every transform_sieve call the sweeps will
+    make: per sigma, all signals are summarized as one padded batch, then the
+    summaries are back-translated as batches. compression_sweep afterwards
+    reads these outputs back; padded batch generation may not reproduce the
+    one-at-a-time outputs, so results can differ from an unprefetched run.
+    """
+    signals = list(dict.fromkeys(signals))
+    for s in sigma_grid:
+        summs = [o['summary_text'] for o in
+                 SUMMARIZER(signals, max_length=s, min_length=max(5, s//4), do_sample=False,
+                            batch_size=batch_size)]
+        de = [o['translation_text'] for o in
+              EN_DE(summs, max_length=400, do_sample=False, batch_size=batch_size)]
+        DE_EN(de, max_length=400, do_sample=False, batch_size=batch_size)
+
+def compression_sweep_batch(signals, batch_size=8):
+    """
+    compression_sweep over many signals with batched transforms (outputs may
+    differ from per-signal compression_sweep; see prefetch_sieve).
+    """
+    prefetch_sieve(signals, batch_size=batch_size)
+    return [compression_sweep(s) for s in signals]
+
+@timed("recursion_test")
 def recursion_test(signal_text, depth=config.RECURSION_DEPTH, enforced=False):
     base = extract_hard(signal_text)
     cur = signal_text
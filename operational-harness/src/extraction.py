@@ -1,48 +1,136 @@
-from spacy import load
 import re
+from .cache import EXTRACTION_CACHE
+from .config import Config
+from .lexicon import MODAL_MATCHER
+from .models import get_spacy_model, spacy_model_id
+from .timing import stage, timed
 
-def load_spacy_model(model_name='en_core_web_sm'):
-    nlp = load(model_name)
-    return nlp
+# Pipeline components that doc.sents does not depend on. Sentence boundaries
+# in en_core_web_sm come from the dependency parser (tok2vec + parser), so
+# dropping these leaves the segmentation — and therefore the extraction —
+# unchanged while skipping most of the per-token work.
+SENTENCE_DISABLE = ("tagger", "attribute_ruler", "lemmatizer", "ner")
+
+# Fast path: regex sentence segmentation; modal cues come from the shared
+# word-boundary matcher in src.lexicon, same as the spaCy path.
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Expanded modal keywords (hard first, then soft)
+SIEVE_TAGS = ("hard", "soft")
+
+EXTRACTOR_MODES = ("spacy", "fast")
+
+def load_spacy_model(model_name=None):
+    """Shared, lazily loaded spaCy pipeline (see src.models)."""
+    return get_spacy_model(model_name)
 
 def normalize_text(text):
     """Normalize text for comparison: lowercase, strip punctuation."""
     return re.sub(r'[^\w\s]', '', text.lower().strip())
 
-def extract_hard_commitments(text, nlp=None):
-    """Extract commitments using expanded modal keyword detection."""
-    if nlp is None:
-        nlp = load_spacy_model()
-    
-    doc = nlp(text)
+def _commitments_from_doc(doc):
+    """Sentence-level modal sieve over an already parsed Doc."""
     commitments = set()
-    
-    # Expanded modal keywords
-    hard_modals = {'must', 'shall', 'will', 'have', 'need', 'required', 'ought', 'cannot', 'should'}
-    soft_modals = {'might', 'could', 'may', 'perhaps', 'maybe', 'tend'}
-    
-    # Extract by sentence-level modal presence
+
+    # Extract by sentence-level modal presence (hard or soft cue)
     for sent in doc.sents:
-        sent_lower = sent.text.lower()
-        # Check for hard modals
-        if any(modal in sent_lower for modal in hard_modals):
+        if MODAL_MATCHER.search(sent.text, SIEVE_TAGS):
             commitments.add(sent.text.strip())
-        # Check for soft modals
-        elif any(modal in sent_lower for modal in soft_modals):
-            commitments.add(sent.text.strip())
-    
+
     return commitments
 
-def extract_from_texts(texts, model_name='en_core_web_sm'):
-    nlp = load_spacy_model(model_name)
+def extract_hard_commitments_fast(text):
+    """
+    Regex-only extractor: same modal sieve, no spaCy.
+
+    Sentences are split after . ! ? followed by whitespace. This differs
+    from the parser only on abbreviations and unpunctuated run-ons; see
+    compare_extractors.py for speed and agreement on the canonical corpus.
+    """
+    commitments = set()
+    for sent in SENTENCE_SPLIT_RE.split(text.strip()):
+        if MODAL_MATCHER.search(sent, SIEVE_TAGS):
+            commitments.add(sent.strip())
+    return commitments
+
+def _check_mode(mode):
+    mode = mode or Config.EXTRACTOR_MODE
+    if mode not in EXTRACTOR_MODES:
+        raise ValueError(f"Unknown extractor mode {mode!r}; expected one of {EXTRACTOR_MODES}")
+    return mode
+
+def _cache_name(mode, nlp):
+    """Extractor name for the cache key: mode plus the spaCy model behind it."""
+    if mode == "fast":
+        return "extraction.fast"
+    return f"extraction.spacy:{spacy_model_id(nlp)}"
+
+def extract_hard_commitments(text, nlp=None, mode=None):
+    """
+    Extract commitments using expanded modal keyword detection.
+
+    mode="spacy" (default, Config.EXTRACTOR_MODE) segments with the spaCy
+    parser; mode="fast" uses extract_hard_commitments_fast and ignores nlp.
+    Results are memoized in src.cache.EXTRACTION_CACHE.
+    """
+    mode = _check_mode(mode)
+    with stage(f"extract.{mode}"):
+        if mode == "fast":
+            return EXTRACTION_CACHE.lookup(_cache_name(mode, nlp), text, extract_hard_commitments_fast)
+
+        # resolve the model first: its meta names the cache entry either way
+        nlp = nlp if nlp is not None else load_spacy_model()
+
+        def compute(t):
+            with stage("spacy.parse"):
+                return _commitments_from_doc(nlp(t))
+
+        return EXTRACTION_CACHE.lookup(_cache_name(mode, nlp), text, compute)
+
+@timed("extract.spacy_batch")
+def extract_hard_commitments_batch(texts, nlp=None, batch_size=256, n_process=1, mode=None):
+    """
+    Batch form of extract_hard_commitments built on nlp.pipe.
+
+    One model is loaded (or the given one reused) for the whole batch and
+    components that sentence splitting does not need are disabled. With
+    n_process > 1 spaCy fans the texts out to worker processes. Results are
+    returned as a list of sets in input order and equal
+    [extract_hard_commitments(t, nlp) for t in texts].
+    """
+    mode = _check_mode(mode)
+    if mode == "fast":
+        return [extract_hard_commitments(t, mode=mode) for t in texts]
+    if nlp is None:
+        nlp = load_spacy_model()
+    name = _cache_name(mode, nlp)
+
+    # Only texts the cache has not seen go through the parser
+    texts = list(texts)
+    keys = [EXTRACTION_CACHE.key(name, t) for t in texts]
+    results = [EXTRACTION_CACHE.get(k) for k in keys]
+    todo = [i for i, r in enumerate(results) if r is None]
+    if todo:
+        disable = [c for c in SENTENCE_DISABLE if c in nlp.pipe_names]
+        docs = nlp.pipe((texts[i] for i in todo), batch_size=batch_size,
+                        n_process=n_process, disable=disable)
+        with stage("spacy.parse"):
+            for i, doc in zip(todo, docs):
+                results[i] = EXTRACTION_CACHE.put(keys[i], _commitments_from_doc(doc))
+    return [set(r) for r in results]
+
+def extract_from_texts(texts, model_name='en_core_web_sm', batch_size=256, n_process=1, mode=None):
+    nlp = load_spacy_model(model_name) if _check_mode(mode) == "spacy" else None
+    texts = list(texts)
+    batches = extract_hard_commitments_batch(texts, nlp, batch_size=batch_size,
+                                             n_process=n_process, mode=mode)
+
     all_commitments = {}
-    
-    for text in texts:
-        commitments = extract_hard_commitments(text, nlp)
+    for text, commitments in zip(texts, batches):
         all_commitments[text] = commitments
-    
+
     return all_commitments
 
-def extract_hard(text: str, nlp=None) -> set:
+def extract_hard(text: str, nlp=None, mode=None) -> set:
     """Shorthand for extract_hard_commitments."""
-    return extract_hard_commitments(text, nlp)
\ No newline at end of file
+    return extract_hard_commitments(text, nlp, mode=mode)
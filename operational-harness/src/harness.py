@@ -7,14 +7,18 @@ It implements the experimental harness described in the accompanying paper.
 This code is not intended for production deployment.
 """
 
-from transformers import pipeline
-import spacy
+from .cache import CachedPipeline
 from .metrics import jaccard_index
+from .models import get_spacy_model
 import matplotlib.pyplot as plt
 
+# transformers' default summarization checkpoint, built once (or served by
+# the model server) rather than on every run_tests call
+SUMMARIZER = CachedPipeline("summarization", "sshleifer/distilbart-cnn-12-6")
+
 def run_tests(signal, compression_thresholds):
-    summarizer = pipeline("summarization")
-    nlp = spacy.load("en_core_web_sm")
+    summarizer = SUMMARIZER
+    nlp = get_spacy_model()
 
     original_commitments = extract_hard_commitments(signal, nlp)
     fidelity_results = []
@@ -0,0 +1,126 @@
+"""
+Modal lexicons and the shared cue matcher.
+
+Every extractor in the harness used to scan each sentence once per keyword
+with `modal in sentence.lower()`. That is substring matching ("have" fires on
+"behave", "will" on "willing") and its cost grows with the lexicon. Here all
+lexicons are compiled into one Aho-Corasick automaton whose alphabet is word
+tokens, so matches always sit on word boundaries, multi-word cues ("must not",
+"is defined as") are ordinary paths in the trie, and one left-to-right pass
+over the tokens reports every cue with its character span.
+"""
+
+import re
+from collections import deque, namedtuple
+
+# Hard/soft sieve used by src.extraction
+HARD_MODALS = frozenset({'must', 'shall', 'will', 'have', 'need', 'required', 'ought', 'cannot', 'should'})
+SOFT_MODALS = frozenset({'might', 'could', 'may', 'perhaps', 'maybe', 'tend'})
+
+# Clause sieve used by src.test_harness
+CORE_MODALS = ("must", "shall", "cannot", "required")
+
+# Cue -> modality map used by src.advanced_extractor. Order matters: when
+# several cues occur in a sentence, cue_lookup reports the earliest entry.
+MODAL_LEX = {
+    "must": "OBLIGATION", "shall": "OBLIGATION", "required": "OBLIGATION",
+    "must not": "PROHIBITION", "shall not": "PROHIBITION", "cannot": "PROHIBITION",
+    "may": "PERMISSION", "is defined as": "DEFINITION", "means": "DEFINITION"
+}
+
+# Bumped whenever a lexicon above changes, so anything keyed on extractor
+# output (e.g. caches) can tell old results from new ones.
+LEXICON_VERSION = "1"
+
+# Word tokens, plus single punctuation marks so that "must, not" or
+# "must-not" never bridge a multi-word cue.
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+CueMatch = namedtuple("CueMatch", "cue start end tags")
+
+class CueMatcher:
+    """
+    Aho-Corasick automaton over word tokens.
+
+    `lexicon` maps each cue (one or more words) to an iterable of tag names;
+    a cue listed under several tags carries all of them. Matching is
+    case-insensitive and returns CueMatch(cue, start, end, tags) with
+    character offsets into the original text.
+    """
+
+    def __init__(self, lexicon):
+        self._goto = [{}]
+        self._out = [()]
+        self.tags = {}
+        for cue, tags in lexicon.items():
+            words = tuple(cue.lower().split())
+            key = " ".join(words)
+            self.tags[key] = self.tags.get(key, frozenset()) | frozenset(tags)
+            state = 0
+            for w in words:
+                nxt = self._goto[state].get(w)
+                if nxt is None:
+                    self._goto.append({})
+                    self._out.append(())
+                    nxt = len(self._goto) - 1
+                    self._goto[state][w] = nxt
+                state = nxt
+            self._out[state] = ((key, len(words)),)
+        self.max_words = max((n for out in self._out for _, n in out), default=0)
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for w, child in self._goto[state].items():
+                queue.append(child)
+                f = self._fail[state]
+                while f and w not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(w, 0)
+                self._fail[child] = target if target != child else 0
+                # longest cue first, then the shorter cues it ends with
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def finditer(self, text, tags=None):
+        """
+        Yield every cue occurrence in one pass, ordered by end position
+        (longer cues first when several end on the same token). With `tags`,
+        only cues carrying at least one of those tags are reported.
+        """
+        wanted = frozenset(tags) if tags is not None else None
+        goto, fail, out = self._goto, self._fail, self._out
+        starts = deque(maxlen=self.max_words or 1)
+        state = 0
+        for m in _TOKEN_RE.finditer(text):
+            w = m.group().lower()
+            while state and w not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(w, 0)
+            starts.append(m.start())
+            for key, n in out[state]:
+                cue_tags = self.tags[key]
+                if wanted is None or cue_tags & wanted:
+                    yield CueMatch(key, starts[-n], m.end(), cue_tags)
+
+    def find_all(self, text, tags=None):
+        """All matches as a list (see finditer)."""
+        return list(self.finditer(text, tags))
+
+    def search(self, text, tags=None):
+        """First match, or None. Stops scanning as soon as one is found."""
+        return next(self.finditer(text, tags), None)
+
+def _build_modal_lexicon():
+    lexicon = {}
+    groups = (("hard", HARD_MODALS), ("soft", SOFT_MODALS),
+              ("core", CORE_MODALS), ("modal_lex", MODAL_LEX))
+    for tag, cues in groups:
+        for cue in cues:
+            lexicon.setdefault(cue, set()).add(tag)
+    return lexicon
+
+# Shared by src.extraction, src.advanced_extractor and src.test_harness
+MODAL_MATCHER = CueMatcher(_build_modal_lexicon())
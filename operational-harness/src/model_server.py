@@ -0,0 +1,281 @@
+"""
+Shared model server for the transform pipelines.
+
+One process owns the summarization and translation models; every harness
+script, corpus worker and pytest process that points at it (Config.MODEL_SERVER
+or COMMITMENT_MODEL_SERVER, a Unix socket path) gets a RemotePipeline from
+src.models.get_pipeline instead of loading its own copy of BART and Marian.
+Memory is paid once, however many experiments run.
+
+Requests are length-prefixed JSON over the socket. All model work happens on
+one batcher thread, and by default every request is its own pipeline call
+with exactly the texts and kwargs the client passed, so outputs are the ones
+the client would get in-process.
+
+With --merge-clients the batcher instead waits BATCH_WINDOW seconds for
+concurrent requests, merges those with the same (task, model, pipeline
+kwargs, generation kwargs) into one padded pipeline call, and hands each
+client its slice of the outputs. That trades fidelity for throughput:
+padded batched beam search is not guaranteed to reproduce the unbatched
+summary or translation, so a client's output can depend on which unrelated
+requests it happened to share a batch with.
+
+Run:
+  python -m src.model_server --socket /tmp/commitment-models.sock
+  python -m src.model_server --socket /tmp/commitment-models.sock --merge-clients
+  COMMITMENT_MODEL_SERVER=/tmp/commitment-models.sock python compare_enforcement.py
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+
+BATCH_WINDOW = 0.01   # seconds to wait for concurrent requests to join a batch
+MAX_BATCH    = 16     # pipeline batch_size for merged requests
+
+# Pipeline call kwargs that do not change the generated text
+_NON_GENERATION_KWARGS = ("batch_size",)
+
+# ── Wire format ───────────────────────────────────────────────────────────────
+
+def _recv_exact(sock, n):
+    buf = b""
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            if buf:
+                raise ConnectionError("model server connection closed mid-message")
+            return None
+        buf += chunk
+    return buf
+
+def send_msg(sock, obj):
+    data = json.dumps(obj).encode("utf8")
+    sock.sendall(struct.pack(">I", len(data)) + data)
+
+def recv_msg(sock):
+    """Next message on the socket, or None once the peer has closed it."""
+    header = _recv_exact(sock, 4)
+    if header is None:
+        return None
+    return json.loads(_recv_exact(sock, struct.unpack(">I", header)[0]))
+
+# ── Server ────────────────────────────────────────────────────────────────────
+
+class _Request:
+    def __init__(self, key, args=None, run=None):
+        self.key = key
+        self.args = args
+        self.run = run
+        self.size = len(args[3]) if args else 1
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+class Batcher:
+    """
+    Queues pipeline requests and runs them on one thread, each as its own
+    call. With merge=True, requests from different clients that share a key
+    are merged into a single batched call (outputs may then differ from
+    unbatched calls; see the module docstring). `load(task, model, **kw)`
+    returns a local pipeline (src.models.get_local_pipeline by default).
+    """
+
+    def __init__(self, load=None, window=BATCH_WINDOW, max_batch=MAX_BATCH, merge=False):
+        if load is None:
+            from .models import get_local_pipeline as load
+        self.load = load
+        self.window = window if merge else 0.0
+        self.max_batch = max_batch
+        self.merge = merge
+        self.calls = 0
+        self.requests = 0
+        self._pending = []
+        self._cond = threading.Condition()
+        threading.Thread(target=self._loop, name="model-batcher", daemon=True).start()
+
+    def _submit(self, req):
+        with self._cond:
+            self._pending.append(req)
+            self._cond.notify()
+        req.done.wait()
+        if req.error:
+            raise RuntimeError(req.error)
+        return req.result
+
+    def generate(self, task, model, pipeline_kwargs, texts, kwargs):
+        """Output dicts for `texts`, as the pipeline would return them."""
+        gen_kwargs = {k: v for k, v in kwargs.items() if k not in _NON_GENERATION_KWARGS}
+        key = json.dumps([task, model, pipeline_kwargs, gen_kwargs], sort_keys=True, default=str)
+        return self._submit(_Request(key, args=(task, model, pipeline_kwargs, texts, kwargs)))
+
+    def sweep(self, model, pipeline_kwargs, text, min_lengths):
+        """{sigma: summary} from one encoder pass (src.sweep), on the batcher thread."""
+        def run():
+            from .sweep import summarize_across_sigmas
+            pipe = self.load("summarization", model, **pipeline_kwargs)
+            sigmas = [int(s) for s in min_lengths]
+            return summarize_across_sigmas(pipe, text, sigmas, lambda s: min_lengths[str(s)])
+        return self._submit(_Request(None, run=run))
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+            if self.window:
+                time.sleep(self.window)
+            with self._cond:
+                batch, self._pending = self._pending, []
+            groups = {}
+            for req in batch:
+                key = req.key if self.merge and req.key else id(req)
+                groups.setdefault(key, []).append(req)
+            for reqs in groups.values():
+                self._run(reqs)
+
+    def _run(self, reqs):
+        try:
+            if reqs[0].run is not None:
+                reqs[0].result = reqs[0].run()
+            else:
+                task, model, pipeline_kwargs, texts, kwargs = reqs[0].args
+                if len(reqs) > 1:
+                    # merged clients: one padded call at the server's batch size
+                    texts = [t for r in reqs for t in r.args[3]]
+                    kwargs = {k: v for k, v in kwargs.items() if k not in _NON_GENERATION_KWARGS}
+                    kwargs["batch_size"] = self.max_batch
+                pipe = self.load(task, model, **pipeline_kwargs)
+                outputs = pipe(texts if len(texts) > 1 else texts[0], **kwargs)
+                if isinstance(outputs, dict):
+                    outputs = [outputs]
+                outputs = [o[0] if isinstance(o, list) else o for o in outputs]
+                k = 0
+                for r in reqs:
+                    r.result = outputs[k:k + r.size]
+                    k += r.size
+        except Exception as e:
+            for r in reqs:
+                r.error = f"{type(e).__name__}: {e}"
+        finally:
+            self.calls += 1
+            self.requests += len(reqs)
+            for r in reqs:
+                r.done.set()
+
+    def stats(self):
+        return {"requests": self.requests, "model_calls": self.calls}
+
+class _Handler(socketserver.BaseRequestHandler):
+    def handle(self):
+        batcher = self.server.batcher
+        while True:
+            msg = recv_msg(self.request)
+            if msg is None:
+                return
+            try:
+                op = msg.get("op")
+                if op == "generate":
+                    reply = {"outputs": batcher.generate(msg["task"], msg["model"], msg["pipeline_kwargs"],
+                                                         msg["texts"], msg["kwargs"])}
+                elif op == "sweep":
+                    summaries = batcher.sweep(msg["model"], msg["pipeline_kwargs"],
+                                              msg["text"], msg["min_lengths"])
+                    reply = {"summaries": {str(s): v for s, v in summaries.items()}}
+                elif op == "stats":
+                    reply = batcher.stats()
+                else:
+                    reply = {"error": f"unknown op {op!r}"}
+            except Exception as e:
+                reply = {"error": str(e)}
+            send_msg(self.request, reply)
+
+class ModelServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, batcher=None):
+        if os.path.exists(path):
+            os.unlink(path)  # stale socket from an earlier server
+        self.path = path
+        self.batcher = batcher or Batcher()
+        super().__init__(path, _Handler)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+# ── Client ────────────────────────────────────────────────────────────────────
+
+class RemotePipeline:
+    """
+    Stand-in for a transformers pipeline whose calls run in the model server.
+    Accepts a string or a list of strings and returns a list of output dicts.
+    """
+
+    def __init__(self, path, task, model, **pipeline_kwargs):
+        self.path = path
+        self.task = task
+        self.model = model
+        self.pipeline_kwargs = pipeline_kwargs
+        self.transform_backend = pipeline_kwargs.get("backend", "torch")
+
+    def _call(self, msg):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(self.path)
+            except OSError as e:
+                raise ConnectionError(f"No model server at {self.path} "
+                                      f"(start one with: python -m src.model_server --socket {self.path})") from e
+            send_msg(sock, msg)
+            reply = recv_msg(sock)
+        if reply is None:
+            raise ConnectionError("model server closed the connection")
+        if "error" in reply:
+            raise RuntimeError(f"model server: {reply['error']}")
+        return reply
+
+    def __call__(self, inputs, **kwargs):
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        return self._call({"op": "generate", "task": self.task, "model": self.model,
+                           "pipeline_kwargs": self.pipeline_kwargs,
+                           "texts": texts, "kwargs": kwargs})["outputs"]
+
+    def sweep(self, text, min_lengths):
+        """{sigma: summary} for {sigma: min_length}, one encoder pass server-side."""
+        reply = self._call({"op": "sweep", "model": self.model,
+                            "pipeline_kwargs": self.pipeline_kwargs, "text": text,
+                            "min_lengths": {str(s): m for s, m in min_lengths.items()}})
+        return {int(s): v for s, v in reply["summaries"].items()}
+
+def server_stats(path):
+    return RemotePipeline(path, None, None)._call({"op": "stats"})
+
+def main():
+    ap = argparse.ArgumentParser(description="Shared summarization/translation model server")
+    ap.add_argument("--socket", default="/tmp/commitment-models.sock")
+    ap.add_argument("--window", type=float, default=BATCH_WINDOW, help="batching window (s), with --merge-clients")
+    ap.add_argument("--max-batch", type=int, default=MAX_BATCH,
+                    help="batch_size of merged calls, with --merge-clients")
+    ap.add_argument("--merge-clients", action="store_true",
+                    help="merge concurrent requests into padded batches (outputs may differ)")
+    args = ap.parse_args()
+
+    server = ModelServer(args.socket, Batcher(window=args.window, max_batch=args.max_batch,
+                                              merge=args.merge_clients))
+    print(f"Model server on {args.socket}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Served {server.batcher.requests} requests in {server.batcher.calls} model calls")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Process-wide model registry.
+
+Models are loaded lazily on first use and shared by every module in the
+harness, so importing src.extraction (or running `analyze.py "text"`) does
+not pay for a spaCy load until an extraction actually needs one. The same
+holds for the Hugging Face transform pipelines, which can also live in a
+shared model-server process (src.model_server) instead of this one.
+"""
+
+import os
+import threading
+
+from .config import Config
+
+_SPACY_MODELS = {}
+_PIPELINES = {}
+_LOCK = threading.Lock()
+
+def get_spacy_model(model_name=None, disable=()):
+    """
+    Return the shared spaCy pipeline for (model_name, disable).
+
+    The first call for a key loads the model; later calls return the same
+    object. `disable` is normalized to a frozenset, so component order does
+    not create separate entries.
+    """
+    model_name = model_name or Config.SPACY_MODEL
+    key = (model_name, frozenset(disable))
+    nlp = _SPACY_MODELS.get(key)
+    if nlp is not None:
+        return nlp
+    with _LOCK:
+        nlp = _SPACY_MODELS.get(key)
+        if nlp is None:
+            import spacy
+            nlp = spacy.load(model_name, disable=sorted(key[1]))
+            _SPACY_MODELS[key] = nlp
+    return nlp
+
+def spacy_model_id(nlp=None):
+    """
+    "lang_name-version" of `nlp`, or of the shared Config.SPACY_MODEL
+    pipeline. Cache keys use it so a model upgrade does not reuse entries
+    written by the old model.
+    """
+    meta = (nlp if nlp is not None else get_spacy_model()).meta
+    return f"{meta.get('lang')}_{meta.get('name')}-{meta.get('version')}"
+
+def loaded_spacy_models():
+    """Keys of the models loaded so far (for diagnostics and tests)."""
+    return list(_SPACY_MODELS)
+
+def clear_spacy_models():
+    """Drop every cached model; the next get_spacy_model call reloads."""
+    with _LOCK:
+        _SPACY_MODELS.clear()
+
+def model_server_path():
+    """Socket of the shared model server (src.model_server), or None."""
+    return os.environ.get("COMMITMENT_MODEL_SERVER", Config.MODEL_SERVER) or None
+
+def transform_backend():
+    """Inference backend for transform pipelines (Config.TRANSFORM_BACKEND)."""
+    backend = os.environ.get("COMMITMENT_TRANSFORM_BACKEND", Config.TRANSFORM_BACKEND)
+    if backend not in TRANSFORM_BACKENDS:
+        raise ValueError(f"Unknown transform backend {backend!r} ({' | '.join(TRANSFORM_BACKENDS)})")
+    return backend
+
+def get_pipeline(task, model, backend=None, **kwargs):
+    """
+    Return the shared transformers pipeline for (task, model, backend,
+    kwargs). With a model server configured this is a RemotePipeline and
+    nothing is loaded in this process; otherwise the pipeline is built here
+    on first use.
+    """
+    backend = backend or transform_backend()
+    path = model_server_path()
+    if path:
+        from .model_server import RemotePipeline
+        return RemotePipeline(path, task, model, backend=backend, **kwargs)
+    return get_local_pipeline(task, model, backend=backend, **kwargs)
+
+def get_local_pipeline(task, model, backend="torch", **kwargs):
+    """Build (once) and return an in-process transformers pipeline."""
+    key = (task, model, backend, tuple(sorted(kwargs.items())))
+    pipe = _PIPELINES.get(key)
+    if pipe is not None:
+        return pipe
+    with _LOCK:
+        pipe = _PIPELINES.get(key)
+        if pipe is None:
+            pipe = _BUILDERS[backend](task, model, **kwargs)
+            pipe.transform_backend = backend
+            _PIPELINES[key] = pipe
+    return pipe
+
+def _torch_pipeline(task, model, **kwargs):
+    from transformers import pipeline
+    return pipeline(task, model=model, **kwargs)
+
+def _int8_pipeline(task, model, **kwargs):
+    """fp32 pipeline with its Linear layers dynamically quantized to int8."""
+    import torch
+    pipe = _torch_pipeline(task, model, **kwargs)
+    pipe.model = torch.quantization.quantize_dynamic(pipe.model, {torch.nn.Linear}, dtype=torch.qint8)
+    return pipe
+
+def _onnx_pipeline(task, model, **kwargs):
+    """Pipeline over an ONNX Runtime export of the model (CPU execution)."""
+    try:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    except ImportError as e:
+        raise ImportError("TRANSFORM_BACKEND='onnx' needs optimum[onnxruntime] "
+                          "(pip install 'optimum[onnxruntime]')") from e
+    from transformers import AutoTokenizer, pipeline
+    tokenizer = kwargs.pop("tokenizer", None) or model
+    for k in ("framework", "device"):
+        kwargs.pop(k, None)
+    ort_model = ORTModelForSeq2SeqLM.from_pretrained(model, export=True)
+    return pipeline(task, model=ort_model, tokenizer=AutoTokenizer.from_pretrained(tokenizer), **kwargs)
+
+TRANSFORM_BACKENDS = ("torch", "int8", "onnx")
+_BUILDERS = {"torch": _torch_pipeline, "int8": _int8_pipeline, "onnx": _onnx_pipeline}
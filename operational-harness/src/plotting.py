@@ -1,4 +1,5 @@
 import matplotlib.pyplot as plt
+from .timing import stage
 
 def plot_fidelity(fidelity_data, compression_thresholds):
     plt.figure(figsize=(10, 6))
@@ -37,7 +38,8 @@ def plot_fid(sig_label, sigma_vals, fid_vals, outpath=None):
     plt.gca().invert_xaxis()
     plt.grid(True)
     if outpath:
-        plt.savefig(outpath, bbox_inches='tight')
+        with stage("plot"):
+            plt.savefig(outpath, bbox_inches='tight')
     else:
         plt.show()
 
@@ -49,7 +51,8 @@ def plot_delta(sig_label, steps, delta_vals, outpath=None):
     plt.title(f"Drift vs n — {sig_label}")
     plt.grid(True)
     if outpath:
-        plt.savefig(outpath, bbox_inches='tight')
+        with stage("plot"):
+            plt.savefig(outpath, bbox_inches='tight')
     else:
         plt.show()
     plt.close()
\ No newline at end of file
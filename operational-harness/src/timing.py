@@ -0,0 +1,201 @@
+"""
+Opt-in per-stage timing and profiling.
+
+Instrumented code marks its stages with `stage("name")` blocks or the
+`@timed("name")` decorator. While timing is off (the default) these cost one
+attribute check; once enabled (Config.TIMING, COMMITMENT_TIMING=1, or
+TIMER.enable(), e.g. `analyze.py run --timing`) every stage accumulates
+calls, wall time and process CPU time (which includes torch's intra-op
+threads). Stages nest: a stage's times include its children, and the
+breakdown also reports self time, so parsing, summarization, translation,
+plotting and I/O can be told apart inside a sweep.
+
+Stage names used across the harness:
+  compression_sweep, recursion_test, transform_sieve,
+  compress_with_enforcement, paraphrase_with_enforcement — the experiments
+  transform.<task>     — a CachedPipeline call, cache hits included
+  model.<task>         — the pipeline call on cache misses (actual inference)
+  extract.<extractor>  — commitment extraction, cache hits included (spacy,
+                         fast, spacy_batch, advanced, test_harness)
+  spacy.parse          — spaCy parsing on extraction cache misses
+  plot                 — figure rendering (savefig)
+  io.json              — writing result JSON (receipts, corpus outputs)
+
+dump_json() writes a result file under io.json and, with timing on, then
+rewrites it with a "timing" entry, so the breakdown includes that write.
+
+Process pools: run the job under TIMER.isolated() in the worker and add()
+the stats and folded stacks it yields to the parent's TIMER (see
+src/corpus_runner.py), so breakdowns and flamegraphs cover worker time.
+
+Traces: fold() returns per-stack self time in the folded-stack format read by
+flamegraph.pl / speedscope / inferno, and profile() wraps a block in cProfile
+and dumps a .prof file for pstats, snakeviz or flameprof.
+"""
+
+import cProfile
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from .config import Config
+
+class StageTimer:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._stats = {}
+        self._folded = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self._folded.clear()
+
+    @contextmanager
+    def stage(self, name):
+        if not self.enabled:
+            yield
+            return
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        frame = [name, 0.0, 0.0]  # name, child wall, child cpu
+        stack.append(frame)
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall0, time.process_time() - cpu0
+            path = ";".join(f[0] for f in stack)
+            stack.pop()
+            if stack:
+                stack[-1][1] += wall
+                stack[-1][2] += cpu
+            with self._lock:
+                s = self._stats.setdefault(name, {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0,
+                                                  "self_wall_s": 0.0, "self_cpu_s": 0.0})
+                s["calls"] += 1
+                s["wall_s"] += wall
+                s["cpu_s"] += cpu
+                s["self_wall_s"] += wall - frame[1]
+                s["self_cpu_s"] += cpu - frame[2]
+                self._folded[path] = self._folded.get(path, 0.0) + wall - frame[1]
+
+    @contextmanager
+    def isolated(self):
+        """
+        Time the block on its own: yields a dict that receives the block's
+        {"stages": breakdown(), "folded": {stack: self wall seconds}} on exit
+        (nothing while timing is off). Stats recorded before the block are
+        restored afterwards, without the block's, so add() can bring them
+        back in.
+        """
+        with self._lock:
+            saved = self._stats, self._folded
+            self._stats, self._folded = {}, {}
+        out = {}
+        try:
+            yield out
+        finally:
+            if self.enabled:
+                with self._lock:
+                    folded = dict(self._folded)
+                out.update(stages=self.breakdown(), folded=folded)
+            with self._lock:
+                self._stats, self._folded = saved
+
+    def add(self, timing):
+        """Add what isolated() yielded (e.g. in a worker process) to this timer."""
+        with self._lock:
+            for name, other in timing.get("stages", {}).items():
+                s = self._stats.setdefault(name, {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0,
+                                                  "self_wall_s": 0.0, "self_cpu_s": 0.0})
+                for k in s:
+                    s[k] += other[k]
+            for path, seconds in timing.get("folded", {}).items():
+                self._folded[path] = self._folded.get(path, 0.0) + seconds
+
+    def timed(self, name):
+        """Decorator form of stage(name)."""
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                with self.stage(name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def breakdown(self):
+        """
+        {stage: calls, wall/cpu seconds (inclusive and self), share of the
+        total self wall time}, slowest stage first.
+        """
+        with self._lock:
+            stats = {k: dict(v) for k, v in self._stats.items()}
+        total = sum(s["self_wall_s"] for s in stats.values())
+        for s in stats.values():
+            s["self_share"] = round(s["self_wall_s"] / total, 4) if total else 0.0
+            for k in ("wall_s", "cpu_s", "self_wall_s", "self_cpu_s"):
+                s[k] = round(s[k], 6)
+        return dict(sorted(stats.items(), key=lambda kv: -kv[1]["wall_s"]))
+
+    def fold(self):
+        """Folded stacks ("a;b;c <microseconds>" per line) of self wall time."""
+        with self._lock:
+            items = sorted(self._folded.items())
+        return "".join(f"{path} {round(s * 1e6)}\n" for path, s in items if s > 0)
+
+    def write_folded(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(self.fold())
+
+    def summary(self, top=12):
+        lines = [f"{'stage':32s} {'calls':>7s} {'wall s':>9s} {'self s':>9s} {'cpu s':>9s} {'share':>6s}"]
+        for name, s in list(self.breakdown().items())[:top]:
+            lines.append(f"{name:32s} {s['calls']:7d} {s['wall_s']:9.3f} {s['self_wall_s']:9.3f} "
+                         f"{s['cpu_s']:9.3f} {s['self_share']:6.1%}")
+        return "\n".join(lines)
+
+@contextmanager
+def profile(path):
+    """Run the block under cProfile and dump stats to `path` (.prof)."""
+    prof = cProfile.Profile()
+    prof.enable()
+    try:
+        yield prof
+    finally:
+        prof.disable()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        prof.dump_stats(path)
+
+# Process-wide timer used by every instrumented module
+TIMER = StageTimer(enabled=Config.TIMING or os.environ.get("COMMITMENT_TIMING", "") not in ("", "0"))
+stage = TIMER.stage
+timed = TIMER.timed
+
+def dump_json(obj, path, **json_kwargs):
+    """
+    Write obj to `path` as JSON inside stage("io.json"). With timing on, the
+    file is then rewritten with obj["timing"] = TIMER.breakdown(), taken once
+    the io.json stage has closed so the write is part of it.
+    """
+    with TIMER.stage("io.json"), open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, **json_kwargs)
+    if TIMER.enabled:
+        obj["timing"] = TIMER.breakdown()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, **json_kwargs)
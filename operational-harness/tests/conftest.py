@@ -0,0 +1,7 @@
+import os
+
+# Keep the process-wide caches in memory: tests must not read entries from,
+# or write entries to, the SQLite files a real run uses. Set before any test
+# module imports src.cache.
+os.environ["COMMITMENT_TRANSFORM_CACHE"] = ""
+os.environ["COMMITMENT_EXTRACTION_CACHE"] = ""
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from src import bench
+from src.bench import compare, load_signals, measure, run_suite
+
+def result(**medians):
+    return {"benchmarks": {name: {"median_ms": ms} if ms is not None else {"skipped": "ImportError"}
+                           for name, ms in medians.items()}}
+
+def test_compare_flags_regressions_and_improvements():
+    old = result(a=1.0, b=1.0, c=1.0, gone=1.0, s=1.0)
+    new = result(a=1.1, b=1.5, c=0.5, added=1.0, s=None)
+    status = {r["name"]: r["status"] for r in compare(old, new, threshold=0.15)}
+    assert status == {"a": "ok", "b": "regression", "c": "improved", "gone": "removed",
+                      "s": "skipped", "added": "new"}
+
+def test_measure_reports_per_call_latency():
+    calls = []
+    stats = measure(lambda: calls.append(1), items=4, repeats=3)
+    assert len(calls) == 4  # warm-up + 3 timed passes
+    assert stats["items"] == 4 and stats["repeats"] == 3
+    assert stats["min_ms"] <= stats["median_ms"]
+
+def test_suite_uses_the_canonical_corpus():
+    assert len(load_signals()) == 20
+    out = run_suite(groups={"metrics"}, quick=True, log=None)
+    assert out["corpus"]["n_signals"] == 20
+    assert out["benchmarks"] and all(b["group"] == "metrics" for b in out["benchmarks"].values())
+
+def test_created_is_utc_with_z_suffix():
+    out = run_suite(groups={"none"}, log=None)
+    assert out["created"].endswith("Z") and "+" not in out["created"]
+
+def test_scratch_groups_leave_no_files_behind(monkeypatch, tmp_path):
+    def writes_a_plot(signals):
+        return lambda: Path("fid_plot_test.png").write_bytes(b""), 1
+    monkeypatch.setattr(bench, "BENCHMARKS", [("end_to_end", "end_to_end.plot", writes_a_plot)])
+    monkeypatch.chdir(tmp_path)
+    out = run_suite(quick=True, log=None)
+    assert "median_ms" in out["benchmarks"]["end_to_end.plot"]
+    assert list(tmp_path.iterdir()) == [] and Path.cwd() == tmp_path
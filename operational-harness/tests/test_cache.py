@@ -0,0 +1,119 @@
+import pytest
+
+from src.cache import ExtractionCache
+from src.extraction import extract_hard_commitments
+
+def test_memoize_counts_hits_and_misses():
+    cache = ExtractionCache(maxsize=8)
+    calls = []
+
+    @cache.memoize("counting")
+    def extractor(text):
+        calls.append(text)
+        return {text.upper()}
+
+    assert extractor("a") == {"A"}
+    assert extractor("a") == {"A"}
+    assert extractor("b") == {"B"}
+    assert calls == ["a", "b"]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+def test_results_are_fresh_sets():
+    cache = ExtractionCache()
+    first = cache.lookup("x", "text", lambda t: {"c"})
+    first.add("mutated")
+    assert cache.lookup("x", "text", lambda t: set()) == {"c"}
+
+def test_lru_eviction():
+    cache = ExtractionCache(maxsize=2)
+    for t in ("a", "b", "c"):
+        cache.lookup("x", t, lambda t: {t})
+    assert cache.stats()["size"] == 2
+    assert cache.get(cache.key("x", "a")) is None
+
+def test_key_separates_extractors_and_versions():
+    assert ExtractionCache.key("a", "t") != ExtractionCache.key("b", "t")
+    assert ExtractionCache.key("a", "t", version="1") != ExtractionCache.key("a", "t", version="2")
+
+def test_sqlite_store_survives_new_instance(tmp_path):
+    path = str(tmp_path / "extractions.sqlite")
+    ExtractionCache(path=path).lookup("x", "You must pay.", lambda t: {"You must pay."})
+    reopened = ExtractionCache(path=path)
+    assert reopened.lookup("x", "You must pay.", lambda t: set()) == {"You must pay."}
+    assert reopened.stats()["disk_hits"] == 1
+
+def test_memoize_name_is_resolved_per_call():
+    cache = ExtractionCache()
+    day = ["2026-01-01"]
+
+    @cache.memoize(lambda: f"dated@{day[0]}")
+    def extractor(text):
+        return {f"{text}:{day[0]}"}
+
+    assert extractor("by Friday") == {"by Friday:2026-01-01"}
+    day[0] = "2026-01-02"
+    assert extractor("by Friday") == {"by Friday:2026-01-02"}
+    assert cache.stats()["misses"] == 2
+
+def test_spacy_cache_name_uses_the_loaded_model(monkeypatch):
+    from types import SimpleNamespace
+    from src import models
+    from src.config import Config
+    from src.extraction import _cache_name
+    nlp = SimpleNamespace(meta={"lang": "en", "name": "core_web_sm", "version": "3.7.1"})
+    monkeypatch.setitem(models._SPACY_MODELS, (Config.SPACY_MODEL, frozenset()), nlp)
+    assert _cache_name("spacy", None) == _cache_name("spacy", nlp) == "extraction.spacy:en_core_web_sm-3.7.1"
+    upgraded = SimpleNamespace(meta=dict(nlp.meta, version="3.8.0"))
+    assert _cache_name("spacy", upgraded) != _cache_name("spacy", None)
+
+def test_fast_mode_is_cached():
+    text = "Staff must sign in. Visitors may wait."
+    assert extract_hard_commitments(text, mode="fast") == extract_hard_commitments(text, mode="fast")
+
+def test_cached_pipeline_batches_misses_only():
+    from src.cache import CachedPipeline, TransformCache
+
+    calls = []
+
+    def fake_pipe(inputs, **kwargs):
+        batch = [inputs] if isinstance(inputs, str) else inputs
+        calls.append(list(batch))
+        return [{"summary_text": t[:kwargs["max_length"]]} for t in batch]
+
+    class FakeSummarizer(CachedPipeline):
+        pipeline = property(lambda self: fake_pipe)
+
+    summ = FakeSummarizer("summarization", "fake-model", cache=TransformCache())
+    assert summ("abcdef", max_length=3, do_sample=False) == [{"summary_text": "abc"}]
+    out = summ(["abcdef", "uvwxyz"], max_length=3, do_sample=False, batch_size=2)
+    assert out == [{"summary_text": "abc"}, {"summary_text": "uvw"}]
+    assert calls == [["abcdef"], ["uvwxyz"]]
+
+def test_pipeline_kwargs_are_part_of_the_key():
+    from src.cache import CachedPipeline, TransformCache
+
+    cache = TransformCache()
+    plain = CachedPipeline("translation", "fake-model", cache=cache)
+    tokenized = CachedPipeline("translation", "fake-model", cache=cache, tokenizer="other-tokenizer")
+    on_cpu = CachedPipeline("translation", "fake-model", cache=cache, device=-1)
+    plain.prime("abcdef", "plain out", max_length=3)
+    assert not tokenized.is_cached("abcdef", max_length=3)
+    assert on_cpu.is_cached("abcdef", max_length=3)
+
+def test_backends_cache_separately(monkeypatch):
+    from src.cache import CachedPipeline, TransformCache
+
+    cache = TransformCache()
+    fp32 = CachedPipeline("summarization", "fake-model", cache=cache)
+    int8 = CachedPipeline("summarization", "fake-model", cache=cache, backend="int8")
+    assert fp32.cache_id == "summarization:fake-model"
+    assert int8.cache_id == "summarization:fake-model@int8"
+    fp32.prime("abcdef", "fp32 out", max_length=3)
+    assert not int8.is_cached("abcdef", max_length=3)
+
+    monkeypatch.setenv("COMMITMENT_TRANSFORM_BACKEND", "int8")
+    assert fp32.is_cached("abcdef", max_length=3) is False
+    monkeypatch.setenv("COMMITMENT_TRANSFORM_BACKEND", "fp16")
+    with pytest.raises(ValueError):
+        fp32.cache_id
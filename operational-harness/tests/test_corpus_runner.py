@@ -0,0 +1,42 @@
+from src.corpus_runner import corpus_jobs, default_workers, run_jobs
+from src.timing import TIMER, stage
+
+def test_corpus_jobs_cover_every_signal_mode_and_test():
+    jobs = corpus_jobs(["a", "b"], depth=3)
+    assert len(jobs) == 8
+    assert {(idx, enforce, test) for idx, _, enforce, test, _ in jobs} == {
+        (idx, enforce, test) for idx in (0, 1) for enforce in (False, True)
+        for test in ("recursion", "compression")}
+    assert [test for *_, test, _ in jobs[:4]] == ["recursion"] * 4
+
+def test_pool_results_keep_job_order():
+    jobs = [[k] * (10 - k) for k in range(10)]
+    assert run_jobs(jobs, fn=len, workers=3, threads=0) == [10 - k for k in range(10)]
+
+def test_single_worker_runs_in_process():
+    seen = []
+    assert run_jobs([1, 2, 3], fn=lambda j: seen.append(j) or j * 2, workers=1) == [2, 4, 6]
+    assert seen == [1, 2, 3]
+
+def test_default_is_one_worker_unless_overridden(monkeypatch):
+    monkeypatch.delenv("COMMITMENT_CORPUS_WORKERS", raising=False)
+    assert default_workers() == 1
+    monkeypatch.setenv("COMMITMENT_CORPUS_WORKERS", "3")
+    assert default_workers() == 3
+    monkeypatch.setenv("COMMITMENT_CORPUS_WORKERS", "0")
+    assert default_workers() >= 1
+
+def staged_job(n):
+    with TIMER.isolated() as timing:
+        with stage("job"):
+            pass
+    return n * 2, timing
+
+def test_worker_breakdowns_come_back_with_the_results(monkeypatch):
+    monkeypatch.setattr(TIMER, "enabled", True)
+    for workers in (1, 2):
+        results = run_jobs([1, 2, 3], fn=staged_job, workers=workers, threads=0)
+        assert [res for res, _ in results] == [2, 4, 6]
+        assert [timing["stages"]["job"]["calls"] for _, timing in results] == [1, 1, 1]
+        assert all(set(timing["folded"]) == {"job"} for _, timing in results)
+    TIMER.reset()
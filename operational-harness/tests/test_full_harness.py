@@ -2,12 +2,14 @@
 # not task performance or downstream utility.
 
 import pytest
-from src.extraction import extract_hard_commitments
+from src.cache import EXTRACTION_CACHE
+from src.extraction import (_commitments_from_doc, extract_hard_commitments,
+                            extract_hard_commitments_batch)
 from src.metrics import jaccard_index
 from src.test_harness import compute_intersection_commitments, compression_sweep, recursion_test
-import spacy
+from src.models import get_spacy_model
 
-nlp = spacy.load("en_core_web_sm")
+nlp = get_spacy_model()
 
 def test_extract_nonempty():
     commitments = extract_hard_commitments("You must pay $100.", nlp)
@@ -18,6 +20,32 @@ def test_extract_empty():
     commitments = extract_hard_commitments("It's likely rainy.", nlp)
     assert commitments == set()
 
+BATCH_TEXTS = [
+    "You must pay $100.",
+    "It's likely rainy.",
+    "You must pay $100 by Friday if the deal closes; it's likely rainy, so plan accordingly.",
+]
+
+def test_extract_batch_matches_single():
+    # Uncached on both sides: the batch parse against a plain per-text parse
+    EXTRACTION_CACHE.clear()
+    batched = extract_hard_commitments_batch(BATCH_TEXTS, nlp, batch_size=2)
+    assert batched == [_commitments_from_doc(nlp(t)) for t in BATCH_TEXTS]
+
+def test_extract_batch_fills_the_cache_for_single_calls():
+    EXTRACTION_CACHE.clear()
+    first = extract_hard_commitments_batch(BATCH_TEXTS, nlp, batch_size=2)
+    assert EXTRACTION_CACHE.stats()["misses"] == len(BATCH_TEXTS)
+    assert EXTRACTION_CACHE.stats()["hits"] == 0
+    assert [extract_hard_commitments(t, nlp) for t in BATCH_TEXTS] == first
+    assert extract_hard_commitments_batch(BATCH_TEXTS, nlp) == first
+    assert EXTRACTION_CACHE.stats()["hits"] == 2 * len(BATCH_TEXTS)
+    assert EXTRACTION_CACHE.stats()["misses"] == len(BATCH_TEXTS)
+
+def test_fast_mode_agrees_with_spacy():
+    for text in ["You must pay $100.", "It's likely rainy.", "This function must return an integer."]:
+        assert extract_hard_commitments(text, mode="fast") == extract_hard_commitments(text, nlp)
+
 def test_jaccard_perfect():
     a = {"must pay"}
     b = {"must pay"}
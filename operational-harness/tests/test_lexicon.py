@@ -0,0 +1,26 @@
+from src.lexicon import CueMatcher, MODAL_MATCHER
+from src.extraction import extract_hard_commitments_fast
+
+def test_word_boundaries():
+    assert MODAL_MATCHER.search("They behave well.", ("hard",)) is None
+    assert MODAL_MATCHER.search("She is willing to help.", ("hard",)) is None
+    assert MODAL_MATCHER.search("You will help.", ("hard",)).cue == "will"
+
+def test_spans_and_multiword_cues():
+    text = "The tenant Must Not sublet."
+    matches = MODAL_MATCHER.find_all(text, ("modal_lex",))
+    cues = {(m.cue, text[m.start:m.end]) for m in matches}
+    assert ("must", "Must") in cues
+    assert ("must not", "Must Not") in cues
+
+def test_punctuation_breaks_multiword_cue():
+    assert {m.cue for m in MODAL_MATCHER.finditer("must, not", ("modal_lex",))} == {"must"}
+
+def test_overlapping_cues_via_failure_links():
+    matcher = CueMatcher({"a b c": ["x"], "b c d": ["y"], "c": ["z"]})
+    found = [(m.cue, m.start, m.end) for m in matcher.finditer("a b c d")]
+    assert found == [("a b c", 0, 5), ("c", 4, 5), ("b c d", 2, 7)]
+
+def test_fast_extractor_uses_word_boundaries():
+    assert extract_hard_commitments_fast("They behave well.") == set()
+    assert extract_hard_commitments_fast("You must pay $100. It's rainy.") == {"You must pay $100."}
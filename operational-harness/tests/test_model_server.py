@@ -0,0 +1,97 @@
+import threading
+
+import pytest
+
+from src import models
+from src.model_server import Batcher, ModelServer, RemotePipeline, server_stats
+
+class FakeSummarizer:
+    def __init__(self):
+        self.calls = []
+        self.kwargs = []
+
+    def __call__(self, inputs, **kwargs):
+        texts = [inputs] if isinstance(inputs, str) else inputs
+        self.calls.append(len(texts))
+        self.kwargs.append(kwargs)
+        return [{"summary_text": f"{t[:kwargs['max_length']]}"} for t in texts]
+
+def start_server(tmp_path, merge):
+    fake = FakeSummarizer()
+    path = str(tmp_path / "models.sock")
+    srv = ModelServer(path, Batcher(load=lambda task, model, **kw: fake, window=0.05, merge=merge))
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv, path, fake
+
+@pytest.fixture
+def server(tmp_path):
+    srv, path, fake = start_server(tmp_path, merge=False)
+    yield path, fake
+    srv.shutdown()
+    srv.server_close()
+
+@pytest.fixture
+def merging_server(tmp_path):
+    srv, path, fake = start_server(tmp_path, merge=True)
+    yield path, fake
+    srv.shutdown()
+    srv.server_close()
+
+def run_clients(pipe, n):
+    results = {}
+
+    def client(k):
+        results[k] = pipe(f"text {k}", max_length=6, do_sample=False)
+
+    threads = [threading.Thread(target=client, args=(k,)) for k in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+def test_outputs_match_pipeline_format(server):
+    path, _ = server
+    pipe = RemotePipeline(path, "summarization", "fake")
+    assert pipe("abcdef", max_length=3) == [{"summary_text": "abc"}]
+    assert pipe(["abcdef", "xyz"], max_length=2) == [{"summary_text": "ab"}, {"summary_text": "xy"}]
+
+def test_clients_are_not_merged_by_default(server):
+    path, fake = server
+    pipe = RemotePipeline(path, "summarization", "fake")
+    results = run_clients(pipe, 8)
+    assert results == {n: [{"summary_text": f"text {n}"}] for n in range(8)}
+    assert fake.calls == [1] * 8
+    assert server_stats(path) == {"requests": 8, "model_calls": 8}
+
+def test_client_kwargs_reach_the_pipeline_unchanged(server):
+    path, fake = server
+    pipe = RemotePipeline(path, "summarization", "fake")
+    pipe(["abc", "defg"], max_length=2, batch_size=2)
+    assert fake.calls == [2] and fake.kwargs == [{"max_length": 2, "batch_size": 2}]
+
+def test_merge_clients_shares_a_model_call(merging_server):
+    path, fake = merging_server
+    pipe = RemotePipeline(path, "summarization", "fake")
+    results = run_clients(pipe, 8)
+    assert results == {n: [{"summary_text": f"text {n}"}] for n in range(8)}
+    assert sum(fake.calls) == 8
+    assert len(fake.calls) < 8
+    assert server_stats(path)["requests"] == 8
+
+def test_different_kwargs_are_not_merged(server):
+    path, fake = server
+    pipe = RemotePipeline(path, "summarization", "fake")
+    assert pipe("abcdef", max_length=2) == [{"summary_text": "ab"}]
+    assert pipe("abcdef", max_length=4) == [{"summary_text": "abcd"}]
+
+def test_get_pipeline_routes_to_server(server, monkeypatch):
+    path, _ = server
+    monkeypatch.setenv("COMMITMENT_MODEL_SERVER", path)
+    pipe = models.get_pipeline("summarization", "fake")
+    assert isinstance(pipe, RemotePipeline)
+    assert pipe("hello", max_length=4) == [{"summary_text": "hell"}]
+
+def test_missing_server_is_a_connection_error(tmp_path):
+    with pytest.raises(ConnectionError):
+        RemotePipeline(str(tmp_path / "none.sock"), "summarization", "fake")("x")
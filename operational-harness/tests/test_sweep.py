@@ -0,0 +1,25 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.cache import CachedPipeline, TransformCache
+from src.sweep import prefetch_encoder_sweep
+
+def summarizer_with(pipe):
+    class Fake(CachedPipeline):
+        pipeline = property(lambda self: pipe)
+    return Fake("summarization", "fake-model", cache=TransformCache())
+
+def test_remote_sweep_primes_pipeline_keys():
+    pipe = SimpleNamespace(sweep=lambda text, min_lengths: {int(s): f"{text[:int(s)]}"
+                                                             for s in min_lengths})
+    summ = summarizer_with(pipe)
+    prefetch_encoder_sweep(summ, "abcdefgh", [4, 2], min_length=lambda s: 1)
+    assert summ.is_cached("abcdefgh", max_length=4, min_length=1, do_sample=False)
+    assert summ("abcdefgh", max_length=2, min_length=1, do_sample=False) == [{"summary_text": "ab"}]
+
+def test_onnx_backend_skips_reuse_with_a_warning():
+    summ = summarizer_with(SimpleNamespace(transform_backend="onnx"))
+    with pytest.warns(RuntimeWarning, match="encoder reuse skipped"):
+        prefetch_encoder_sweep(summ, "abcdefgh", [4, 2])
+    assert not summ.is_cached("abcdefgh", max_length=4, min_length=5, do_sample=False)
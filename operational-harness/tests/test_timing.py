@@ -0,0 +1,68 @@
+import json
+import pstats
+
+from src import timing
+from src.timing import StageTimer, profile
+
+def test_disabled_timer_records_nothing():
+    timer = StageTimer()
+    with timer.stage("a"):
+        pass
+    assert timer.timed("b")(lambda x: x + 1)(1) == 2
+    assert timer.breakdown() == {} and timer.fold() == ""
+
+def test_nested_stages_report_inclusive_and_self_time():
+    timer = StageTimer(enabled=True)
+    work = timer.timed("inner")(lambda: sum(range(20000)))
+    for _ in range(3):
+        with timer.stage("outer"):
+            work()
+            work()
+    stats = timer.breakdown()
+    assert stats["outer"]["calls"] == 3 and stats["inner"]["calls"] == 6
+    assert stats["outer"]["wall_s"] >= stats["inner"]["wall_s"]
+    assert stats["outer"]["self_wall_s"] <= stats["outer"]["wall_s"]
+    assert abs(sum(s["self_share"] for s in stats.values()) - 1) < 1e-3
+    stacks = dict(line.rsplit(" ", 1) for line in timer.fold().splitlines())
+    assert set(stacks) <= {"outer", "outer;inner"} and "outer;inner" in stacks
+
+def test_profile_dumps_loadable_stats(tmp_path):
+    path = tmp_path / "run.prof"
+    with profile(str(path)):
+        sorted(range(1000), key=lambda x: -x)
+    assert pstats.Stats(str(path)).total_calls > 0
+
+def test_isolated_block_yields_its_own_breakdown_and_add_merges_it():
+    timer = StageTimer(enabled=True)
+    with timer.stage("before"):
+        pass
+    with timer.isolated() as job:
+        with timer.stage("job"):
+            with timer.stage("io.json"):
+                pass
+    assert set(job["stages"]) == {"job", "io.json"}
+    assert set(job["folded"]) == {"job", "job;io.json"}
+    assert set(timer.breakdown()) == {"before"}
+    timer.add(job)
+    timer.add(job)
+    stats = timer.breakdown()
+    assert stats["job"]["calls"] == 2 and stats["before"]["calls"] == 1
+    assert stats["job"]["wall_s"] >= stats["io.json"]["wall_s"]
+    stacks = {line.rsplit(" ", 1)[0] for line in timer.fold().splitlines()}
+    assert {"job", "job;io.json"} <= stacks
+
+def test_isolated_is_empty_while_disabled():
+    timer = StageTimer()
+    with timer.isolated() as job:
+        with timer.stage("job"):
+            pass
+    assert job == {}
+
+def test_dump_json_records_its_own_write(tmp_path, monkeypatch):
+    monkeypatch.setattr(timing, "TIMER", StageTimer())
+    path = tmp_path / "out.json"
+    timing.dump_json({"a": 1}, str(path))
+    assert json.loads(path.read_text()) == {"a": 1}
+    timing.TIMER.enable()
+    timing.dump_json({"a": 1}, str(path))
+    assert json.loads(path.read_text())["timing"]["io.json"]["calls"] == 1
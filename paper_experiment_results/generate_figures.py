@@ -7,9 +7,17 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.colors import LinearSegmentedColormap
 import numpy as np
-import json, os
+import json, os, sys
+from pathlib import Path
 
 BASE = '/Users/dericmchenry/Desktop/commitment-conservation-experiments'
+
+# results_table (columnar export of every EXP run) lives in paper_harness/
+_here = Path(__file__).resolve().parent
+for _p in (_here.parent, _here.parent / 'paper_harness'):
+    if (_p / 'results_table.py').exists():
+        sys.path.insert(0, str(_p))
+from results_table import at_iteration, load_table
 FOOTER = 'MO§ES™  ·  Ello Cello LLC  ·  Patent No. 63/877,177 (Provisional)'
 
 plt.rcParams.update({
@@ -126,6 +134,8 @@ def fig1_harness():
 # ═════════════════════════════════════════════════════════════════════════════
 
 def fig2_heatmap():
+    df = load_table(BASE, columns=['experiment', 'signal', 'condition', 'i', 'nli_stability'])
+
     # EXP-006: Baseline / Compression / Gate NLI@i10 (paper recursion test)
     exp006_labels = [
         'Abstract core',
@@ -133,12 +143,7 @@ def fig2_heatmap():
         'First law restatement',
         'Enforcement conditionality',
     ]
-    exp006 = np.array([
-        [1.00, 0.50, 0.50],
-        [1.00, 0.50, 0.00],
-        [1.00, 0.00, 0.50],
-        [1.00, 0.00, 0.00],
-    ])
+    exp006 = at_iteration(df, 'EXP-006', ['baseline', 'compression', 'gate']).to_numpy()
 
     # EXP-005: Gate / ANCH / ESCL NLI@i10 (mechanism isolation)
     exp005_labels = [
@@ -148,13 +153,7 @@ def fig2_heatmap():
         'Passive temporal',
         'Soft modal escalation',
     ]
-    exp005 = np.array([
-        [0.50, 0.50, 0.00],
-        [0.50, 0.00, 1.00],
-        [1.00, 1.00, 1.00],
-        [1.00, 1.00, 1.00],
-        [0.00, 0.00, 0.50],
-    ])
+    exp005 = at_iteration(df, 'EXP-005', ['gate', 'anchor_gate', 'escalation_gate']).to_numpy()
 
     # EXP-007: Gate NLI@i10 (NP-negation probe)
     exp007_labels = [
@@ -165,7 +164,7 @@ def fig2_heatmap():
         'You must not smoke. (ctrl)',
         'You must not enter. (ctrl)',
     ]
-    exp007 = np.array([[1.00], [1.00], [1.00], [1.00], [1.00], [1.00]])
+    exp007 = at_iteration(df, 'EXP-007', ['gate']).to_numpy()
 
     cmap = LinearSegmentedColormap.from_list(
         'conserve', ['#C62828', '#EF9A9A', '#FFFFFF', '#A5D6A7', '#1B5E20'])
@@ -225,19 +224,18 @@ def fig2_heatmap():
 # ═════════════════════════════════════════════════════════════════════════════
 
 def fig3_conservation_curve():
-    # Load EXP-005 quantified_temporal — Gate=1.00 fixpoint (best conservation example)
-    d5 = json.load(open(f'{BASE}/EXP-005/run.json'))
-    qt = next(e for e in d5 if 'quantified' in e['category'])
-    qt_b = [x['nli_stability'] for x in qt['baseline_nli']]
-    qt_c = [x['nli_stability'] for x in qt['compression_nli']]
-    qt_g = [x['nli_stability'] for x in qt['gate_nli']]
-
-    # Load EXP-006 enforcement_conditionality — starkest collapse
-    d6 = json.load(open(f'{BASE}/EXP-006/run.json'))
-    ec = next(e for e in d6 if 'enforcement' in e['category'])
-    ec_b = [x['nli_stability'] for x in ec['baseline_nli']]
-    ec_c = [x['nli_stability'] for x in ec['compression_nli']]
-    ec_g = [x['nli_stability'] for x in ec['gate_nli']]
+    df = load_table(BASE, columns=['experiment', 'category', 'condition', 'i', 'nli_stability'])
+
+    def curve(exp, category, condition):
+        sel = df[(df['experiment'] == exp) & df['category'].str.contains(category)
+                 & (df['condition'] == condition)]
+        return sel.sort_values('i')['nli_stability'].tolist()
+
+    # EXP-005 quantified_temporal — Gate=1.00 fixpoint (best conservation example)
+    qt_b, qt_c, qt_g = (curve('EXP-005', 'quantified', c) for c in ('baseline', 'compression', 'gate'))
+
+    # EXP-006 enforcement_conditionality — starkest collapse
+    ec_b, ec_c, ec_g = (curve('EXP-006', 'enforcement', c) for c in ('baseline', 'compression', 'gate'))
 
     iters = list(range(1, 11))
     BLUE = '#2B5797'; OG = '#C25B14'; GR = '#1B5E20'
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+journal.py — Append-only per-turn journal for resumable harness runs
+
+Every completed (signal, condition, iteration) unit is appended to a JSONL
+file as soon as it finishes:
+
+    {"signal": ..., "condition": ..., "i": ..., "record": {...}}
+
+The file (and its directory) is only created by the first put(), headed by
+a {"meta": {...}} line with whatever the harness needs to find its outputs
+again on resume — a run that dies before finishing any unit leaves nothing
+behind. Re-opening an existing journal makes those units and the meta
+available again, so a run restarted after a crash or a 429 storm replays
+finished turns from disk and only pays for the rest. A half-written last
+line (the crash itself) is skipped. Once the run writes its final run
+files/report, compact() removes the journal.
+"""
+
+import json
+import threading
+from pathlib import Path
+
+
+class RunJournal:
+    def __init__(self, path, meta: dict = None):
+        self.path    = Path(path)
+        self.meta    = dict(meta or {})
+        self.units   = {}
+        self.reused  = 0
+        self.written = 0
+        self._lock   = threading.Lock()
+        if self.path.exists():
+            with self.path.open() as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue
+                    if "meta" in rec:
+                        self.meta.update(rec["meta"])
+                        continue
+                    self.units[(rec["signal"], rec["condition"], rec["i"])] = rec["record"]
+        self.loaded = len(self.units)
+
+    def get(self, signal: str, condition: str, i: int):
+        """The journaled record for a unit, or None if it has not completed."""
+        with self._lock:
+            rec = self.units.get((signal, condition, i))
+            if rec is not None:
+                self.reused += 1
+            return rec
+
+    def put(self, signal: str, condition: str, i: int, record: dict):
+        line = json.dumps({"signal": signal, "condition": condition, "i": i, "record": record})
+        with self._lock:
+            self.units[(signal, condition, i)] = record
+            head = not self.path.exists()
+            if head:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a") as f:
+                if head:
+                    f.write(json.dumps({"meta": self.meta}) + "\n")
+                f.write(line + "\n")
+            self.written += 1
+
+    def compact(self):
+        """Drop the journal once its contents are in the final run files."""
+        with self._lock:
+            if self.path.exists():
+                self.path.unlink()
+
+    def summary(self) -> str:
+        return (f"Journal: {self.loaded} units loaded, {self.reused} resumed, "
+                f"{self.written} written")
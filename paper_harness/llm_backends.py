@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+llm_backends.py — Pluggable LLM backends for the convergence harnesses
+
+Every harness talks to a backend through one call:
+
+    backend.chat(messages, max_tokens=150, temperature=0.3) -> str
+
+Backends
+========
+  openai  — live chat-completions over HTTP (default). The API key is read on
+            the first request, not at import, from $OPENAI_API_KEY or
+            ~/.hange/openai_api_key. $HARNESS_LLM_URL points it at any
+            compatible endpoint; a loopback URL (mock_llm_server.py) needs
+            no key.
+  local   — deterministic rule-based stand-in; no network, no key.
+  replay  — serves recorded responses: a .jsonl written by the recorder, or
+            an EXP run.jsonl/run.json (harnesses that know their prompts pass
+            a loader).
+
+Selection (make_backend)
+========================
+  HARNESS_LLM_BACKEND = openai | local | replay
+  HARNESS_REPLAY      = path[,path...]   (recordings or EXP run files)
+  HARNESS_RECORD      = path.jsonl       (append every exchange; any backend)
+  HARNESS_LLM_URL     = chat-completions URL override
+  HARNESS_LOCAL_LATENCY = seconds of simulated latency for local/replay
+
+HTTP
+====
+  All HTTP backends in a process share one keep-alive requests.Session, so
+  TLS setup is paid once per connection, not once per call.
+  HARNESS_HTTP_POOL            = connections kept per host (default 16)
+  HARNESS_HTTP_CONNECT_TIMEOUT = connect timeout in seconds (default 10);
+                                 the read timeout is the backend's `timeout`
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+OPENAI_URL = "https://api.openai.com/v1/chat/completions"
+KEY_PATH   = Path.home() / ".hange/openai_api_key"
+
+HTTP_POOL       = int(os.environ.get("HARNESS_HTTP_POOL", "16"))
+CONNECT_TIMEOUT = float(os.environ.get("HARNESS_HTTP_CONNECT_TIMEOUT", "10"))
+
+
+def is_loopback(url: str) -> bool:
+    """True for a URL on this machine (where mock_llm_server.py listens)."""
+    host = urlparse(url or "").hostname or ""
+    return host in ("localhost", "::1") or host.startswith("127.")
+
+
+def openai_key(url: str = None) -> str:
+    """
+    API key from $OPENAI_API_KEY or ~/.hange/openai_api_key (read lazily).
+    Without one, a loopback `url` — the mock server, which does not check
+    keys — gets a placeholder; any other endpoint is an error.
+    """
+    key = os.environ.get("OPENAI_API_KEY")
+    if key:
+        return key.strip()
+    if KEY_PATH.exists():
+        return KEY_PATH.read_text().strip()
+    if is_loopback(url):
+        return "mock"
+    raise RuntimeError(f"No OpenAI API key: set OPENAI_API_KEY or create {KEY_PATH} "
+                       "(or use HARNESS_LLM_BACKEND=local|replay for offline runs)")
+
+
+def log(msg): print(msg, flush=True)
+
+
+# ── Shared HTTP session ───────────────────────────────────────────────────────
+
+_SESSION      = None
+_SESSION_POOL = 0
+_SESSION_LOCK = threading.Lock()
+
+
+def http_session(pool_size: int = None):
+    """
+    The process-wide keep-alive session. Its adapter is built once, on the
+    first call, with a per-host pool of max(pool_size, HARNESS_HTTP_POOL) —
+    callers that run N requests in parallel pass N before their first
+    request so no request waits on a connection. The adapter is never
+    replaced afterwards, so open connections survive for the whole run; a
+    larger pool_size asked for later is only reported.
+    """
+    global _SESSION, _SESSION_POOL
+    pool_size = max(pool_size or 0, HTTP_POOL)
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            _SESSION = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+            _SESSION.mount("https://", adapter)
+            _SESSION.mount("http://", adapter)
+            _SESSION_POOL = pool_size
+        elif pool_size > _SESSION_POOL:
+            log(f"  [HTTP pool already open with {_SESSION_POOL} connections per host; "
+                f"{pool_size} requested — set HARNESS_HTTP_POOL={pool_size}]")
+        return _SESSION
+
+
+class LatencyStats:
+    """Thread-safe per-call latency record (seconds) with a one-line summary."""
+
+    def __init__(self):
+        self.samples = []
+        self.errors  = 0
+        self._lock   = threading.Lock()
+
+    def record(self, seconds: float, ok: bool = True):
+        with self._lock:
+            self.samples.append(seconds)
+            if not ok:
+                self.errors += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            xs, errors = sorted(self.samples), self.errors
+        if not xs:
+            return {"calls": 0, "errors": errors}
+        pct = lambda q: xs[min(len(xs) - 1, int(q * len(xs)))]
+        return {"calls": len(xs), "errors": errors,
+                "mean": round(sum(xs) / len(xs), 3), "p50": round(pct(0.50), 3),
+                "p95": round(pct(0.95), 3), "max": round(xs[-1], 3)}
+
+    def summary(self) -> str:
+        s = self.stats()
+        if not s["calls"]:
+            return "HTTP latency: no calls"
+        return (f"HTTP latency: {s['calls']} calls, mean {s['mean']:.2f}s, p50 {s['p50']:.2f}s, "
+                f"p95 {s['p95']:.2f}s, max {s['max']:.2f}s, {s['errors']} non-200/errors")
+
+
+class LLMBackend:
+    name = "base"
+    http = False   # True when calls go over the network (AsyncLLMClient drives those itself)
+
+    def chat(self, messages: list, max_tokens: int = 150, temperature: float = 0.3) -> str:
+        raise NotImplementedError
+
+
+# ── Live HTTP ─────────────────────────────────────────────────────────────────
+
+class OpenAIBackend(LLMBackend):
+    """
+    Chat-completions over HTTP. `retries` extra attempts after a 429 or a
+    transport error, with the linear waits the harnesses have always used
+    (10s × attempt on 429, 5s × attempt on errors), then "". With retries=0
+    a call is single-shot and transport errors propagate. Requests go
+    through the shared keep-alive session; `latency` records every call.
+    """
+    name = "openai"
+    http = True
+
+    def __init__(self, model: str, url: str = None, timeout: float = 30, retries: int = 0,
+                 connect_timeout: float = None):
+        self.model   = model
+        self.url     = url or os.environ.get("HARNESS_LLM_URL") or OPENAI_URL
+        self.timeout = timeout
+        self.retries = retries
+        self.connect_timeout = connect_timeout or CONNECT_TIMEOUT
+        self.latency = LatencyStats()
+
+    def headers(self) -> dict:
+        return {"Authorization": f"Bearer {openai_key(self.url)}", "Content-Type": "application/json"}
+
+    def payload(self, messages, max_tokens, temperature) -> dict:
+        return {"model": self.model, "messages": messages,
+                "max_tokens": max_tokens, "temperature": temperature}
+
+    def post(self, payload: dict):
+        start = time.perf_counter()
+        try:
+            r = http_session().post(self.url, headers=self.headers(), json=payload,
+                                    timeout=(self.connect_timeout, self.timeout))
+        except Exception:
+            self.latency.record(time.perf_counter() - start, ok=False)
+            raise
+        self.latency.record(time.perf_counter() - start, ok=r.status_code == 200)
+        return r
+
+    def chat(self, messages, max_tokens=150, temperature=0.3) -> str:
+        payload = self.payload(messages, max_tokens, temperature)
+        for attempt in range(self.retries + 1):
+            try:
+                r = self.post(payload)
+            except Exception as e:
+                if not self.retries:
+                    raise
+                wait = 5 * (attempt + 1)
+                log(f"  [LLM error attempt {attempt+1}: {type(e).__name__} — retry in {wait}s]")
+                time.sleep(wait)
+                continue
+            if r.status_code == 200:
+                return r.json()["choices"][0]["message"]["content"].strip()
+            if r.status_code == 429 and self.retries:
+                wait = 10 * (attempt + 1)
+                log(f"  [OpenAI 429 rate-limit — waiting {wait}s]")
+                time.sleep(wait)
+                continue
+            log(f"  [OpenAI {r.status_code}] {r.text[:200]}")
+            return ""
+        return ""
+
+
+# ── Local deterministic stand-in ──────────────────────────────────────────────
+
+_MODAL_RE   = re.compile(r'\b(must|shall|cannot|required|never|always|do not|may not|will not'
+                         r'|should|are not|is not|no)\b', re.IGNORECASE)
+_CLAUSE_RE  = re.compile(r'(?<=[.!?;])\s+')
+_WORD_RE    = re.compile(r"[a-z0-9$%']+")
+_STOP       = {"the", "a", "an", "to", "of", "and", "or", "be", "is", "are", "this", "that",
+               "it", "its", "by", "for", "in", "on", "at", "with", "so"}
+_SYNONYMS   = {"immediately": "at once", "verify": "check", "submit": "hand in",
+               "premises": "property", "proceeding": "continuing", "wear": "put on",
+               "complete": "finish", "comply": "conform", "authorization": "permission"}
+_NLI_RE     = re.compile(r'Does this sentence:\s*"(.*)"\s*logically entail this sentence:\s*"(.*)"\?',
+                         re.DOTALL)
+
+
+def _content_words(text: str) -> set:
+    return {w for w in _WORD_RE.findall(text.lower()) if w not in _STOP}
+
+
+def _entails(premise: str, hypothesis: str) -> bool:
+    p, h = _content_words(premise), _content_words(hypothesis)
+    return bool(h) and len(h & p) / len(h) >= 0.85
+
+
+class RuleBackend(LLMBackend):
+    """
+    Deterministic rule-based stand-in for the harness prompts.
+
+    Recognizes the paraphrase / summarize / extract / reconstruct / NLI
+    (single or JSON-batched) prompt shapes and answers with simple text rules (synonym swap, clause
+    pruning, modal-sentence extraction, content-word entailment). Anything
+    else gets the first sentence of the last user message. Same input, same
+    output — suitable for throughput, latency and regression tests, not for
+    scientific results.
+    """
+    name = "local"
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    def chat(self, messages, max_tokens=150, temperature=0.3) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        user = next((m["content"] for m in reversed(messages) if m["role"] == "user"), "")
+        head, _, body = user.partition("\n\n")
+        body = body.strip() or user.strip()
+
+        m = _NLI_RE.search(user)
+        if m:
+            return "yes" if _entails(m.group(1), m.group(2)) else "no"
+        if "JSON array" in head:
+            pairs = json.loads(body)
+            return json.dumps(["yes" if _entails(p["premise"], p["hypothesis"]) else "no"
+                               for p in pairs])
+        if head.startswith("Paraphrase"):
+            out = " ".join(_SYNONYMS.get(w.lower(), w) for w in body.split())
+        elif head.startswith("Summarize"):
+            clauses = _CLAUSE_RE.split(body)
+            out = clauses[0].rstrip(";,. ") + "."
+        elif head.startswith("Extract"):
+            kept = [c.rstrip(";, ") for c in _CLAUSE_RE.split(body) if _MODAL_RE.search(c)]
+            out = " ".join(kept) if kept else "[none]"
+        elif head.startswith("Reconstruct"):
+            lines = [ln.strip(" -*•") for ln in body.splitlines() if ln.strip(" -*•")]
+            out = " ".join(lines).rstrip(".") + "."
+        else:
+            out = _CLAUSE_RE.split(body)[0]
+        return " ".join(out.split()[:max_tokens])
+
+
+# ── Record / replay ───────────────────────────────────────────────────────────
+
+def _exchange_key(messages) -> tuple:
+    system = next((m["content"] for m in messages if m["role"] == "system"), "")
+    user   = next((m["content"] for m in reversed(messages) if m["role"] == "user"), "")
+    return system, user
+
+
+class ReplayBackend(LLMBackend):
+    """
+    Serves recorded responses keyed by (system, last user message), falling
+    back to the user message alone. Misses go to `fallback` (another backend)
+    or return "" — the same as a failed live call.
+    """
+    name = "replay"
+
+    def __init__(self, fallback: LLMBackend = None, latency: float = 0.0):
+        self.fallback = fallback
+        self.latency  = latency
+        self.exact    = {}
+        self.by_user  = {}
+        self.hits     = 0
+        self.misses   = 0
+
+    def add(self, system: str, user: str, response: str):
+        self.exact.setdefault((system, user), response)
+        self.by_user.setdefault(user, response)
+
+    def load_jsonl(self, path) -> "ReplayBackend":
+        """Load exchanges written by RecordingBackend."""
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    rec = json.loads(line)
+                    self.add(*_exchange_key(rec["messages"]), rec["response"])
+        return self
+
+    def chat(self, messages, max_tokens=150, temperature=0.3) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        system, user = _exchange_key(messages)
+        out = self.exact.get((system, user))
+        if out is None:
+            out = self.by_user.get(user)
+        if out is not None:
+            self.hits += 1
+            return out
+        self.misses += 1
+        return self.fallback.chat(messages, max_tokens, temperature) if self.fallback else ""
+
+
+class RecordingBackend(LLMBackend):
+    """Wraps a backend and appends every exchange to a JSONL file for replay."""
+
+    def __init__(self, inner: LLMBackend, path):
+        self.inner = inner
+        self.name  = inner.name
+        self.http  = inner.http
+        self.path  = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def __getattr__(self, attr):
+        return getattr(self.inner, attr)
+
+    def record(self, messages, max_tokens, temperature, response):
+        rec = {"model": getattr(self.inner, "model", None), "messages": messages,
+               "max_tokens": max_tokens, "temperature": temperature, "response": response}
+        with self._lock, self.path.open("a") as f:
+            f.write(json.dumps(rec) + "\n")
+
+    def chat(self, messages, max_tokens=150, temperature=0.3) -> str:
+        out = self.inner.chat(messages, max_tokens, temperature)
+        if out:
+            self.record(messages, max_tokens, temperature, out)
+        return out
+
+
+# ── Factory ───────────────────────────────────────────────────────────────────
+
+def is_recording(path) -> bool:
+    """True for a RecordingBackend file (first record has "messages")."""
+    if not str(path).endswith(".jsonl"):
+        return False
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                return "messages" in json.loads(line)
+    return True
+
+
+def make_backend(model: str, timeout: float = 30, retries: int = 0,
+                 run_exchanges=None) -> LLMBackend:
+    """
+    Backend selected by the HARNESS_* environment (see module docstring).
+    `run_exchanges(path)` lets a harness replay its own result files by
+    yielding (system, user, response) triples rebuilt from its prompts.
+    """
+    kind    = os.environ.get("HARNESS_LLM_BACKEND", "openai").lower()
+    latency = float(os.environ.get("HARNESS_LOCAL_LATENCY", "0"))
+    if kind == "openai":
+        backend = OpenAIBackend(model, timeout=timeout, retries=retries)
+    elif kind == "local":
+        backend = RuleBackend(latency=latency)
+    elif kind == "replay":
+        backend = ReplayBackend(fallback=RuleBackend(), latency=latency)
+        for path in filter(None, os.environ.get("HARNESS_REPLAY", "").split(",")):
+            if is_recording(path):
+                backend.load_jsonl(path)
+            elif run_exchanges is not None:
+                for system, user, response in run_exchanges(path):
+                    backend.add(system, user, response)
+            else:
+                raise ValueError(f"{path}: this harness can only replay recordings")
+    else:
+        raise ValueError(f"Unknown HARNESS_LLM_BACKEND {kind!r} (openai | local | replay)")
+
+    record = os.environ.get("HARNESS_RECORD")
+    return RecordingBackend(backend, record) if record else backend
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+llm_cache.py — Content-addressed response cache for harness LLM calls
+
+Every exchange is keyed by sha256 of (model, messages, temperature,
+max_tokens) and stored in a SQLite table, so identical calls — the canonical
+extraction repeated across EXP reruns, gate Step B/C prompts once the chain
+hits a fixpoint — can be served without another API request.
+
+Modes (HARNESS_LLM_CACHE)
+=========================
+  off    — no lookups, no writes (default).
+  fresh  — fresh sample: always call the model, store the result (latest
+           sample wins) so a later replay run can reuse it.
+  replay — deterministic replay: serve any cached response, call and store
+           on a miss. Reruns reproduce earlier outputs exactly.
+
+HARNESS_LLM_CACHE_PATH overrides the SQLite file location.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+MODES = ("replay", "fresh", "off")
+DEFAULT_PATH = Path(__file__).parent.parent / "experiments" / "llm_cache.sqlite"
+
+
+def _words(text: str) -> int:
+    return len(text.split())
+
+
+class ResponseCache:
+    """
+    Response cache for chat calls. `get` returns a stored response or None
+    (always None unless mode is "replay"); `put` stores a non-empty response
+    unless mode is "off". Savings are counted in words, the unit the harness
+    reports everywhere else: prompt plus completion for every hit.
+    """
+
+    def __init__(self, model: str, mode: str = "off", path=DEFAULT_PATH):
+        if mode not in MODES:
+            raise ValueError(f"Unknown HARNESS_LLM_CACHE mode {mode!r} ({' | '.join(MODES)})")
+        self.model  = model
+        self.mode   = mode
+        self.path   = Path(path)
+        self.hits   = 0
+        self.misses = 0
+        self.stored = 0
+        self.words_saved = 0
+        self._lock  = threading.Lock()
+        self._db    = None
+
+    @classmethod
+    def from_env(cls, model: str) -> "ResponseCache":
+        return cls(model,
+                   mode=os.environ.get("HARNESS_LLM_CACHE", "off").lower(),
+                   path=os.environ.get("HARNESS_LLM_CACHE_PATH") or DEFAULT_PATH)
+
+    def key(self, messages: list, temperature: float, max_tokens: int) -> str:
+        blob = json.dumps({"model": self.model, "messages": messages,
+                           "temperature": temperature, "max_tokens": max_tokens},
+                          sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _conn(self):
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS responses "
+                             "(key TEXT PRIMARY KEY, model TEXT, response TEXT NOT NULL)")
+            self._db.commit()
+        return self._db
+
+    def get(self, messages: list, temperature: float, max_tokens: int):
+        if self.mode != "replay":
+            return None
+        with self._lock:
+            row = self._conn().execute("SELECT response FROM responses WHERE key = ?",
+                                       (self.key(messages, temperature, max_tokens),)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.words_saved += sum(_words(m["content"]) for m in messages) + _words(row[0])
+            return row[0]
+
+    def put(self, messages: list, temperature: float, max_tokens: int, response: str):
+        if self.mode == "off" or not response:
+            return
+        with self._lock:
+            db = self._conn()
+            db.execute("INSERT OR REPLACE INTO responses (key, model, response) VALUES (?, ?, ?)",
+                       (self.key(messages, temperature, max_tokens), self.model, response))
+            db.commit()
+            self.stored += 1
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {"mode": self.mode, "hits": self.hits, "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                "stored": self.stored, "words_saved": self.words_saved}
+
+    def summary(self) -> str:
+        s = self.stats()
+        if s["mode"] == "off":
+            return "LLM cache: off"
+        if s["mode"] == "fresh":
+            return f"LLM cache (fresh): {s['stored']} responses stored for replay"
+        return (f"LLM cache (replay): {s['hits']}/{s['hits'] + s['misses']} hits "
+                f"({s['hit_rate']:.1%}), ~{s['words_saved']} words saved")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+llm_client.py — Async chat-completions client for the convergence harnesses
+
+Replaces fixed time.sleep() pacing with:
+  - a token-bucket limiter (requests/second with a burst allowance)
+  - a bounded concurrency pool (at most N requests in flight)
+  - exponential backoff with jitter, honouring 429 Retry-After
+
+HTTP calls run on the client's own thread pool, so chains that block on
+llm() from worker threads can never starve the transport. The client drives
+any llm_backends backend: HTTP backends get the retry/backoff treatment
+below, offline ones (local, replay) are simply called on the pool under the
+same rate limit and concurrency bound.
+"""
+
+import asyncio
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens/second, at most `capacity` banked."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate     = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens   = self.capacity
+        self.updated  = time.monotonic()
+        self._lock    = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens  = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, tokens: float = 1.0):
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+    def penalize(self, seconds: float):
+        """Drain the bucket so nobody fires for `seconds` (shared 429 cool-down)."""
+        self.tokens = min(self.tokens, -seconds * self.rate)
+
+
+def retry_after_seconds(headers, default: float) -> float:
+    """Parse a Retry-After header (delta-seconds or HTTP-date)."""
+    value = (headers or {}).get("Retry-After")
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
+class AsyncLLMClient:
+    """
+    Rate-limited, concurrency-bounded chat-completions client.
+
+    chat() returns the assistant text, or "" after a non-retryable status or
+    once retries are exhausted — the same contract as the blocking llm().
+    """
+
+    def __init__(self, backend, rate: float = 8.0, burst: float = None,
+                 max_concurrency: int = 8, max_retries: int = 5,
+                 backoff_base: float = 1.0, backoff_max: float = 60.0,
+                 log=print):
+        self.backend      = backend
+        self.bucket       = TokenBucket(rate, burst)
+        self.semaphore    = asyncio.Semaphore(max_concurrency)
+        self.max_retries  = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max  = backoff_max
+        self.log          = log
+        self._pool        = ThreadPoolExecutor(max_workers=max_concurrency,
+                                               thread_name_prefix="llm-http")
+        self.stats        = {"requests": 0, "retries": 0, "rate_limited": 0, "failed": 0}
+
+    def _backoff(self, attempt: int) -> float:
+        wait = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return wait * (0.5 + random.random() / 2)
+
+    async def chat(self, messages: list, max_tokens: int = 150, temperature: float = 0.3) -> str:
+        loop = asyncio.get_running_loop()
+        if not self.backend.http:
+            await self.bucket.acquire()
+            async with self.semaphore:
+                self.stats["requests"] += 1
+                return await loop.run_in_executor(
+                    self._pool, self.backend.chat, messages, max_tokens, temperature)
+        payload = self.backend.payload(messages, max_tokens, temperature)
+        for attempt in range(self.max_retries + 1):
+            await self.bucket.acquire()
+            try:
+                async with self.semaphore:
+                    self.stats["requests"] += 1
+                    r = await loop.run_in_executor(self._pool, self.backend.post, payload)
+            except Exception as e:
+                wait = self._backoff(attempt)
+                self.log(f"  [LLM error attempt {attempt+1}: {type(e).__name__} — retry in {wait:.1f}s]")
+                self.stats["retries"] += 1
+                await asyncio.sleep(wait)
+                continue
+            if r.status_code == 200:
+                out = r.json()["choices"][0]["message"]["content"].strip()
+                if hasattr(self.backend, "record"):
+                    self.backend.record(messages, max_tokens, temperature, out)
+                return out
+            if r.status_code == 429 or r.status_code >= 500:
+                wait = retry_after_seconds(r.headers, self._backoff(attempt))
+                if r.status_code == 429:
+                    self.stats["rate_limited"] += 1
+                    self.bucket.penalize(wait)
+                self.log(f"  [OpenAI {r.status_code} — waiting {wait:.1f}s]")
+                self.stats["retries"] += 1
+                await asyncio.sleep(wait)
+                continue
+            self.log(f"  [OpenAI {r.status_code}]")
+            self.stats["failed"] += 1
+            return ""
+        self.stats["failed"] += 1
+        return ""
+
+    def close(self):
+        self._pool.shutdown(wait=False)
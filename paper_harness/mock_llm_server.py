@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+mock_llm_server.py — Offline chat-completions endpoint for the harnesses
+
+Serves POST /v1/chat/completions in the OpenAI response format from a local
+backend (llm_backends.RuleBackend or ReplayBackend), so the unmodified HTTP
+path — AsyncLLMClient, retries, rate limiting — can be exercised without a
+key or network.
+
+Run:
+  python3 mock_llm_server.py --port 8089
+  python3 mock_llm_server.py --backend replay --replay ../experiments/EXP-005/run.json
+  python3 mock_llm_server.py --latency 0.4 --rate-limit-every 25 --retry-after 2
+
+Then point a harness at it:
+  HARNESS_LLM_URL=http://127.0.0.1:8089/v1/chat/completions python3 run_convergence_v2.py
+"""
+
+import argparse
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from llm_backends import ReplayBackend, RuleBackend, is_recording
+
+
+def build_backend(kind: str, replay_paths: list, latency: float):
+    if kind == "local":
+        return RuleBackend(latency=latency)
+    backend = ReplayBackend(fallback=RuleBackend(), latency=latency)
+    for path in replay_paths:
+        if is_recording(path):
+            backend.load_jsonl(path)
+        else:
+            # result-file replay needs the v2 prompt templates
+            from results_io import iter_signals
+            from run_convergence_v2 import replay_exchanges
+            for system, user, response in replay_exchanges(iter_signals(path)):
+                backend.add(system, user, response)
+    return backend
+
+
+def make_handler(backend, rate_limit_every: int = 0, retry_after: float = 1.0):
+    counter = itertools.count(1)
+    lock    = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, body: dict, headers: dict = None):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self):
+            if self.path.rstrip("/") not in ("/v1/chat/completions", "/chat/completions"):
+                self._send(404, {"error": {"message": f"unknown path {self.path}"}})
+                return
+            with lock:
+                n = next(counter)
+            if rate_limit_every and n % rate_limit_every == 0:
+                self._send(429, {"error": {"message": "rate limited (mock)", "type": "rate_limit"}},
+                           {"Retry-After": f"{retry_after:g}"})
+                return
+            try:
+                req = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                messages = req["messages"]
+            except (ValueError, KeyError) as e:
+                self._send(400, {"error": {"message": f"bad request: {e}"}})
+                return
+
+            content = backend.chat(messages, req.get("max_tokens", 150), req.get("temperature", 0.3))
+            prompt_tokens = sum(len(m.get("content", "").split()) for m in messages)
+            completion_tokens = len(content.split())
+            self._send(200, {
+                "id":      f"chatcmpl-mock-{n}",
+                "object":  "chat.completion",
+                "created": int(time.time()),
+                "model":   req.get("model", "mock"),
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": content}}],
+                "usage":   {"prompt_tokens": prompt_tokens,
+                            "completion_tokens": completion_tokens,
+                            "total_tokens": prompt_tokens + completion_tokens},
+            })
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Mock chat-completions server")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8089)
+    ap.add_argument("--backend", choices=["local", "replay"], default="local")
+    ap.add_argument("--replay", nargs="*", default=[], help="recordings or v2 run.jsonl/run.json files")
+    ap.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    ap.add_argument("--rate-limit-every", type=int, default=0, help="answer every Nth request with 429")
+    ap.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    args = ap.parse_args()
+
+    backend = build_backend(args.backend, args.replay, args.latency)
+    server  = ThreadingHTTPServer((args.host, args.port),
+                                  make_handler(backend, args.rate_limit_every, args.retry_after))
+    print(f"Mock LLM ({args.backend}) on http://{args.host}:{args.port}/v1/chat/completions", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if isinstance(backend, ReplayBackend):
+            print(f"replay hits={backend.hits} misses={backend.misses}")
+
+
+if __name__ == "__main__":
+    main()
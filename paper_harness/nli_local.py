@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+nli_local.py — Local cross-encoder NLI judge (CPU)
+
+Scores (premise, hypothesis) pairs with a Hugging Face MNLI cross-encoder
+instead of a remote yes/no prompt. A pair counts as entailed when
+Pr(entailment) > 0.85, the threshold of the paper's canonical equivalence
+relation (bidirectional NLI, Section 4.2).
+
+All pairs of a curve are scored in batched forward passes; probabilities are
+cached by text pair, so the canonical commitment is never re-scored against
+an output seen before.
+
+Model: $HARNESS_NLI_MODEL (default cross-encoder/nli-distilroberta-base).
+Any sequence-classification checkpoint with an "entailment" label works,
+e.g. roberta-large-mnli or microsoft/deberta-large-mnli.
+"""
+
+import os
+import threading
+
+DEFAULT_MODEL = "cross-encoder/nli-distilroberta-base"
+THRESHOLD     = 0.85
+
+
+class LocalNLI:
+    def __init__(self, model_name: str = None, threshold: float = THRESHOLD,
+                 batch_size: int = 32, device: str = "cpu"):
+        self.model_name = model_name or os.environ.get("HARNESS_NLI_MODEL", DEFAULT_MODEL)
+        self.threshold  = threshold
+        self.batch_size = batch_size
+        self.device     = device
+        self.cache      = {}
+        self.hits       = 0
+        self.scored     = 0
+        self._model     = None
+        self._lock      = threading.Lock()
+
+    def _load(self):
+        if self._model is None:
+            from transformers import AutoModelForSequenceClassification, AutoTokenizer
+            self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            self._model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+            self._model.to(self.device).eval()
+            labels = {i: l.lower() for i, l in self._model.config.id2label.items()}
+            matches = [i for i, l in labels.items() if l.startswith("entail")]
+            if not matches:
+                raise ValueError(f"{self.model_name} has no entailment label: {labels}")
+            self._entail = matches[0]
+        return self._model
+
+    def _score(self, chunk: list) -> list:
+        """Pr(entailment) for one batch of (premise, hypothesis) pairs."""
+        import torch
+        model = self._load()
+        enc = self._tokenizer([p for p, _ in chunk], [h for _, h in chunk],
+                              padding=True, truncation=True, return_tensors="pt")
+        with torch.no_grad():
+            logits = model(**enc.to(self.device)).logits
+        return logits.softmax(dim=-1)[:, self._entail].tolist()
+
+    def entailment_probs(self, pairs: list) -> list:
+        """Pr(premise entails hypothesis) for every pair, in order."""
+        with self._lock:
+            missing = list(dict.fromkeys(p for p in pairs if p not in self.cache))
+            self.hits += len(pairs) - len(missing)
+            for k in range(0, len(missing), self.batch_size):
+                chunk = missing[k:k + self.batch_size]
+                self.cache.update(zip(chunk, self._score(chunk)))
+            self.scored += len(missing)
+            return [self.cache[p] for p in pairs]
+
+    def entails(self, pairs: list) -> list:
+        """Entailment verdicts at Pr > threshold."""
+        return [p > self.threshold for p in self.entailment_probs(pairs)]
+
+    def summary(self) -> str:
+        return f"Local NLI ({self.model_name}): {self.scored} pairs scored, {self.hits} cached"
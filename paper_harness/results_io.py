@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+results_io.py — Streaming JSONL result files for the convergence harnesses
+
+Results are written one record per (signal, condition, iteration), one JSON
+object per line, as each signal finishes — nothing is held back for a final
+json.dumps(indent=2). Readers stream the file back and rebuild one signal at
+a time, so memory stays flat in corpus size and iteration count.
+
+Records
+=======
+Every record carries "signal", "category", "condition" and "i".
+
+  run_convergence_v2 (EXP-NNN/run.jsonl)
+    condition "signal", i 0 — canonical, origin_c, citation, and "curves":
+                              the curve keys the signal had
+    condition <name>, i ≥ 1 — one turn of baseline / compression / gate /
+                              anchor_gate / escalation_gate with its Jaccard
+                              "stability" and "nli_stability" side by side;
+                              the output text is stored once for both
+
+  run_convergence (runs/<date>/convergence_full_<ts>.jsonl)
+    condition "signal", i 0       — citation
+    condition <cond label>, i 0   — label, n_turns, n_anchor, enforce
+    condition <cond label>, i ≥ 1 — one turn ("turn" == i)
+
+iter_signals() rebuilds the nested per-signal dicts the harnesses have always
+produced (totals, trajectories and retention rates are recomputed for
+run_convergence). Legacy run.json / convergence_full_*.json files are read
+through the same functions.
+"""
+
+import json
+from pathlib import Path
+
+CHAINS = ("baseline", "compression", "gate", "anchor_gate", "escalation_gate")
+
+
+# ── Writing ───────────────────────────────────────────────────────────────────
+
+def _v2_records(r: dict):
+    base = {"signal": r["signal"], "category": r["category"]}
+    curves = [k for k in r if k in CHAINS or (k.endswith("_nli") and k[:-4] in CHAINS)]
+    head = dict(base, condition="signal", i=0, origin_c=r.get("origin_c", []),
+                citation=r.get("citation"), curves=curves)
+    if "canonical" in r:
+        head["canonical"] = r["canonical"]
+    yield head
+    for cond in CHAINS:
+        turns = {}
+        for p in r.get(cond, []):
+            turns[p["i"]] = dict(base, condition=cond, **p)
+        for p in r.get(f"{cond}_nli", []):
+            rec = turns.setdefault(p["i"], dict(base, condition=cond, i=p["i"],
+                                                tokens=p["tokens"], output=p["output"]))
+            rec["nli_stability"] = p["nli_stability"]
+        for i in sorted(turns):
+            yield turns[i]
+
+
+def _v1_records(r: dict):
+    base = {"signal": r["signal"], "category": r["category"]}
+    yield dict(base, condition="signal", i=0, citation=r.get("citation"))
+    for c in r["conditions"]:
+        label = f"{'enf' if c['enforce'] else 'base'}_{c['label']}_t{c['n_turns']}"
+        yield dict(base, condition=label, i=0, label=c["label"], n_turns=c["n_turns"],
+                   n_anchor=c["result"].get("n_anchor"), enforce=c["enforce"])
+        for t in c["result"]["turns"]:
+            yield dict(base, condition=label, i=t["turn"], **t)
+
+
+def signal_records(result: dict):
+    """Records for one signal result (either harness's schema)."""
+    return _v1_records(result) if "conditions" in result else _v2_records(result)
+
+
+class ResultWriter:
+    """
+    Appends each finished signal's records to a JSONL file and flushes. The
+    file (and its directory) is created by the first write, or by close()
+    for a run with no signals.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._f = None
+        self.signals = 0
+
+    def _open(self):
+        if self._f is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._f = self.path.open("w")
+        return self._f
+
+    def write(self, result: dict):
+        f = self._open()
+        for rec in signal_records(result):
+            f.write(json.dumps(rec) + "\n")
+        f.flush()
+        self.signals += 1
+
+    def close(self):
+        self._open().close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        # a run that fails before its first signal leaves no file behind
+        if self._f is not None or exc_type is None:
+            self.close()
+
+
+# ── Reading ───────────────────────────────────────────────────────────────────
+
+def iter_records(path):
+    """Lazily yield records from a .jsonl result file (or a legacy .json)."""
+    path = Path(path)
+    if path.suffix == ".jsonl":
+        with path.open() as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        for r in json.loads(path.read_text()):
+            yield from signal_records(r)
+
+
+def _v2_signal(head: dict) -> dict:
+    r = {"category": head["category"], "signal": head["signal"]}
+    if "canonical" in head:
+        r["canonical"] = head["canonical"]
+    r["origin_c"] = head["origin_c"]
+    for k in head["curves"]:
+        r[k] = []
+    r["citation"] = head["citation"]
+    return r
+
+
+def _v2_add(r: dict, rec: dict):
+    cond, extra = rec["condition"], {"inferred": True} if rec.get("inferred") else {}
+    if "stability" in rec:
+        r.setdefault(cond, []).append(dict({"i": rec["i"], "stability": rec["stability"],
+                                            "tokens": rec["tokens"], "output": rec["output"]}, **extra))
+    if "nli_stability" in rec:
+        r.setdefault(f"{cond}_nli", []).append(dict({"i": rec["i"], "nli_stability": rec["nli_stability"],
+                                                     "tokens": rec["tokens"], "output": rec["output"]}, **extra))
+
+
+def _v1_finish(r: dict):
+    for c in r["conditions"]:
+        res = c["result"]
+        turns = res["turns"]
+        res["total_tokens"] = sum(t["total"] for t in turns)
+        res["trajectory"] = [t["total"] for t in turns]
+        k_rate = sum(1 for t in turns if t["kernel_in_out"]) / len(turns) if turns else 0
+        res["kernel_retention_rate"] = round(k_rate, 3)
+        res["citation"] = r["citation"]
+    return r
+
+
+def iter_signals(path):
+    """
+    Lazily yield one nested signal dict at a time, in file order, in the
+    schema the writing harness uses for run.json / convergence_full_*.json.
+    """
+    current, v1, conds = None, False, {}
+    for rec in iter_records(path):
+        if rec["condition"] == "signal":
+            if current is not None:
+                yield _v1_finish(current) if v1 else current
+            v1 = "curves" not in rec
+            conds = {}
+            current = ({"category": rec["category"], "signal": rec["signal"],
+                        "citation": rec["citation"], "conditions": []}
+                       if v1 else _v2_signal(rec))
+        elif v1 and rec["i"] == 0:
+            cond = {"label": rec["label"], "n_turns": rec["n_turns"], "enforce": rec["enforce"],
+                    "result": {"n_turns": rec["n_turns"], "n_anchor": rec["n_anchor"],
+                               "enforce": rec["enforce"], "turns": []}}
+            conds[rec["condition"]] = cond
+            current["conditions"].append(cond)
+        elif v1:
+            turn = {k: v for k, v in rec.items()
+                    if k not in ("signal", "category", "condition", "i")}
+            conds[rec["condition"]]["result"]["turns"].append(turn)
+        else:
+            _v2_add(current, rec)
+    if current is not None:
+        yield _v1_finish(current) if v1 else current
+
+
+class ResultFile:
+    """Re-iterable view of a result file: each pass streams it from disk."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def __iter__(self):
+        return iter_signals(self.path)
+
+    def records(self):
+        return iter_records(self.path)
+
+
+def find_run(exp_dir) -> Path:
+    """run.jsonl in an EXP directory, falling back to a legacy run.json."""
+    exp_dir = Path(exp_dir)
+    for name in ("run.jsonl", "run.json"):
+        if (exp_dir / name).exists():
+            return exp_dir / name
+    raise FileNotFoundError(f"No run.jsonl or run.json in {exp_dir}")
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+results_table.py — Columnar export of every experiment's turn records
+
+Flattens each EXP-NNN/run.jsonl (or legacy run.json) under an experiments
+directory into one long table, one row per (experiment, signal, condition,
+iteration):
+
+    experiment, signal, category, condition, i, stability, nli_stability, tokens
+
+and stores it next to the experiments as results.parquet (results.csv.gz when
+neither pyarrow nor fastparquet is installed). Figures and summaries then
+load only the columns they need and select with pandas instead of re-parsing
+every run file, and the table is rebuilt automatically when any run file is
+newer than it.
+
+run_convergence (v1) result files flatten the same way: the condition is the
+condition label, tokens is the turn total, and the stability columns are
+empty.
+
+Run:
+  python3 results_table.py                      # ../experiments/results.parquet
+  python3 results_table.py --experiments DIR --out table.parquet
+"""
+
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+from results_io import find_run, iter_records
+
+COLUMNS = ["experiment", "signal", "category", "condition", "i",
+           "stability", "nli_stability", "tokens"]
+DTYPES = {"experiment": "category", "signal": "string", "category": "category",
+          "condition": "category", "i": "int16", "stability": "float32",
+          "nli_stability": "float32", "tokens": "int32"}
+DEFAULT_DIR = Path(__file__).parent.parent / "experiments"
+
+
+def flatten(path, experiment: str = ""):
+    """Yield one flat row per turn record of a result file."""
+    for rec in iter_records(path):
+        if rec["condition"] == "signal" or rec["i"] == 0:
+            continue
+        yield {"experiment": experiment,
+               "signal":        rec["signal"],
+               "category":      rec["category"],
+               "condition":     rec["condition"],
+               "i":             rec["i"],
+               "stability":     rec.get("stability"),
+               "nli_stability": rec.get("nli_stability"),
+               "tokens":        rec["tokens"] if "tokens" in rec else rec.get("total")}
+
+
+def run_files(experiments_dir=DEFAULT_DIR) -> dict:
+    """{experiment name: run file} for every EXP-* directory with results."""
+    files = {}
+    for exp_dir in sorted(Path(experiments_dir).glob("EXP-*")):
+        try:
+            files[exp_dir.name] = find_run(exp_dir)
+        except FileNotFoundError:
+            continue
+    return files
+
+
+def build_table(experiments_dir=DEFAULT_DIR) -> pd.DataFrame:
+    rows = [row for name, path in run_files(experiments_dir).items()
+            for row in flatten(path, name)]
+    return pd.DataFrame(rows, columns=COLUMNS).astype(DTYPES)
+
+
+def _parquet_engine():
+    for engine in ("pyarrow", "fastparquet"):
+        try:
+            __import__(engine)
+            return engine
+        except ImportError:
+            continue
+    return None
+
+
+def default_path(experiments_dir=DEFAULT_DIR) -> Path:
+    name = "results.parquet" if _parquet_engine() else "results.csv.gz"
+    return Path(experiments_dir) / name
+
+
+def write_table(df: pd.DataFrame, path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".parquet":
+        df.to_parquet(path, index=False, engine=_parquet_engine())
+    else:
+        df.to_csv(path, index=False)
+    return path
+
+
+def is_stale(path, experiments_dir=DEFAULT_DIR) -> bool:
+    path = Path(path)
+    if not path.exists():
+        return True
+    built = path.stat().st_mtime
+    return any(f.stat().st_mtime > built for f in run_files(experiments_dir).values())
+
+
+def load_table(experiments_dir=DEFAULT_DIR, columns: list = None, path=None) -> pd.DataFrame:
+    """
+    The results table, reading only `columns` (default: all). Built — or
+    rebuilt, if a run file changed since — on first use.
+    """
+    path = Path(path) if path else default_path(experiments_dir)
+    if is_stale(path, experiments_dir):
+        write_table(build_table(experiments_dir), path)
+    columns = list(columns) if columns else COLUMNS
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path, columns=columns, engine=_parquet_engine())
+    # CSV carries no types: read back exactly what build_table produced
+    return pd.read_csv(path, usecols=columns,
+                       dtype={c: DTYPES[c] for c in columns})[columns]
+
+
+def at_iteration(df: pd.DataFrame, experiment: str, conditions: list,
+                 i: int = 10, value: str = "nli_stability") -> pd.DataFrame:
+    """signal × condition matrix of `value` at iteration i, signals in run order."""
+    sel = df[(df["experiment"] == experiment) & (df["i"] == i)
+             & df["condition"].isin(conditions)]
+    order = pd.unique(sel["signal"])
+    wide = sel.pivot_table(index="signal", columns="condition", values=value,
+                           aggfunc="first", observed=True)
+    return wide.reindex(index=order, columns=conditions)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Export experiment results as a columnar table")
+    ap.add_argument("--experiments", default=str(DEFAULT_DIR), help="directory of EXP-* runs")
+    ap.add_argument("--out", help="output .parquet or .csv[.gz] (default: next to the runs)")
+    args = ap.parse_args()
+
+    df = build_table(args.experiments)
+    out = write_table(df, args.out or default_path(args.experiments))
+    print(f"{len(df)} rows from {df['experiment'].nunique()} experiments → {out}")
+
+
+if __name__ == "__main__":
+    main()
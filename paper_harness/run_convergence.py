@@ -27,12 +27,15 @@ Owner:               Deric J. McHenry / Ello Cello LLC
 """
 
 import json
+import os
 import re
 import time
 from pathlib import Path
 from datetime import datetime
 
-import requests
+from journal import RunJournal
+from llm_backends import make_backend
+from results_io import ResultFile, ResultWriter
 
 # ── Citations ────────────────────────────────────────────────────────────────
 
@@ -46,17 +49,18 @@ CITATION = {
 
 # ── Config ────────────────────────────────────────────────────────────────────
 
-OPENAI_KEY   = (Path.home() / ".hange/openai_api_key").read_text().strip()
-OPENAI_URL   = "https://api.openai.com/v1/chat/completions"
-OPENAI_MODEL = "gpt-4o-mini"
+OPENAI_MODEL = "gpt-4o-mini"   # key/URL/backend: see llm_backends.py (HARNESS_LLM_BACKEND)
+BACKEND      = make_backend(OPENAI_MODEL, timeout=30)
 
 CORPUS_PATH  = Path(__file__).parent.parent / "corpus/canonical_corpus.json"
 RUNS_DIR     = Path(__file__).parent.parent / "runs" / datetime.now().strftime("%Y-%m-%d")
-RUNS_DIR.mkdir(parents=True, exist_ok=True)
 
 TURNS_STANDARD = 8
 TURNS_DOUBLE   = 16
 
+# RunJournal while run() is active (resume with HARNESS_RESUME=<journal path>)
+JOURNAL = None
+
 HARD_MODALS = re.compile(
     r'\b(must|shall|cannot|required|never|always|will not|are required to|do not)\b',
     re.IGNORECASE
@@ -65,16 +69,8 @@ HARD_MODALS = re.compile(
 # ── LLM calls ────────────────────────────────────────────────────────────────
 
 def llm(system: str, messages: list, max_tokens: int = 200) -> str:
-    r = requests.post(OPENAI_URL,
-        headers={"Authorization": f"Bearer {OPENAI_KEY}", "Content-Type": "application/json"},
-        json={"model": OPENAI_MODEL,
-              "messages": [{"role": "system", "content": system}] + messages,
-              "max_tokens": max_tokens, "temperature": 0.7},
-        timeout=30)
-    if r.status_code == 200:
-        return r.json()["choices"][0]["message"]["content"].strip()
-    print(f"  OpenAI error: {r.status_code}")
-    return ""
+    return BACKEND.chat([{"role": "system", "content": system}] + messages,
+                        max_tokens=max_tokens, temperature=0.7)
 
 def tokens(text: str) -> int:
     return len(text.split())
@@ -107,13 +103,15 @@ SYS_AI_ENFD = (
 )
 # ── Core turn runner ──────────────────────────────────────────────────────────
 
-def run_condition(signal: str, n_turns: int, n_anchor: int, enforce: bool) -> dict:
+def run_condition(signal: str, n_turns: int, n_anchor: int, enforce: bool,
+                  label: str = None) -> dict:
     """
     Run one condition.
     n_anchor: how many turns use the original signal as input (anchor turns).
               'all' = n_turns, 'half' = n_turns//2, 'two' = 2, 'one' = 1
     After n_anchor turns, cascade: AI output feeds directly back as next input.
     Replicates hand-logged methodology from foundational/origin_test.md.
+    label: journal key of the condition; journaled turns are replayed, not re-called.
     """
     sys_ai = SYS_AI_ENFD if enforce else SYS_AI_BASE
     kernel = extract_kernel(signal)
@@ -147,6 +145,12 @@ def run_condition(signal: str, n_turns: int, n_anchor: int, enforce: bool) -> di
 
         # ── AI responds ───────────────────────────────────────────────────────
         history.append({"role": "user", "content": final_prompt})
+        done = JOURNAL.get(signal, label, turn_num) if JOURNAL and label else None
+        if done is not None:
+            turns.append(done)
+            history.append({"role": "assistant", "content": done["output"]})
+            log(f"    T{turn_num:02d} (journal) total={done['total']:3d}")
+            continue
         response = llm(effective_sys, history[-6:], max_tokens=150)
         if not response:
             break
@@ -166,6 +170,8 @@ def run_condition(signal: str, n_turns: int, n_anchor: int, enforce: bool) -> di
             "injected":      injected,
             "kernel_in_out": k_in_output,
         })
+        if JOURNAL and label:
+            JOURNAL.put(signal, label, turn_num, turns[-1])
 
         src = "A" if is_anchor_turn else "C"
         inj = "↑K" if injected else "  "
@@ -291,6 +297,7 @@ def generate_report(all_results: list, ts: str) -> str:
 # ── Main ──────────────────────────────────────────────────────────────────────
 
 def run():
+    global JOURNAL
     corpus  = json.loads(CORPUS_PATH.read_text())
     signals = corpus["canonical_signals"]
 
@@ -304,7 +311,26 @@ def run():
     log(f"Signals: {len(signals)} | Standard turns: {TURNS_STANDARD} | Double turns: {TURNS_DOUBLE}")
     log(f"Citing: {CITATION['doi']}\n")
 
-    all_results = []
+    # Per-turn journal next to the outputs; HARNESS_RESUME=<journal path>
+    # continues an interrupted run in the run directory and with the file
+    # timestamp recorded in the journal, whatever day it is resumed on.
+    resume = os.environ.get("HARNESS_RESUME")
+    if resume:
+        journal_path = Path(resume)
+        if not journal_path.exists():
+            raise FileNotFoundError(f"HARNESS_RESUME: no journal {resume}")
+        JOURNAL = RunJournal(journal_path, meta={"run_dir": str(journal_path.parent.resolve()),
+                                                 "file_ts": journal_path.stem.rsplit("_", 1)[-1]})
+    else:
+        file_ts = datetime.now().strftime("%H%M%S")
+        JOURNAL = RunJournal(RUNS_DIR / f"convergence_journal_{file_ts}.jsonl",
+                             meta={"run_dir": str(RUNS_DIR), "file_ts": file_ts})
+    out_dir, file_ts = Path(JOURNAL.meta["run_dir"]), JOURNAL.meta["file_ts"]
+    log(f"Journal: {JOURNAL.path}" + (f" (resuming, {JOURNAL.loaded} turns)" if resume else ""))
+
+    # Results stream to convergence_full_<ts>.jsonl one signal at a time
+    out_json = out_dir / f"convergence_full_{file_ts}.jsonl"
+    writer   = ResultWriter(out_json)
 
     for sig in signals:
         category    = sig.get("category", "?")
@@ -325,7 +351,7 @@ def run():
                 for enforce in [False, True]:
                     cond_label = f"{'enf' if enforce else 'base'}_{label}_t{n_turns}"
                     log(f"\n  [{cond_label}]")
-                    result = run_condition(signal_text, n_turns, n_anchor, enforce)
+                    result = run_condition(signal_text, n_turns, n_anchor, enforce, cond_label)
                     signal_result["conditions"].append({
                         "label":   label,
                         "n_turns": n_turns,
@@ -334,19 +360,21 @@ def run():
                     })
                     time.sleep(1)
 
-        all_results.append(signal_result)
+        writer.write(signal_result)
 
-    # Save full JSON
-    file_ts  = datetime.now().strftime("%H%M%S")
-    out_json = RUNS_DIR / f"convergence_full_{file_ts}.json"
-    out_json.write_text(json.dumps(all_results, indent=2))
+    writer.close()
     log(f"\nResults saved: {out_json}")
 
     # Generate and save Markdown report
-    report      = generate_report(all_results, ts)
-    out_report  = RUNS_DIR / f"convergence_report_{file_ts}.md"
+    report      = generate_report(ResultFile(out_json), ts)
+    out_report  = out_dir / f"convergence_report_{file_ts}.md"
     out_report.write_text(report)
     log(f"Report saved:  {out_report}")
+    log(f"{JOURNAL.summary()} — compacted into {out_json.name}")
+    JOURNAL.compact()
+    JOURNAL = None
+    if BACKEND.http:
+        log(BACKEND.latency.summary())
     log("\n--- REPORT PREVIEW ---")
     log(report[:1200])
 
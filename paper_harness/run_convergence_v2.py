@@ -20,13 +20,23 @@ GitHub:  github.com/SunrisesIllNeverSee/commitment-conservation
 Owner:   Deric J. McHenry / Ello Cello LLC
 """
 
+import asyncio
+import hashlib
 import json
+import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
-import requests
+from llm_backends import http_session, make_backend
+from llm_cache import ResponseCache
+from journal import RunJournal
+from llm_client import AsyncLLMClient
+from results_io import ResultFile, ResultWriter, iter_signals
+from stability_engine import stability_table
 
 # ── Citations ─────────────────────────────────────────────────────────────────
 
@@ -40,13 +50,50 @@ CITATION = {
 
 # ── Config ────────────────────────────────────────────────────────────────────
 
-OPENAI_KEY   = (Path.home() / ".hange/openai_api_key").read_text().strip()
-OPENAI_URL   = "https://api.openai.com/v1/chat/completions"
-OPENAI_MODEL = "gpt-4o-mini"
+OPENAI_MODEL = "gpt-4o-mini"   # key/URL/backend: see llm_backends.py (HARNESS_LLM_BACKEND)
 
 CORPUS_PATH  = Path(__file__).parent.parent / "corpus/canonical_corpus.json"
 EXPERIMENTS_DIR = Path(__file__).parent.parent / "experiments"
 
+# ── Prompts ───────────────────────────────────────────────────────────────────
+
+SYS_PARAPHRASE = "You are a helpful assistant. Respond in one to two sentences."
+SYS_COMPRESS   = "You are a helpful assistant. Be as concise as possible."
+SYS_STEP_A     = "You are a helpful assistant. Be concise."
+SYS_STEP_B = (
+    "You are a commitment extractor. "
+    "Extract the full binding obligation exactly as stated — keep ALL obligation-bearing content: "
+    "modal words (must/shall/required/cannot/never/always/do not), "
+    "the subject, the action and its object, "
+    "any qualifying conditions (if/unless/before/when clauses), "
+    "any frequency quantifiers (always, never, all), "
+    "any temporal constraints (immediately, by Friday, prior to). "
+    "Remove only conversational filler. Do not summarize or generalize. "
+    "If no binding obligation exists, output exactly: [none]"
+)
+SYS_STEP_C = (
+    "You are a minimal statement reconstructor. "
+    "Write the shortest complete sentence that preserves ALL the binding obligations listed. "
+    "Do not add anything not in the list."
+)
+SYS_NLI = (
+    "You are a strict natural language inference judge. "
+    "Answer only 'yes' or 'no'. Nothing else."
+)
+SYS_NLI_BATCH = (
+    "You are a strict natural language inference judge. "
+    "Answer only with a JSON array of 'yes'/'no' strings. Nothing else."
+)
+
+PARAPHRASE_PROMPT  = "Paraphrase this sentence while preserving meaning:\n\n{}"
+SUMMARIZE_PROMPT   = "Summarize this sentence as concisely as possible:\n\n{}"
+EXTRACT_PROMPT     = "Extract the commitment from:\n\n{}"
+RECONSTRUCT_PROMPT = "Reconstruct a minimal commitment statement from these elements:\n\n{}"
+NLI_PROMPT         = "Does this sentence:\n\"{}\"\n\nlogically entail this sentence:\n\"{}\"?"
+NLI_BATCH_PROMPT   = ("For each pair below, does the premise logically entail the hypothesis?\n"
+                      "Return a JSON array of exactly {} items, each \"yes\" or \"no\", in pair order."
+                      "\n\n{}")
+
 # EXP-005: anchor-preserving Step A and escalation-control Step B
 EXP005 = False  # EXP-006: standard 3-condition run (Baseline, Compression, Gate)
 
@@ -72,16 +119,40 @@ ESCALATION_STEP_B = (
 )
 
 def next_exp_dir() -> Path:
-    """Auto-increment EXP-NNN directory under experiments/."""
+    """
+    Next EXP-NNN directory under experiments/. Not created here: the journal
+    and result writer create it with their first record. An empty trailing
+    EXP directory (a run that died before writing anything) is reused.
+    """
     existing = sorted(EXPERIMENTS_DIR.glob("EXP-[0-9][0-9][0-9]"))
+    if existing and not any(existing[-1].iterdir()):
+        return existing[-1]
     n = int(existing[-1].name.split("-")[1]) + 1 if existing else 1
-    d = EXPERIMENTS_DIR / f"EXP-{n:03d}"
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+    return EXPERIMENTS_DIR / f"EXP-{n:03d}"
 
 N_ITERATIONS = 10
 SMOKE        = False  # set False for full 20-signal run
 
+# Async scheduling (llm_client.py). 0 = legacy sequential run with fixed sleeps.
+# >0 = signals and conditions run in parallel, at most this many requests in
+# flight, paced by a token bucket instead of sleeps. Each chain stays in order.
+MAX_CONCURRENCY = int(os.environ.get("HARNESS_CONCURRENCY", "0"))
+RATE_LIMIT_RPS  = float(os.environ.get("HARNESS_RATE_LIMIT_RPS", "8"))
+
+# NLI pairs judged per request (nli_check_batch). 0 or 1 = one call per pair.
+NLI_BATCH_SIZE = int(os.environ.get("HARNESS_NLI_BATCH", "20"))
+
+# NLI judge for nli_stability_curve: "llm" (gpt yes/no) or "local" (nli_local.py
+# MNLI cross-encoder on CPU, entailment at Pr > 0.85).
+NLI_JUDGE = os.environ.get("HARNESS_NLI", "llm").lower()
+_LOCAL_NLI = None
+
+# Fixpoint/cycle early exit for the compression and gate chains: "exact"
+# (byte-identical input, so the skipped calls would have been served the same
+# prompt), "normalized" (case/punctuation/whitespace-insensitive; opt-in, it
+# also treats near-identical inputs as repeats), or "off".
+FIXPOINT_MODE = os.environ.get("HARNESS_FIXPOINT", "exact").lower()
+
 HARD_MODALS = re.compile(
     r'\b(must|shall|cannot|required|never|always|will not|are required to'
     r'|do not|shall not|must not|is required|are not|may not)\b',
@@ -103,31 +174,60 @@ COMMITMENT_CONTENT = re.compile(
 
 # ── LLM ──────────────────────────────────────────────────────────────────────
 
+# (client, loop) while run_async() is active; chain code calling llm() from
+# worker threads is routed through the async client.
+_ASYNC = None
+
+# RunJournal while run() is active: completed (signal, condition, i) units are
+# appended as they finish and replayed instead of re-called on resume.
+JOURNAL = None
+
+
+def resumed(signal: str, condition: str, i: int):
+    """Journaled record for a unit, or None if it still has to run."""
+    return JOURNAL.get(signal, condition, i) if JOURNAL is not None else None
+
+
+def journal(signal: str, condition: str, i: int, record: dict):
+    if JOURNAL is not None:
+        JOURNAL.put(signal, condition, i, record)
+
+
 def llm(system: str, prompt: str, max_tokens: int = 150) -> str:
-    for attempt in range(3):
-        try:
-            r = requests.post(OPENAI_URL,
-                headers={"Authorization": f"Bearer {OPENAI_KEY}", "Content-Type": "application/json"},
-                json={"model":       OPENAI_MODEL,
-                      "messages":    [{"role": "system",  "content": system},
-                                      {"role": "user",    "content": prompt}],
-                      "max_tokens":  max_tokens,
-                      "temperature": 0.3},
-                timeout=30)
-            if r.status_code == 200:
-                return r.json()["choices"][0]["message"]["content"].strip()
-            if r.status_code == 429:
-                wait = 10 * (attempt + 1)
-                print(f"  [OpenAI 429 rate-limit — waiting {wait}s]", flush=True)
-                time.sleep(wait)
-                continue
-            print(f"  [OpenAI {r.status_code}]", flush=True)
-            return ""
-        except Exception as e:
-            wait = 5 * (attempt + 1)
-            print(f"  [LLM error attempt {attempt+1}: {type(e).__name__} — retry in {wait}s]", flush=True)
-            time.sleep(wait)
-    return ""
+    messages = [{"role": "system", "content": system},
+                {"role": "user",   "content": prompt}]
+    cached = CACHE.get(messages, 0.3, max_tokens)
+    if cached is not None:
+        return cached
+    if _ASYNC is not None:
+        client, loop = _ASYNC
+        out = asyncio.run_coroutine_threadsafe(
+            client.chat(messages, max_tokens=max_tokens, temperature=0.3), loop).result()
+    else:
+        out = BACKEND.chat(messages, max_tokens=max_tokens, temperature=0.3)
+    CACHE.put(messages, 0.3, max_tokens, out)
+    return out
+
+def pause(seconds: float):
+    """
+    Fixed pacing for the sequential run against a live API; the async
+    client's limiter replaces it, and offline backends need none.
+    """
+    if _ASYNC is None and BACKEND.http:
+        time.sleep(seconds)
+
+
+def in_parallel(*calls) -> list:
+    """
+    Run independent (fn, *args) calls concurrently under run_async(),
+    sequentially otherwise. Results come back in call order.
+    """
+    if _ASYNC is None or len(calls) < 2:
+        return [fn(*args) for fn, *args in calls]
+    tag = getattr(_LOG_TAG, "tag", None)
+    with ThreadPoolExecutor(max_workers=len(calls)) as ex:
+        futures = [ex.submit(tagged, tag, fn, *args) for fn, *args in calls]
+        return [f.result() for f in futures]
 
 # ── Metrics ───────────────────────────────────────────────────────────────────
 
@@ -163,21 +263,94 @@ def jaccard(a: set, b: set) -> float:
 def wc(text: str) -> int:
     return len(text.split())
 
-def log(msg): print(msg, flush=True)
+# Per-thread log tag. Under run_async() every line a signal's chains print
+# carries "[<category>] " so interleaved output can be told apart.
+_LOG_TAG = threading.local()
+
+
+def log(msg):
+    tag = getattr(_LOG_TAG, "tag", None)
+    if tag:
+        msg = "\n".join(f"[{tag}] {line}" if line else line for line in msg.split("\n"))
+    print(msg, flush=True)
+
+
+def tagged(tag, fn, *args):
+    """Call fn(*args) with this thread's log lines tagged `tag`."""
+    prev, _LOG_TAG.tag = getattr(_LOG_TAG, "tag", None), tag
+    try:
+        return fn(*args)
+    finally:
+        _LOG_TAG.tag = prev
 
 # ── NLI Semantic Equivalence ──────────────────────────────────────────────────
 
 def nli_check(premise: str, hypothesis: str) -> bool:
     """Ask GPT: does premise entail hypothesis? Returns True/False."""
-    result = llm(
-        "You are a strict natural language inference judge. "
-        "Answer only 'yes' or 'no'. Nothing else.",
-        f"Does this sentence:\n\"{premise}\"\n\nlogically entail this sentence:\n\"{hypothesis}\"?",
-        max_tokens=5
-    )
+    result = llm(SYS_NLI, NLI_PROMPT.format(premise, hypothesis), max_tokens=5)
     return result.strip().lower().startswith("y")
 
 
+def parse_verdicts(text: str, n: int):
+    """
+    Parse a JSON array of n yes/no verdicts (strings or booleans), tolerating
+    code fences and surrounding prose. None if malformed or the count is off.
+    """
+    start, end = text.find("["), text.rfind("]")
+    if start < 0 or end < start:
+        return None
+    try:
+        items = json.loads(text[start:end + 1])
+    except ValueError:
+        return None
+    if not isinstance(items, list) or len(items) != n:
+        return None
+    verdicts = []
+    for item in items:
+        if isinstance(item, bool):
+            verdicts.append(item)
+        elif isinstance(item, str) and item.strip().lower()[:1] in ("y", "n"):
+            verdicts.append(item.strip().lower().startswith("y"))
+        else:
+            return None
+    return verdicts
+
+
+def nli_batches(pairs: list):
+    """Yield (chunk, prompt) for every NLI_BATCH_SIZE slice of pairs."""
+    for k in range(0, len(pairs), NLI_BATCH_SIZE):
+        chunk = pairs[k:k + NLI_BATCH_SIZE]
+        body = json.dumps([{"premise": p, "hypothesis": h} for p, h in chunk],
+                          indent=1, ensure_ascii=False)
+        yield chunk, NLI_BATCH_PROMPT.format(len(chunk), body)
+
+
+def nli_pairs(outputs: list, canonical: str) -> list:
+    """Forward and backward (premise, hypothesis) pairs for every output."""
+    return [pair for out in outputs
+            for pair in ((canonical, out), (out, canonical))]
+
+
+def nli_check_batch(pairs: list) -> list:
+    """
+    Judge many (premise, hypothesis) pairs with one request per
+    NLI_BATCH_SIZE pairs. A response that does not parse to exactly one
+    verdict per pair falls back to per-pair nli_check calls for that chunk.
+    """
+    if NLI_BATCH_SIZE <= 1:
+        return [nli_check(p, h) for p, h in pairs]
+    verdicts = []
+    for chunk, prompt in nli_batches(pairs):
+        result = llm(SYS_NLI_BATCH, prompt, max_tokens=4 * len(chunk) + 10)
+        parsed = parse_verdicts(result, len(chunk))
+        if parsed is None:
+            log(f"  [NLI batch of {len(chunk)} unparseable — judging pairs one by one]")
+            parsed = [nli_check(p, h) for p, h in chunk]
+        verdicts.extend(parsed)
+        pause(0.3)
+    return verdicts
+
+
 def nli_equivalence(s1: str, s2: str) -> float:
     """
     Bidirectional NLI entailment score.
@@ -192,7 +365,7 @@ def nli_equivalence(s1: str, s2: str) -> float:
     """
     forward  = nli_check(s1, s2)   # s1 entails s2
     backward = nli_check(s2, s1)   # s2 entails s1
-    time.sleep(0.3)
+    pause(0.3)
     return round((float(forward) + float(backward)) / 2.0, 3)
 
 
@@ -204,47 +377,216 @@ def get_canonical_commitment(signal: str) -> str:
     ('it's likely rainy, plan accordingly').
     One-time run of Gate Steps B+C on the original signal.
     """
-    extraction = llm(
-        "You are a commitment extractor. "
-        "Extract the full binding obligation exactly as stated — keep ALL obligation-bearing content: "
-        "modal words (must/shall/required/cannot/never/always/do not), "
-        "the subject, the action and its object, "
-        "any qualifying conditions (if/unless/before/when clauses), "
-        "any frequency quantifiers (always, never, all), "
-        "any temporal constraints (immediately, by Friday, prior to). "
-        "Remove only conversational filler. Do not summarize or generalize. "
-        "If no binding obligation exists, output exactly: [none]",
-        f"Extract the commitment from:\n\n{signal}",
-        max_tokens=80
-    )
+    done = resumed(signal, "canonical", 0)
+    if done is not None:
+        return done["output"]
+    extraction = llm(SYS_STEP_B, EXTRACT_PROMPT.format(signal), max_tokens=80)
     if not extraction or extraction.strip() == "[none]":
-        return signal
-    reconstruction = llm(
-        "You are a minimal statement reconstructor. "
-        "Write the shortest complete sentence that preserves ALL the binding obligations listed. "
-        "Do not add anything not in the list.",
-        f"Reconstruct a minimal commitment statement from these elements:\n\n{extraction}",
-        max_tokens=80
-    )
-    return reconstruction if reconstruction else extraction
-
-
-def nli_stability_curve(turns: list, canonical: str) -> list:
+        canonical = signal
+    else:
+        reconstruction = llm(SYS_STEP_C, RECONSTRUCT_PROMPT.format(extraction), max_tokens=80)
+        canonical = reconstruction if reconstruction else extraction
+    journal(signal, "canonical", 0, {"output": canonical})
+    return canonical
+
+
+def local_nli():
+    """The shared LocalNLI cross-encoder, loaded on first use."""
+    global _LOCAL_NLI
+    if _LOCAL_NLI is None:
+        from nli_local import LocalNLI
+        _LOCAL_NLI = LocalNLI()
+    return _LOCAL_NLI
+
+
+def normalize_text(text: str) -> str:
+    """Lower-case, punctuation-free, whitespace-collapsed form of text."""
+    return " ".join(re.sub(r"[^\w\s]", " ", text.lower()).split())
+
+
+class NLIMemo:
+    """
+    Per-run memo of nli_equivalence(canonical, output) scores keyed by the
+    normalized texts. run_signal shares one across all of its curves, so a
+    gate fixpoint or an output repeated by another condition is judged once.
+    Curves judged concurrently may occasionally both judge a new output.
+    """
+
+    def __init__(self):
+        self.scores  = {}
+        self.judged  = 0
+        self.reused  = 0
+        self._lock   = threading.Lock()
+
+    @staticmethod
+    def key(canonical: str, output: str) -> tuple:
+        return normalize_text(canonical), normalize_text(output)
+
+    def missing(self, canonical: str, outputs: list) -> list:
+        """Outputs (first spelling, in order) whose score is not memoized yet."""
+        with self._lock:
+            todo = {}
+            for out in outputs:
+                k = self.key(canonical, out)
+                if k in self.scores or k in todo:
+                    self.reused += 1
+                else:
+                    todo[k] = out
+            self.judged += len(todo)
+            return list(todo.values())
+
+    def store(self, canonical: str, outputs: list, scores: list):
+        with self._lock:
+            for out, score in zip(outputs, scores):
+                self.scores[self.key(canonical, out)] = score
+
+    def get(self, canonical: str, output: str) -> float:
+        return self.scores[self.key(canonical, output)]
+
+    @property
+    def pairs_skipped(self) -> int:
+        """(premise, hypothesis) pairs not judged: both directions per reused output."""
+        return 2 * self.reused
+
+
+def nli_scores(outputs: list, canonical: str, judge: str) -> list:
+    """Bidirectional NLI score of every output against canonical."""
+    if judge == "local" or NLI_BATCH_SIZE > 1:
+        pairs = nli_pairs(outputs, canonical)
+        verdicts = local_nli().entails(pairs) if judge == "local" else nli_check_batch(pairs)
+        return [round((float(fwd) + float(bwd)) / 2.0, 3)
+                for fwd, bwd in zip(verdicts[::2], verdicts[1::2])]
+    return [nli_equivalence(canonical, out) for out in outputs]
+
+
+def nli_stability_curve(turns: list, canonical: str, judge: str = None,
+                        memo: NLIMemo = None, unit: tuple = None) -> list:
     """
     Compute NLI semantic stability at each iteration vs canonical commitment.
-    Runs 2 API calls per turn (bidirectional entailment).
+    judge="local" scores both directions for every turn in one cross-encoder
+    batch; judge="llm" (default, HARNESS_NLI) judges them in batched requests
+    (nli_check_batch), or 2 calls per turn with HARNESS_NLI_BATCH<=1.
+    Outputs already in `memo` (normalized text) are not judged again.
+    `unit` = (signal, condition) journals each turn's score and seeds the
+    memo from scores journaled by an interrupted run.
     """
+    judge = judge or NLI_JUDGE
+    if judge not in ("llm", "local"):
+        raise ValueError(f"Unknown NLI judge {judge!r} (llm | local)")
+    memo = memo if memo is not None else NLIMemo()
+    done = {}
+    if unit is not None:
+        for t in turns:
+            rec = resumed(*unit, t["i"])
+            if rec is not None:
+                done[t["i"]] = rec
+                memo.store(canonical, [t["output"]], [rec["nli_stability"]])
+    outputs = memo.missing(canonical, [t["output"] for t in turns])
+    memo.store(canonical, outputs, nli_scores(outputs, canonical, judge))
+    scores = [memo.get(canonical, t["output"]) for t in turns]
+    if unit is not None:
+        for t, score in zip(turns, scores):
+            if t["i"] not in done:
+                journal(*unit, t["i"], {"nli_stability": score})
     curve = []
-    for t in turns:
-        score = nli_equivalence(canonical, t["output"])
+    for t, score in zip(turns, scores):
         curve.append({
             "i":             t["i"],
             "nli_stability": score,
             "tokens":        t["tokens"],
             "output":        t["output"],
         })
+        if t.get("inferred"):
+            curve[-1]["inferred"] = True
     return curve
 
+# ── Backend ───────────────────────────────────────────────────────────────────
+
+def replay_exchanges(results: list):
+    """
+    Rebuild (system, user, response) exchanges from a run's results so the replay
+    backend can re-serve a recorded run. Each chain's input at turn i is the
+    output of turn i-1. run.json keeps only the gate's final reconstruction,
+    so Steps A and B replay that output too (Step C then reproduces it).
+    NLI verdicts are recovered from the bidirectional scores; a 0.5 replays
+    as forward yes / backward no. Batched NLI prompts are rebuilt from the
+    outputs each curve judged after the run's NLIMemo (sequential order).
+    """
+    gate_systems = {"gate": (SYS_STEP_A, SYS_STEP_B),
+                    "anchor_gate": (ANCHOR_STEP_A, SYS_STEP_B),
+                    "escalation_gate": (SYS_STEP_A, ESCALATION_STEP_B)}
+    for r in results:
+        signal, canonical = r["signal"], r.get("canonical", r["signal"])
+        yield SYS_STEP_B, EXTRACT_PROMPT.format(signal), canonical
+        yield SYS_STEP_C, RECONSTRUCT_PROMPT.format(canonical), canonical
+        for cond, sys_prompt, template in (("baseline", SYS_PARAPHRASE, PARAPHRASE_PROMPT),
+                                           ("compression", SYS_COMPRESS, SUMMARIZE_PROMPT)):
+            current = signal
+            for t in r.get(cond, []):
+                yield sys_prompt, template.format(current), t["output"]
+                current = t["output"]
+        for cond, (step_a, step_b) in gate_systems.items():
+            current = signal
+            for t in r.get(cond, []):
+                yield step_a, SUMMARIZE_PROMPT.format(current), t["output"]
+                yield step_b, EXTRACT_PROMPT.format(t["output"]), t["output"]
+                yield SYS_STEP_C, RECONSTRUCT_PROMPT.format(t["output"]), t["output"]
+                current = t["output"]
+        memo = NLIMemo()
+        for cond in ("baseline", "compression", "gate", "anchor_gate", "escalation_gate"):
+            curve = r.get(f"{cond}_nli", [])
+            score = {p["output"]: p["nli_stability"] for p in curve}
+            outputs = memo.missing(canonical, [p["output"] for p in curve])
+            memo.store(canonical, outputs, [score[o] for o in outputs])
+            verdicts = []
+            for out in outputs:
+                verdicts += [score[out] >= 0.5, score[out] >= 1.0]
+            for (premise, hypothesis), v in zip(nli_pairs(outputs, canonical), verdicts):
+                yield SYS_NLI, NLI_PROMPT.format(premise, hypothesis), "yes" if v else "no"
+            if NLI_BATCH_SIZE > 1:
+                answers = iter(verdicts)
+                for chunk, prompt in nli_batches(nli_pairs(outputs, canonical)):
+                    yield SYS_NLI_BATCH, prompt, json.dumps(["yes" if next(answers) else "no"
+                                                             for _ in chunk])
+
+
+BACKEND = make_backend(OPENAI_MODEL, timeout=30, retries=2,
+                       run_exchanges=lambda path: replay_exchanges(iter_signals(path)))
+# HARNESS_LLM_CACHE=replay reuses stored responses, fresh stores new ones; off by default
+CACHE   = ResponseCache.from_env(OPENAI_MODEL)
+
+
+# ── Fixpoint detection ────────────────────────────────────────────────────────
+
+def state_key(text: str) -> str:
+    """Hash of a chain state (a turn input) under FIXPOINT_MODE."""
+    if FIXPOINT_MODE == "normalized":
+        text = normalize_text(text)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def fill_cycle(turns: list, seen: dict, current: str, label: str) -> bool:
+    """
+    Early exit for a chain about to run turn len(turns)+1 on input `current`.
+    `seen` maps state_key(input) → iteration that consumed it. If `current`
+    repeats an earlier input, the chain is in a fixpoint (period 1) or a
+    cycle, so the remaining iterations are filled by repeating the cycle's
+    turns, marked "inferred", with no LLM calls. Returns True when filled.
+    """
+    if FIXPOINT_MODE == "off":
+        return False
+    j = seen.get(state_key(current))
+    if j is None:
+        return False
+    i, period = len(turns) + 1, len(turns) + 1 - j
+    for k in range(i, N_ITERATIONS + 1):
+        template = turns[j + (k - j) % period - 1]
+        turns.append(dict(template, i=k, input=turns[-1]["output"], inferred=True))
+    kind = "fixpoint" if period == 1 else f"cycle of {period}"
+    log(f"      {label}{i:02d}+ → {kind} from i={j}: {N_ITERATIONS - i + 1} turns inferred")
+    return True
+
+
 # ── Three conditions ──────────────────────────────────────────────────────────
 
 def run_baseline(signal: str) -> list:
@@ -252,40 +594,47 @@ def run_baseline(signal: str) -> list:
     current = signal
     turns = []
     for i in range(1, N_ITERATIONS + 1):
-        out = llm(
-            "You are a helpful assistant. Respond in one to two sentences.",
-            f"Paraphrase this sentence while preserving meaning:\n\n{current}"
-        )
-        if not out:
-            break
-        turns.append({"i": i, "input": current, "output": out, "tokens": wc(out)})
-        log(f"      B{i:02d} → {out[:80]}")
-        current = out
-        time.sleep(0.3)
+        turn = resumed(signal, "baseline", i)
+        if turn is None:
+            out = llm(SYS_PARAPHRASE, PARAPHRASE_PROMPT.format(current))
+            if not out:
+                break
+            turn = {"i": i, "input": current, "output": out, "tokens": wc(out)}
+            journal(signal, "baseline", i, turn)
+            pause(0.3)
+        turns.append(turn)
+        log(f"      B{i:02d} → {turn['output'][:80]}")
+        current = turn["output"]
     return turns
 
 
 def run_compression(signal: str) -> list:
-    """Condition 2: Summarize loop. No gate."""
+    """Condition 2: Summarize loop. No gate. Stops calling at a fixpoint/cycle."""
     current = signal
     turns = []
+    seen = {}
     for i in range(1, N_ITERATIONS + 1):
-        out = llm(
-            "You are a helpful assistant. Be as concise as possible.",
-            f"Summarize this sentence as concisely as possible:\n\n{current}"
-        )
-        if not out:
+        if fill_cycle(turns, seen, current, "C"):
             break
-        turns.append({"i": i, "input": current, "output": out, "tokens": wc(out)})
-        log(f"      C{i:02d} → {out[:80]}")
-        current = out
-        time.sleep(0.3)
+        seen[state_key(current)] = i
+        turn = resumed(signal, "compression", i)
+        if turn is None:
+            out = llm(SYS_COMPRESS, SUMMARIZE_PROMPT.format(current))
+            if not out:
+                break
+            turn = {"i": i, "input": current, "output": out, "tokens": wc(out)}
+            journal(signal, "compression", i, turn)
+            pause(0.3)
+        turns.append(turn)
+        log(f"      C{i:02d} → {turn['output'][:80]}")
+        current = turn["output"]
     return turns
 
 
 def run_gate(signal: str,
              step_a_system: str = None,
-             step_b_system: str = None) -> list:
+             step_b_system: str = None,
+             condition: str = "gate") -> list:
     """
     Condition 3: Summarize → Extract → Reconstruct → feed reconstruction back.
     This matches the founding test methodology (paper Section 7.5):
@@ -294,48 +643,39 @@ def run_gate(signal: str,
     Optional overrides:
       step_a_system — alternate Step A (summarizer) system prompt (EXP-005: anchor-preserving)
       step_b_system — alternate Step B (extractor) system prompt (EXP-005: escalation-control)
+      condition     — results/journal key of this variant
+
+    Once the reconstruction reaches a fixpoint or cycle the remaining
+    iterations are inferred (fill_cycle) instead of called.
     """
-    _step_a = step_a_system or "You are a helpful assistant. Be concise."
-    _step_b = step_b_system or (
-        "You are a commitment extractor. "
-        "Extract the full binding obligation exactly as stated — keep ALL obligation-bearing content: "
-        "modal words (must/shall/required/cannot/never/always/do not), "
-        "the subject, the action and its object, "
-        "any qualifying conditions (if/unless/before/when clauses), "
-        "any frequency quantifiers (always, never, all), "
-        "any temporal constraints (immediately, by Friday, prior to). "
-        "Remove only conversational filler. Do not summarize or generalize. "
-        "If no binding obligation exists, output exactly: [none]"
-    )
+    _step_a = step_a_system or SYS_STEP_A
+    _step_b = step_b_system or SYS_STEP_B
     current = signal
     turns = []
+    seen = {}
     for i in range(1, N_ITERATIONS + 1):
+        if fill_cycle(turns, seen, current, "G"):
+            break
+        seen[state_key(current)] = i
+        turn = resumed(signal, condition, i)
+        if turn is not None:
+            turns.append(turn)
+            log(f"      G{i:02d} → (journal) recon: {turn['output'][:60]}")
+            current = turn["output"]
+            continue
 
         # Step A — Summarize
-        summary = llm(
-            _step_a,
-            f"Summarize this sentence as concisely as possible:\n\n{current}"
-        )
+        summary = llm(_step_a, SUMMARIZE_PROMPT.format(current))
         if not summary:
             break
 
         # Step B — Extract commitment kernel
-        extraction = llm(
-            _step_b,
-            f"Extract the commitment from:\n\n{summary}",
-            max_tokens=80
-        )
+        extraction = llm(_step_b, EXTRACT_PROMPT.format(summary), max_tokens=80)
         if not extraction or extraction.strip() == "[none]":
             extraction = summary   # fallback: use summary if nothing extracted
 
         # Step C — Reconstruct minimal statement
-        reconstruction = llm(
-            "You are a minimal statement reconstructor. "
-            "Write the shortest complete sentence that preserves ALL the binding obligations listed. "
-            "Do not add anything not in the list.",
-            f"Reconstruct a minimal commitment statement from these elements:\n\n{extraction}",
-            max_tokens=80
-        )
+        reconstruction = llm(SYS_STEP_C, RECONSTRUCT_PROMPT.format(extraction), max_tokens=80)
         if not reconstruction:
             reconstruction = extraction
 
@@ -347,27 +687,39 @@ def run_gate(signal: str,
             "output":        reconstruction,
             "tokens":        wc(reconstruction),
         })
+        journal(signal, condition, i, turns[-1])
         log(f"      G{i:02d} → extract: [{extraction[:50]}] → recon: {reconstruction[:60]}")
 
         # Feed reconstruction back — NOT the conversational response
         current = reconstruction
-        time.sleep(0.5)
+        pause(0.5)
     return turns
 
 # ── Stability computation ─────────────────────────────────────────────────────
 
-def stability_curve(turns: list, origin: set) -> list:
-    """Compute Jaccard stability at each iteration vs original signal."""
-    curve = []
-    for t in turns:
-        c = extract_commitment_words(t["output"])
-        curve.append({
-            "i":         t["i"],
-            "stability": jaccard(c, origin) if origin else None,
-            "tokens":    t["tokens"],
-            "output":    t["output"],
-        })
-    return curve
+def stability_curves(chains: dict, origin: set) -> dict:
+    """
+    Jaccard stability at each iteration vs original signal, for every
+    condition at once: {condition: turns} → {condition: curve}. Scores come
+    from one bitset pass (stability_engine.py), identical to jaccard().
+    """
+    words = {cond: [extract_commitment_words(t["output"]) for t in turns]
+             for cond, turns in chains.items()}
+    scores = stability_table(origin, words, decimals=3) if origin else {}
+    curves = {}
+    for cond, turns in chains.items():
+        curve = []
+        for k, t in enumerate(turns):
+            curve.append({
+                "i":         t["i"],
+                "stability": scores[cond][k] if origin else None,
+                "tokens":    t["tokens"],
+                "output":    t["output"],
+            })
+            if t.get("inferred"):
+                curve[-1]["inferred"] = True
+        curves[cond] = curve
+    return curves
 
 # ── Per-signal runner ─────────────────────────────────────────────────────────
 
@@ -381,36 +733,42 @@ def run_signal(signal: str, category: str) -> dict:
     canonical = get_canonical_commitment(signal)
     log(f"  Canonical: {canonical[:70]}")
 
-    log(f"  ── Condition 1: Baseline")
-    b_turns = run_baseline(signal)
-    b_curve = stability_curve(b_turns, origin)
-
-    log(f"  ── Condition 2: Compression only")
-    c_turns = run_compression(signal)
-    c_curve = stability_curve(c_turns, origin)
-
-    log(f"  ── Condition 3: Standard Gate")
-    g_turns = run_gate(signal)
-    g_curve = stability_curve(g_turns, origin)
+    # Conditions are independent chains: run concurrently under run_async(),
+    # one after another otherwise. Each chain is sequential step to step.
+    def chain(label, fn, *args):
+        log(f"  ── {label}")
+        return fn(*args)
 
-    ag_turns, ag_curve, eg_turns, eg_curve = [], [], [], []
+    chains = [(chain, "Condition 1: Baseline", run_baseline, signal),
+              (chain, "Condition 2: Compression only", run_compression, signal),
+              (chain, "Condition 3: Standard Gate", run_gate, signal)]
     if EXP005:
-        log(f"  ── Condition 4: Anchor-Preserving Gate (Step A preserves modals/temporals)")
-        ag_turns = run_gate(signal, step_a_system=ANCHOR_STEP_A)
-        ag_curve = stability_curve(ag_turns, origin)
-
-        log(f"  ── Condition 5: Escalation-Control Gate (Step B preserves modal strength)")
-        eg_turns = run_gate(signal, step_b_system=ESCALATION_STEP_B)
-        eg_curve = stability_curve(eg_turns, origin)
+        chains += [(chain, "Condition 4: Anchor-Preserving Gate (Step A preserves modals/temporals)",
+                    run_gate, signal, ANCHOR_STEP_A, None, "anchor_gate"),
+                   (chain, "Condition 5: Escalation-Control Gate (Step B preserves modal strength)",
+                    run_gate, signal, None, ESCALATION_STEP_B, "escalation_gate")]
+    turns = in_parallel(*chains)
+    b_turns, c_turns, g_turns = turns[:3]
+    ag_turns, eg_turns = turns[3:] if EXP005 else ([], [])
+
+    curves = stability_curves({"baseline": b_turns, "compression": c_turns, "gate": g_turns,
+                               "anchor_gate": ag_turns, "escalation_gate": eg_turns}, origin)
+    b_curve, c_curve, g_curve = curves["baseline"], curves["compression"], curves["gate"]
+    ag_curve, eg_curve = curves["anchor_gate"], curves["escalation_gate"]
 
     # NLI semantic stability
     n_cond = "5 conditions" if EXP005 else "3 conditions"
     log(f"  ── NLI semantic stability (2 calls × 10 iter × {n_cond})...")
-    b_nli = nli_stability_curve(b_turns, canonical)
-    c_nli = nli_stability_curve(c_turns, canonical)
-    g_nli = nli_stability_curve(g_turns, canonical)
-    ag_nli = nli_stability_curve(ag_turns, canonical) if EXP005 else []
-    eg_nli = nli_stability_curve(eg_turns, canonical) if EXP005 else []
+    memo = NLIMemo()
+    nli = in_parallel(*[(nli_stability_curve, t, canonical, None, memo, (signal, f"{cond}_nli"))
+                        for cond, t in (("baseline", b_turns), ("compression", c_turns),
+                                        ("gate", g_turns), ("anchor_gate", ag_turns),
+                                        ("escalation_gate", eg_turns))])
+    log(f"  ── NLI memo: {memo.judged} outputs judged, {memo.reused} reused "
+        f"({memo.pairs_skipped} NLI pairs skipped)")
+    b_nli, c_nli, g_nli = nli[:3]
+    ag_nli = nli[3] if EXP005 else []
+    eg_nli = nli[4] if EXP005 else []
 
     # Summary — both metrics at key iterations
     log(f"  {'':6s} {'Jaccard':>20s}   {'NLI (semantic)':>20s}")
@@ -534,7 +892,43 @@ def generate_report(results: list, ts: str) -> str:
 
 # ── Main ──────────────────────────────────────────────────────────────────────
 
+async def run_async(signals: list, emit):
+    """
+    Run every signal concurrently through the async client. Signals and
+    conditions overlap; calls inside one chain keep their order. emit(result)
+    is called in corpus order as soon as a signal and all earlier ones finish.
+    """
+    global _ASYNC
+    if BACKEND.http:
+        http_session(pool_size=MAX_CONCURRENCY)
+    client = AsyncLLMClient(BACKEND, rate=RATE_LIMIT_RPS,
+                            max_concurrency=MAX_CONCURRENCY, log=log)
+    workers = ThreadPoolExecutor(max_workers=len(signals) or 1, thread_name_prefix="signal")
+    _ASYNC = (client, asyncio.get_running_loop())
+    try:
+        loop = asyncio.get_running_loop()
+        pending = [loop.run_in_executor(workers, tagged, s["category"],
+                                        run_signal, s["signal"], s["category"])
+                   for s in signals]
+        for fut in pending:
+            emit(await fut)
+    finally:
+        _ASYNC = None
+        workers.shutdown(wait=False)
+        client.close()
+        log(f"  LLM client: {client.stats}")
+
+
+def resume_dir(name: str) -> Path:
+    """EXP directory to resume: a path, or a name under experiments/."""
+    d = Path(name) if Path(name).is_dir() else EXPERIMENTS_DIR / name
+    if not d.is_dir():
+        raise FileNotFoundError(f"HARNESS_RESUME: no experiment directory {name!r}")
+    return d
+
+
 def run():
+    global JOURNAL
     corpus  = json.loads(CORPUS_PATH.read_text())
     signals = corpus["canonical_signals"]
 
@@ -544,24 +938,40 @@ def run():
 
     ts = datetime.now().strftime("%Y-%m-%d %H:%M")
     log(f"=== Phase Transition Test v2 — {ts} ===")
-    log(f"Conditions: Baseline / Compression / Gate  |  Iterations: {N_ITERATIONS}")
+    log(f"Conditions: Baseline / Compression / Gate  |  Iterations: {N_ITERATIONS}  |  NLI: {NLI_JUDGE}")
     log(f"Citing: {CITATION['doi']}\n")
 
-    results = []
-    for s in signals:
-        result = run_signal(s["signal"], s["category"])
-        results.append(result)
+    # Journal every finished unit under the EXP dir; HARNESS_RESUME=EXP-NNN
+    # picks an interrupted run back up from its journal.
+    resume  = os.environ.get("HARNESS_RESUME")
+    exp_dir = resume_dir(resume) if resume else next_exp_dir()
+    JOURNAL = RunJournal(exp_dir / "journal.jsonl")
+    log(f"  Experiment dir: {exp_dir.name}"
+        + (f" (resuming, {JOURNAL.loaded} journaled units)" if resume else ""))
 
-    exp_dir     = next_exp_dir()
-    json_path   = exp_dir / "run.json"
+    # Results stream to run.jsonl one signal at a time (results_io.py)
+    json_path   = exp_dir / "run.jsonl"
     report_path = exp_dir / "report.md"
-    log(f"\n  Experiment dir: {exp_dir.name}")
-
-    json_path.write_text(json.dumps(results, indent=2))
-    report_path.write_text(generate_report(results, ts))
+    with ResultWriter(json_path) as writer:
+        if MAX_CONCURRENCY > 0:
+            log(f"Async: up to {MAX_CONCURRENCY} requests in flight, {RATE_LIMIT_RPS:g} req/s")
+            asyncio.run(run_async(signals, writer.write))
+        else:
+            for s in signals:
+                writer.write(run_signal(s["signal"], s["category"]))
+
+    report_path.write_text(generate_report(ResultFile(json_path), ts))
+    log(f"\n  {JOURNAL.summary()} — compacted into {json_path.name}")
+    JOURNAL.compact()
+    JOURNAL = None
 
     log(f"\n✓ JSON:   {json_path}")
     log(f"✓ Report: {report_path}")
+    log(f"  {CACHE.summary()}")
+    if _LOCAL_NLI is not None:
+        log(f"  {_LOCAL_NLI.summary()}")
+    if BACKEND.http:
+        log(f"  {BACKEND.latency.summary()}")
 
 
 if __name__ == "__main__":
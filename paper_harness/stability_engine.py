@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+stability_engine.py — Vectorized Jaccard stability over token-id bitsets
+
+Commitment words are interned to integer ids and each extraction becomes one
+row of a packed uint64 bitset matrix. Intersections and unions are then
+bitwise AND/OR over whole matrices, counted with a popcount, so a signal's
+complete stability table — every turn of every condition against its origin —
+is one NumPy expression instead of one Python set comparison per turn.
+
+Results match the scalar functions exactly:
+  decimals=None — operational-harness src/metrics.jaccard (unrounded)
+  decimals=3    — run_convergence_v2.jaccard (round(…, 3))
+with the same edge cases: two empty sets → 1.0, one empty set → 0.0.
+
+Run:
+  python3 stability_engine.py ../experiments/EXP-005/run.json   # recompute + verify stored stability
+"""
+
+import sys
+
+import numpy as np
+
+_BYTE_COUNTS = np.array([bin(b).count("1") for b in range(256)], dtype=np.uint8)
+
+
+def popcount_bytes(bits: np.ndarray) -> np.ndarray:
+    """Set bits per row of a packed uint64 matrix, by byte lookup table (numpy<2)."""
+    as_bytes = np.ascontiguousarray(bits).view(np.uint8)
+    return _BYTE_COUNTS[as_bytes].sum(axis=-1, dtype=np.int64)
+
+
+if hasattr(np, "bitwise_count"):
+    def popcount(bits: np.ndarray) -> np.ndarray:
+        """Set bits per row of a packed uint64 matrix."""
+        return np.bitwise_count(bits).sum(axis=-1, dtype=np.int64)
+else:
+    popcount = popcount_bytes
+
+
+class Vocab:
+    """Interns words/keys to dense integer ids (stable for the vocab's lifetime)."""
+
+    def __init__(self):
+        self.ids = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def intern(self, words) -> list:
+        return [self.ids.setdefault(w, len(self.ids)) for w in words]
+
+    def pack(self, sets: list, width: int = None) -> np.ndarray:
+        """
+        One packed bitset row per set. Interns every word first, so rows
+        packed in a single call always share a width; pass `width` (in
+        uint64 words) to pack against a matrix built earlier.
+        """
+        rows = [self.intern(s) for s in sets]
+        width = max(width or 0, (len(self.ids) + 63) // 64, 1)
+        bits = np.zeros((len(rows), width), dtype=np.uint64)
+        for r, ids in enumerate(rows):
+            if ids:
+                ids = np.asarray(ids, dtype=np.int64)
+                np.bitwise_or.at(bits[r], ids >> 6, np.left_shift(np.uint64(1), (ids & 63).astype(np.uint64)))
+        return bits
+
+
+def _ratio(inter: np.ndarray, union: np.ndarray, a_empty, b_empty, decimals) -> np.ndarray:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = inter / union
+    out = np.where(a_empty | b_empty, 0.0, out)
+    out = np.where(a_empty & b_empty, 1.0, out)
+    if decimals is not None:
+        # Python's round() (correctly rounded), not np.round (scale-and-rint),
+        # so values are bit-identical to the scalar jaccard
+        out = np.array([round(v, decimals) for v in out.ravel().tolist()],
+                       dtype=np.float64).reshape(out.shape)
+    return out
+
+
+def jaccard_rows(a: np.ndarray, b: np.ndarray, decimals: int = None) -> np.ndarray:
+    """Row-wise Jaccard of two equally shaped bitset matrices (b may be one row)."""
+    inter = popcount(a & b)
+    union = popcount(a | b)
+    return _ratio(inter, union, popcount(a) == 0, popcount(b) == 0, decimals)
+
+
+def jaccard_matrix(a: np.ndarray, b: np.ndarray, decimals: int = None) -> np.ndarray:
+    """All-pairs Jaccard: result[i, j] = jaccard(a[i], b[j])."""
+    inter = popcount(a[:, None, :] & b[None, :, :])
+    union = popcount(a[:, None, :] | b[None, :, :])
+    a_empty = (popcount(a) == 0)[:, None]
+    b_empty = (popcount(b) == 0)[None, :]
+    return _ratio(inter, union, a_empty, b_empty, decimals)
+
+
+def stability_table(origin: set, curves: dict, decimals: int = None) -> dict:
+    """
+    Jaccard of every extraction in every condition against `origin` in one
+    pass: {condition: [extracted sets]} → {condition: [stability floats]}.
+    """
+    vocab = Vocab()
+    conds = list(curves)
+    sets = [s for c in conds for s in curves[c]]
+    bits = vocab.pack([origin] + sets)
+    values = jaccard_rows(bits[1:], bits[:1], decimals).tolist() if sets else []
+    out, k = {}, 0
+    for c in conds:
+        n = len(curves[c])
+        out[c] = values[k:k + n]
+        k += n
+    return out
+
+
+def main():
+    from results_io import CHAINS, iter_signals
+    from run_convergence_v2 import extract_commitment_words, jaccard
+
+    checked = mismatched = 0
+    for path in sys.argv[1:]:
+        for r in iter_signals(path):
+            origin = set(r["origin_c"])
+            if not origin:
+                continue
+            curves = {c: [extract_commitment_words(p["output"]) for p in r.get(c, [])] for c in CHAINS}
+            table = stability_table(origin, curves, decimals=3)
+            for c in CHAINS:
+                for p, s, v in zip(r.get(c, []), curves[c], table[c]):
+                    checked += 1
+                    if v != jaccard(s, origin) or v != p["stability"]:
+                        mismatched += 1
+                        print(f"  mismatch {r['category']} {c} i{p['i']}: "
+                              f"stored={p['stability']} scalar={jaccard(s, origin)} vector={v}")
+    print(f"{checked} stability values recomputed, {mismatched} mismatches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+import os
+import sys
+
+# The harness scripts are flat modules imported from their own directory.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Importing run_convergence_v2 builds its backend and response cache from the
+# HARNESS_* environment: keep both offline and off disk. Set before any test
+# module imports the harness.
+os.environ.setdefault("HARNESS_LLM_BACKEND", "local")
+os.environ["HARNESS_LLM_CACHE"] = "off"
+for var in ("HARNESS_LLM_URL", "HARNESS_RECORD", "HARNESS_REPLAY", "HARNESS_RESUME",
+            "HARNESS_FIXPOINT"):
+    os.environ.pop(var, None)
@@ -0,0 +1,42 @@
+import json
+
+from journal import RunJournal
+
+
+def test_nothing_is_written_before_the_first_unit(tmp_path):
+    path = tmp_path / "run" / "journal.jsonl"
+    journal = RunJournal(path, meta={"file_ts": "120000"})
+    assert journal.get("s", "c", 1) is None
+    journal.compact()
+    assert not path.parent.exists()
+
+
+def test_reopened_journal_resumes_units_and_meta(tmp_path):
+    path = tmp_path / "run" / "journal.jsonl"
+    journal = RunJournal(path, meta={"run_dir": "/runs/2026-01-01", "file_ts": "120000"})
+    journal.put("s", "gate", 1, {"output": "one"})
+    journal.put("s", "gate", 2, {"output": "two"})
+    assert json.loads(path.read_text().splitlines()[0]) == {
+        "meta": {"run_dir": "/runs/2026-01-01", "file_ts": "120000"}}
+
+    # resuming on another day: the stored meta wins over the caller's guess
+    resumed = RunJournal(path, meta={"run_dir": "/runs/2026-01-02", "file_ts": "x"})
+    assert resumed.meta == {"run_dir": "/runs/2026-01-01", "file_ts": "120000"}
+    assert resumed.loaded == 2
+    assert resumed.get("s", "gate", 2) == {"output": "two"}
+    assert resumed.get("s", "gate", 3) is None
+    resumed.put("s", "gate", 3, {"output": "three"})
+    assert sum(1 for line in path.read_text().splitlines() if '"meta"' in line) == 1
+    assert "2 units loaded, 1 resumed, 1 written" in resumed.summary()
+
+
+def test_half_written_line_is_skipped(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = RunJournal(path)
+    journal.put("s", "baseline", 1, {"output": "ok"})
+    with path.open("a") as f:
+        f.write('{"signal": "s", "condition": "baseline", "i": 2, "rec')
+    resumed = RunJournal(path)
+    assert resumed.loaded == 1 and resumed.get("s", "baseline", 2) is None
+    resumed.compact()
+    assert not path.exists()
@@ -0,0 +1,115 @@
+import json
+
+import pytest
+
+import llm_backends
+from llm_backends import (RecordingBackend, ReplayBackend, RuleBackend, is_recording,
+                          make_backend, openai_key)
+
+
+def messages(user, system="sys"):
+    return [{"role": "system", "content": system}, {"role": "user", "content": user}]
+
+
+@pytest.fixture
+def no_key(monkeypatch, tmp_path):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(llm_backends, "KEY_PATH", tmp_path / "missing")
+
+
+def test_openai_key_placeholder_only_for_loopback(no_key):
+    assert openai_key("http://127.0.0.1:8089/v1/chat/completions") == "mock"
+    assert openai_key("http://localhost:8089/v1/chat/completions") == "mock"
+    with pytest.raises(RuntimeError):
+        openai_key("https://llm.example.com/v1/chat/completions")
+    with pytest.raises(RuntimeError):
+        openai_key()
+
+
+def test_openai_key_prefers_the_real_key(no_key, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", " sk-test \n")
+    assert openai_key("http://127.0.0.1:8089") == "sk-test"
+
+
+def test_rule_backend_is_deterministic():
+    backend = RuleBackend()
+    prompt = messages("Paraphrase this sentence while preserving meaning:\n\n"
+                      "You must verify the premises immediately")
+    out = backend.chat(prompt)
+    assert out == backend.chat(prompt) == "You must check the property at once"
+
+
+def test_rule_backend_answers_nli_prompts():
+    backend = RuleBackend()
+    single = 'Does this sentence:\n"You must pay by Friday."\n\nlogically entail this sentence:\n"{}"?'
+    assert backend.chat(messages(single.format("Pay by Friday."))) == "yes"
+    assert backend.chat(messages(single.format("Leave the building."))) == "no"
+    pairs = [{"premise": "You must pay by Friday.", "hypothesis": "Pay by Friday."},
+             {"premise": "You must pay by Friday.", "hypothesis": "Leave now."}]
+    batch = "Return a JSON array of exactly 2 items\n\n" + json.dumps(pairs)
+    assert json.loads(backend.chat(messages(batch))) == ["yes", "no"]
+
+
+def test_replay_serves_exact_then_user_match_then_fallback():
+    backend = ReplayBackend(fallback=RuleBackend())
+    backend.add("sys", "question", "recorded")
+    assert backend.chat(messages("question")) == "recorded"
+    assert backend.chat(messages("question", system="other")) == "recorded"
+    assert backend.chat(messages("Unknown one. Second.")) == "Unknown one."
+    assert (backend.hits, backend.misses) == (2, 1)
+    assert ReplayBackend().chat(messages("nothing")) == ""
+
+
+def test_recording_round_trips_through_replay(tmp_path):
+    path = tmp_path / "rec" / "exchanges.jsonl"
+    recorder = RecordingBackend(RuleBackend(), path)
+    prompt = messages("Summarize this sentence as concisely as possible:\n\nPay now; then rest.")
+    out = recorder.chat(prompt, max_tokens=40)
+    assert is_recording(path)
+    rec = json.loads(path.read_text())
+    assert rec["response"] == out and rec["max_tokens"] == 40
+    assert ReplayBackend().load_jsonl(path).chat(prompt) == out
+
+
+def test_make_backend_follows_the_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("HARNESS_LLM_BACKEND", "local")
+    assert isinstance(make_backend("m"), RuleBackend)
+
+    rec = tmp_path / "rec.jsonl"
+    RecordingBackend(RuleBackend(), rec).chat(messages("Hello there."))
+    monkeypatch.setenv("HARNESS_LLM_BACKEND", "replay")
+    monkeypatch.setenv("HARNESS_REPLAY", str(rec))
+    monkeypatch.setenv("HARNESS_RECORD", str(tmp_path / "out.jsonl"))
+    backend = make_backend("m")
+    assert isinstance(backend, RecordingBackend) and isinstance(backend.inner, ReplayBackend)
+    assert backend.chat(messages("Hello there.")) == "Hello there."
+    assert backend.inner.hits == 1
+
+    monkeypatch.setenv("HARNESS_LLM_BACKEND", "nope")
+    with pytest.raises(ValueError):
+        make_backend("m")
+
+
+@pytest.fixture
+def fresh_session(monkeypatch):
+    monkeypatch.setattr(llm_backends, "_SESSION", None)
+    monkeypatch.setattr(llm_backends, "_SESSION_POOL", 0)
+    monkeypatch.setattr(llm_backends, "HTTP_POOL", 4)
+
+
+def test_http_session_sizes_the_pool_once(fresh_session):
+    session = llm_backends.http_session(pool_size=12)
+    adapter = session.get_adapter("https://api.openai.com/")
+    assert adapter is session.get_adapter("http://127.0.0.1/")
+    assert adapter._pool_maxsize == 12
+    assert llm_backends.http_session() is session
+    assert session.get_adapter("https://api.openai.com/") is adapter
+
+
+def test_http_session_keeps_its_adapter_when_asked_for_more(fresh_session, capsys):
+    session = llm_backends.http_session()
+    adapter = session.get_adapter("https://api.openai.com/")
+    assert adapter._pool_maxsize == 4
+    assert llm_backends.http_session(pool_size=32) is session
+    assert session.get_adapter("https://api.openai.com/") is adapter
+    assert "HARNESS_HTTP_POOL=32" in capsys.readouterr().out
@@ -0,0 +1,47 @@
+import pytest
+
+from llm_cache import ResponseCache
+
+MSGS = [{"role": "system", "content": "be brief"}, {"role": "user", "content": "say hi"}]
+
+
+def test_off_by_default_and_touches_no_file(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = ResponseCache("m", path=path)
+    assert cache.mode == "off"
+    cache.put(MSGS, 0.3, 10, "hi")
+    assert cache.get(MSGS, 0.3, 10) is None
+    assert not path.exists()
+    assert cache.summary() == "LLM cache: off"
+
+
+def test_from_env_defaults_to_off(monkeypatch, tmp_path):
+    monkeypatch.delenv("HARNESS_LLM_CACHE", raising=False)
+    monkeypatch.setenv("HARNESS_LLM_CACHE_PATH", str(tmp_path / "c.sqlite"))
+    assert ResponseCache.from_env("m").mode == "off"
+
+
+def test_fresh_stores_but_never_serves(tmp_path):
+    cache = ResponseCache("m", mode="fresh", path=tmp_path / "c.sqlite")
+    cache.put(MSGS, 0.3, 10, "hi")
+    cache.put(MSGS, 0.3, 10, "")
+    assert cache.get(MSGS, 0.3, 10) is None
+    assert cache.stats()["stored"] == 1 and cache.stats()["misses"] == 0
+    assert "1 responses stored" in cache.summary()
+
+
+def test_replay_serves_what_fresh_stored(tmp_path):
+    path = tmp_path / "c.sqlite"
+    ResponseCache("m", mode="fresh", path=path).put(MSGS, 0.3, 10, "hi there")
+    cache = ResponseCache("m", mode="replay", path=path)
+    assert cache.get(MSGS, 0.3, 10) == "hi there"
+    assert cache.get(MSGS, 0.3, 11) is None            # max_tokens is part of the key
+    assert ResponseCache("other", mode="replay", path=path).get(MSGS, 0.3, 10) is None
+    s = cache.stats()
+    assert (s["hits"], s["misses"], s["hit_rate"]) == (1, 1, 0.5)
+    assert s["words_saved"] == 2 + 2 + 2               # prompt words + completion words
+
+
+def test_unknown_mode_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        ResponseCache("m", mode="sometimes", path=tmp_path / "c.sqlite")
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from email.utils import formatdate
+
+import llm_client
+from llm_client import AsyncLLMClient, TokenBucket, retry_after_seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code, content="", headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._content = content
+
+    def json(self):
+        return {"choices": [{"message": {"content": self._content}}]}
+
+
+class FakeHTTPBackend:
+    """HTTP-shaped backend that answers post() from a scripted response list."""
+    http = True
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.posts = 0
+
+    def payload(self, messages, max_tokens, temperature):
+        return {"messages": messages}
+
+    def post(self, payload):
+        self.posts += 1
+        r = self.responses.pop(0)
+        if isinstance(r, Exception):
+            raise r
+        return r
+
+
+def run_chat(backend, **kwargs):
+    async def go():
+        client = AsyncLLMClient(backend, rate=1000, log=lambda msg: None, **kwargs)
+        try:
+            return await client.chat([{"role": "user", "content": "hi"}]), client.stats
+        finally:
+            client.close()
+    return asyncio.run(go())
+
+
+def no_sleep(monkeypatch):
+    waits = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+        await real_sleep(0)
+    monkeypatch.setattr(llm_client.asyncio, "sleep", fake_sleep)
+    return waits
+
+
+def test_token_bucket_paces_after_the_burst():
+    async def go():
+        bucket = TokenBucket(rate=50, capacity=2)
+        start = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.monotonic() - start
+    # two tokens banked, the other four arrive at 50/s
+    assert 0.07 <= asyncio.run(go()) < 0.5
+
+
+def test_token_bucket_penalize_blocks_for_the_cool_down():
+    async def go():
+        bucket = TokenBucket(rate=100, capacity=5)
+        bucket.penalize(0.1)
+        start = time.monotonic()
+        await bucket.acquire()
+        return time.monotonic() - start
+    assert asyncio.run(go()) >= 0.1
+
+
+def test_retry_after_delta_seconds():
+    assert retry_after_seconds({"Retry-After": "2.5"}, 9) == 2.5
+    assert retry_after_seconds({"Retry-After": "-3"}, 9) == 0.0
+
+
+def test_retry_after_http_date():
+    when = formatdate(time.time() + 30, usegmt=True)
+    assert 28 <= retry_after_seconds({"Retry-After": when}, 9) <= 30
+
+
+def test_retry_after_falls_back_to_default():
+    assert retry_after_seconds({}, 4) == 4
+    assert retry_after_seconds(None, 4) == 4
+    assert retry_after_seconds({"Retry-After": "soon"}, 4) == 4
+
+
+def test_backoff_doubles_with_jitter_and_caps():
+    client = AsyncLLMClient(FakeHTTPBackend([]), backoff_base=1.0, backoff_max=10.0)
+    try:
+        for attempt in range(6):
+            nominal = min(10.0, 2.0 ** attempt)
+            assert nominal / 2 <= client._backoff(attempt) <= nominal
+    finally:
+        client.close()
+
+
+def test_chat_honours_retry_after_on_429(monkeypatch):
+    waits = no_sleep(monkeypatch)
+    backend = FakeHTTPBackend([FakeResponse(429, headers={"Retry-After": "3"}),
+                               FakeResponse(200, " ok ")])
+    out, stats = run_chat(backend)
+    assert out == "ok" and backend.posts == 2
+    assert 3.0 in waits
+    assert stats["rate_limited"] == 1 and stats["retries"] == 1 and stats["failed"] == 0
+
+
+def test_chat_backs_off_on_errors_then_gives_up(monkeypatch):
+    waits = no_sleep(monkeypatch)
+    backend = FakeHTTPBackend([ConnectionError(), FakeResponse(503), FakeResponse(503)])
+    out, stats = run_chat(backend, max_retries=2, backoff_base=1.0)
+    assert out == "" and backend.posts == 3
+    assert stats["retries"] == 3 and stats["failed"] == 1
+    assert 0.5 <= waits[0] <= 1.0 and 1.0 <= waits[1] <= 2.0
+
+
+def test_chat_does_not_retry_client_errors(monkeypatch):
+    no_sleep(monkeypatch)
+    backend = FakeHTTPBackend([FakeResponse(400)])
+    out, stats = run_chat(backend)
+    assert out == "" and backend.posts == 1 and stats["failed"] == 1
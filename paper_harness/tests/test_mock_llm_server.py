@@ -0,0 +1,70 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+import llm_backends
+from llm_backends import OpenAIBackend, RuleBackend
+from mock_llm_server import make_handler
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(**kwargs):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(RuleBackend(), **kwargs))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def post(url, body):
+    req = urllib.request.Request(url, data=json.dumps(body).encode(),
+                                 headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req) as r:
+            return r.status, dict(r.headers), json.loads(r.read())
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), json.loads(e.read())
+
+
+CHAT = {"model": "m", "max_tokens": 20,
+        "messages": [{"role": "user", "content": "Summarize this:\n\nPay now; rest later."}]}
+
+
+def test_answers_in_the_openai_format(serve):
+    status, _, body = post(serve() + "/v1/chat/completions", CHAT)
+    assert status == 200 and body["object"] == "chat.completion"
+    assert body["choices"][0]["message"]["content"] == "Pay now."
+    assert body["usage"]["completion_tokens"] == 2
+
+
+def test_rate_limits_every_nth_request(serve):
+    url = serve(rate_limit_every=2, retry_after=1.5) + "/v1/chat/completions"
+    assert post(url, CHAT)[0] == 200
+    status, headers, _ = post(url, CHAT)
+    assert status == 429 and headers["Retry-After"] == "1.5"
+    assert post(url, CHAT)[0] == 200
+
+
+def test_rejects_unknown_paths_and_bad_bodies(serve):
+    url = serve()
+    assert post(url + "/v1/embeddings", CHAT)[0] == 404
+    assert post(url + "/v1/chat/completions", {"model": "m"})[0] == 400
+
+
+def test_openai_backend_runs_against_it_without_a_key(serve, monkeypatch, tmp_path):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(llm_backends, "KEY_PATH", tmp_path / "missing")
+    backend = OpenAIBackend("m", url=serve() + "/v1/chat/completions")
+    assert backend.chat(CHAT["messages"]) == "Pay now."
+    assert backend.latency.stats()["calls"] == 1
@@ -0,0 +1,42 @@
+from nli_local import THRESHOLD, LocalNLI
+
+
+class StubNLI(LocalNLI):
+    """LocalNLI with the cross-encoder replaced by a fixed score table."""
+
+    def __init__(self, probs, **kwargs):
+        super().__init__(model_name="stub", **kwargs)
+        self.probs = probs
+        self.batches = []
+
+    def _score(self, chunk):
+        self.batches.append(list(chunk))
+        return [self.probs[p] for p in chunk]
+
+
+def test_threshold_is_strict():
+    nli = StubNLI({("a", "b"): THRESHOLD, ("a", "c"): THRESHOLD + 1e-6, ("a", "d"): 0.1})
+    assert nli.entails([("a", "b"), ("a", "c"), ("a", "d")]) == [False, True, False]
+    assert StubNLI({("a", "b"): 0.6}, threshold=0.5).entails([("a", "b")]) == [True]
+
+
+def test_pairs_are_scored_once_and_batched():
+    probs = {("p", str(k)): k / 10 for k in range(5)}
+    nli = StubNLI(probs, batch_size=2)
+    pairs = [("p", "0"), ("p", "1"), ("p", "0"), ("p", "2"), ("p", "3")]
+    assert nli.entailment_probs(pairs) == [0.0, 0.1, 0.0, 0.2, 0.3]
+    assert nli.batches == [[("p", "0"), ("p", "1")], [("p", "2"), ("p", "3")]]
+    assert (nli.scored, nli.hits) == (4, 1)
+
+    assert nli.entailment_probs([("p", "3"), ("p", "4")]) == [0.3, 0.4]
+    assert nli.batches[-1] == [("p", "4")]
+    assert (nli.scored, nli.hits) == (5, 2)
+    assert nli.summary() == "Local NLI (stub): 5 pairs scored, 2 cached"
+
+
+def test_fully_cached_call_scores_nothing():
+    nli = StubNLI({("a", "b"): 0.9})
+    nli.entails([("a", "b")])
+    nli.batches.clear()
+    assert nli.entails([("a", "b"), ("a", "b")]) == [True, True]
+    assert nli.batches == []
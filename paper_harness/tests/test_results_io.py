@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from results_io import ResultFile, ResultWriter, find_run, iter_records, iter_signals
+
+REPO = Path(__file__).resolve().parents[2]
+V2_RUN = REPO / "experiments" / "EXP-005" / "run.json"
+V1_RUN = REPO / "working" / "runs_archive" / "2026-03-17" / "convergence_full_123127.json"
+
+
+def rewrite(results, path):
+    with ResultWriter(path) as writer:
+        for r in results:
+            writer.write(r)
+    return path
+
+
+@pytest.mark.parametrize("legacy", [V2_RUN, V1_RUN], ids=["v2-run.json", "v1-convergence_full"])
+def test_legacy_file_round_trips_through_jsonl(legacy, tmp_path):
+    original = json.loads(legacy.read_text())
+    assert list(iter_signals(legacy)) == original
+    jsonl = rewrite(original, tmp_path / "run.jsonl")
+    assert list(iter_signals(jsonl)) == original
+    assert list(iter_records(jsonl)) == list(iter_records(legacy))
+
+
+def test_v2_records_carry_both_metrics_per_turn(tmp_path):
+    original = json.loads(V2_RUN.read_text())
+    records = list(iter_records(rewrite(original[:1], tmp_path / "run.jsonl")))
+    head, turns = records[0], records[1:]
+    assert head["condition"] == "signal" and head["i"] == 0
+    assert set(head["curves"]) >= {"baseline", "gate", "gate_nli"}
+    gate = [r for r in turns if r["condition"] == "gate"]
+    assert [r["i"] for r in gate] == sorted(r["i"] for r in gate)
+    assert all("stability" in r and "nli_stability" in r for r in gate)
+
+
+def test_inferred_turns_survive(tmp_path):
+    result = {"category": "rule", "signal": "Always lock.", "canonical": "Lock.",
+              "origin_c": ["always", "lock"], "citation": None,
+              "gate": [{"i": 1, "stability": 1.0, "tokens": 1, "output": "Lock."},
+                       {"i": 2, "stability": 1.0, "tokens": 1, "output": "Lock.", "inferred": True}],
+              "gate_nli": [{"i": 1, "nli_stability": 1.0, "tokens": 1, "output": "Lock."},
+                           {"i": 2, "nli_stability": 1.0, "tokens": 1, "output": "Lock.",
+                            "inferred": True}]}
+    assert list(iter_signals(rewrite([result], tmp_path / "run.jsonl"))) == [result]
+
+
+def test_writer_creates_nothing_until_a_signal_or_a_clean_close(tmp_path):
+    path = tmp_path / "exp" / "run.jsonl"
+    with pytest.raises(KeyboardInterrupt):
+        with ResultWriter(path):
+            raise KeyboardInterrupt
+    assert not path.parent.exists()
+    with ResultWriter(path):
+        pass
+    assert path.read_text() == "" and list(iter_signals(path)) == []
+
+
+def test_result_file_streams_again_on_every_pass(tmp_path):
+    original = json.loads(V2_RUN.read_text())
+    results = ResultFile(rewrite(original, tmp_path / "run.jsonl"))
+    assert [r["signal"] for r in results] == [r["signal"] for r in original]
+    assert [r["signal"] for r in results] == [r["signal"] for r in original]
+    assert sum(1 for _ in results.records()) > len(original)
+
+
+def test_find_run_prefers_jsonl(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        find_run(tmp_path)
+    (tmp_path / "run.json").write_text("[]")
+    assert find_run(tmp_path) == tmp_path / "run.json"
+    (tmp_path / "run.jsonl").write_text("")
+    assert find_run(tmp_path) == tmp_path / "run.jsonl"
+    assert find_run(V2_RUN.parent) == V2_RUN
@@ -0,0 +1,207 @@
+import json
+
+import run_convergence_v2 as v2
+
+
+def test_log_lines_carry_the_thread_tag(capsys):
+    v2.log("untagged")
+    assert v2.tagged("legal", v2.log, "  first\n  second") is None
+    v2.log("after")
+    assert capsys.readouterr().out.splitlines() == [
+        "untagged", "[legal]   first", "[legal]   second", "after"]
+
+
+def test_in_parallel_workers_inherit_the_tag(monkeypatch, capsys):
+    monkeypatch.setattr(v2, "_ASYNC", object())
+    calls = [(v2.log, f"chain {k}") for k in range(3)]
+    v2.tagged("code", v2.in_parallel, *calls)
+    assert sorted(capsys.readouterr().out.splitlines()) == [
+        "[code] chain 0", "[code] chain 1", "[code] chain 2"]
+
+
+def test_parse_verdicts_accepts_strings_booleans_and_fences():
+    assert v2.parse_verdicts('["yes", "No", "y"]', 3) == [True, False, True]
+    assert v2.parse_verdicts("[true, false]", 2) == [True, False]
+    fenced = 'Here you go:\n```json\n["no", "yes"]\n```\nDone.'
+    assert v2.parse_verdicts(fenced, 2) == [False, True]
+
+
+def test_parse_verdicts_rejects_wrong_counts():
+    assert v2.parse_verdicts('["yes", "no"]', 3) is None
+    assert v2.parse_verdicts('["yes", "no", "yes", "no"]', 3) is None
+
+
+def test_parse_verdicts_rejects_non_json_and_odd_items():
+    assert v2.parse_verdicts("yes, no, yes", 3) is None
+    assert v2.parse_verdicts("[yes, no]", 2) is None
+    assert v2.parse_verdicts("] backwards [", 1) is None
+    assert v2.parse_verdicts('["maybe", "yes"]', 2) is None
+    assert v2.parse_verdicts('[1, 0]', 2) is None
+    assert v2.parse_verdicts('{"a": "yes"}', 1) is None
+
+
+def fake_llm(batch_reply):
+    """llm() stand-in: batch prompts get `batch_reply`, single ones a yes/no."""
+    calls = []
+
+    def llm(system, prompt, max_tokens=150):
+        calls.append(system)
+        if system == v2.SYS_NLI_BATCH:
+            return batch_reply
+        return "yes" if "entail this sentence:\n\"A\"" in prompt else "no"
+    return llm, calls
+
+
+def test_nli_check_batch_uses_parsed_verdicts(monkeypatch):
+    llm, calls = fake_llm('["yes", "no"]')
+    monkeypatch.setattr(v2, "llm", llm)
+    monkeypatch.setattr(v2, "NLI_BATCH_SIZE", 2)
+    assert v2.nli_check_batch([("x", "A"), ("x", "B")]) == [True, False]
+    assert calls == [v2.SYS_NLI_BATCH]
+
+
+def test_nli_check_batch_falls_back_per_pair(monkeypatch, capsys):
+    llm, calls = fake_llm("I cannot judge these.")
+    monkeypatch.setattr(v2, "llm", llm)
+    monkeypatch.setattr(v2, "NLI_BATCH_SIZE", 2)
+    pairs = [("x", "A"), ("x", "B"), ("y", "A")]
+    assert v2.nli_check_batch(pairs) == [True, False, True]
+    # two batch requests (2 + 1 pairs), each followed by its per-pair calls
+    assert calls == [v2.SYS_NLI_BATCH, v2.SYS_NLI, v2.SYS_NLI, v2.SYS_NLI_BATCH, v2.SYS_NLI]
+    assert "unparseable" in capsys.readouterr().out
+
+
+def test_fixpoint_mode_defaults_to_exact():
+    assert v2.FIXPOINT_MODE == "exact"
+
+
+def test_state_key_is_exact_unless_normalization_is_asked_for(monkeypatch):
+    assert v2.state_key("Pay now.") == v2.state_key("Pay now.")
+    assert v2.state_key("Pay now.") != v2.state_key("pay now")
+    monkeypatch.setattr(v2, "FIXPOINT_MODE", "normalized")
+    assert v2.state_key("Pay now.") == v2.state_key("  pay   NOW ")
+
+
+def turn(i, inp, out):
+    return {"i": i, "input": inp, "output": out, "tokens": len(out.split())}
+
+
+def test_fill_cycle_repeats_a_fixpoint(monkeypatch):
+    monkeypatch.setattr(v2, "N_ITERATIONS", 5)
+    turns = [turn(1, "S", "A"), turn(2, "A", "A")]
+    seen = {v2.state_key("S"): 1, v2.state_key("A"): 2}
+    assert v2.fill_cycle(turns, seen, "A", "C")
+    assert [t["i"] for t in turns] == [1, 2, 3, 4, 5]
+    assert [t["output"] for t in turns] == ["A"] * 5
+    assert [t.get("inferred", False) for t in turns] == [False, False, True, True, True]
+
+
+def test_fill_cycle_indexes_a_longer_cycle(monkeypatch):
+    monkeypatch.setattr(v2, "N_ITERATIONS", 7)
+    turns = [turn(1, "S", "A"), turn(2, "A", "B"), turn(3, "B", "A")]
+    seen = {v2.state_key(t["input"]): t["i"] for t in turns}
+    assert v2.fill_cycle(turns, seen, "A", "G")       # turn 4 would repeat turn 2
+    inferred = turns[3:]
+    assert [t["i"] for t in inferred] == [4, 5, 6, 7]
+    assert [t["output"] for t in inferred] == ["B", "A", "B", "A"]
+    assert [t["input"] for t in inferred] == ["A", "B", "A", "B"]
+    assert all(t["inferred"] for t in inferred)
+    assert not any("inferred" in t for t in turns[:3])
+
+
+def test_fill_cycle_leaves_new_states_and_off_mode_alone(monkeypatch):
+    turns = [turn(1, "S", "A")]
+    seen = {v2.state_key("S"): 1}
+    assert not v2.fill_cycle(turns, seen, "A", "C") and len(turns) == 1
+    monkeypatch.setattr(v2, "FIXPOINT_MODE", "off")
+    assert not v2.fill_cycle(turns, seen, "S", "C") and len(turns) == 1
+
+
+def test_nli_memo_dedups_normalized_outputs():
+    memo = v2.NLIMemo()
+    todo = memo.missing("Pay now.", ["Pay by Friday.", "pay by friday", "Leave."])
+    assert todo == ["Pay by Friday.", "Leave."]
+    memo.store("Pay now.", todo, [1.0, 0.0])
+    assert memo.get("pay now", "PAY BY FRIDAY!") == 1.0
+    assert memo.missing("Pay now.", ["Leave", "Stay."]) == ["Stay."]
+    assert (memo.judged, memo.reused, memo.pairs_skipped) == (3, 2, 4)
+
+
+def test_nli_stability_curve_skips_memoized_pairs(monkeypatch):
+    monkeypatch.setattr(v2, "NLI_BATCH_SIZE", 4)
+    judged = []
+
+    def check_batch(pairs):
+        judged.extend(pairs)
+        return [True] * len(pairs)
+    monkeypatch.setattr(v2, "nli_check_batch", check_batch)
+
+    memo = v2.NLIMemo()
+    turns = [dict(turn(i, "x", out), **({"inferred": True} if i == 3 else {}))
+             for i, out in ((1, "Pay now."), (2, "Pay now"), (3, "Pay now."))]
+    curve = v2.nli_stability_curve(turns, "You must pay.", "llm", memo)
+    assert [p["nli_stability"] for p in curve] == [1.0, 1.0, 1.0]
+    assert [p.get("inferred", False) for p in curve] == [False, False, True]
+    assert judged == [("You must pay.", "Pay now."), ("Pay now.", "You must pay.")]
+    assert memo.pairs_skipped == 4
+
+    v2.nli_stability_curve([turn(1, "x", "PAY NOW")], "You must pay.", "llm", memo)
+    assert len(judged) == 2 and memo.pairs_skipped == 6
+
+
+def test_next_exp_dir_does_not_create_and_reuses_empty_dirs(monkeypatch, tmp_path):
+    monkeypatch.setattr(v2, "EXPERIMENTS_DIR", tmp_path)
+    assert v2.next_exp_dir() == tmp_path / "EXP-001"
+    assert not (tmp_path / "EXP-001").exists()
+    (tmp_path / "EXP-001").mkdir()
+    (tmp_path / "EXP-001" / "run.jsonl").write_text("")
+    (tmp_path / "EXP-002").mkdir()
+    assert v2.next_exp_dir() == tmp_path / "EXP-002"
+    (tmp_path / "EXP-002" / "journal.jsonl").write_text("")
+    assert v2.next_exp_dir() == tmp_path / "EXP-003"
+
+
+class Interrupted(Exception):
+    pass
+
+
+def test_interrupted_run_resumes_from_its_journal(monkeypatch, tmp_path):
+    corpus = tmp_path / "corpus.json"
+    corpus.write_text(json.dumps({"canonical_signals": [
+        {"category": "contractual", "signal": "You must pay $100 by Friday if the deal closes."},
+        {"category": "rule", "signal": "Never share your password; always lock the screen."}]}))
+    monkeypatch.setattr(v2, "CORPUS_PATH", corpus)
+    monkeypatch.setattr(v2, "EXPERIMENTS_DIR", tmp_path / "experiments")
+    monkeypatch.setattr(v2, "N_ITERATIONS", 4)
+    monkeypatch.setattr(v2, "MAX_CONCURRENCY", 0)
+    real_llm, calls = v2.llm, []
+
+    def counting_llm(*args, **kwargs):
+        calls.append(args)
+        if limit is not None and len(calls) > limit:
+            raise Interrupted
+        return real_llm(*args, **kwargs)
+    monkeypatch.setattr(v2, "llm", counting_llm)
+
+    limit = None
+    v2.run()
+    full_calls = len(calls)
+    reference = (tmp_path / "experiments" / "EXP-001" / "run.jsonl").read_text()
+
+    calls.clear()
+    limit = full_calls // 2
+    try:
+        v2.run()
+    except Interrupted:
+        pass
+    exp = tmp_path / "experiments" / "EXP-002"
+    assert (exp / "journal.jsonl").exists()
+
+    calls.clear()
+    limit = None
+    monkeypatch.setenv("HARNESS_RESUME", "EXP-002")
+    v2.run()
+    assert 0 < len(calls) < full_calls
+    assert (exp / "run.jsonl").read_text() == reference
+    assert not (exp / "journal.jsonl").exists()
+    assert sorted(p.name for p in (tmp_path / "experiments").iterdir()) == ["EXP-001", "EXP-002"]
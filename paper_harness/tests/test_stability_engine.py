@@ -0,0 +1,68 @@
+import random
+
+import numpy as np
+import pytest
+
+import stability_engine
+from run_convergence_v2 import jaccard
+from stability_engine import Vocab, jaccard_matrix, jaccard_rows, popcount_bytes, stability_table
+
+WORDS = [f"w{k}" for k in range(150)]   # > 128 ids: three uint64 words per row
+
+
+def random_sets(rng, n):
+    sets = [set(rng.sample(WORDS, rng.randint(0, 40))) for _ in range(n)]
+    return sets + [set(), set()]
+
+
+@pytest.fixture(params=["native", "byte-table"])
+def engine(request, monkeypatch):
+    """Run each test with the numpy popcount and the numpy<2 byte-table one."""
+    if request.param == "byte-table":
+        monkeypatch.setattr(stability_engine, "popcount", popcount_bytes)
+    return request.param
+
+
+def unrounded(a, b):
+    if not a and not b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def test_stability_table_matches_scalar_jaccard(engine):
+    rng = random.Random(7)
+    for _ in range(20):
+        origin = set(rng.sample(WORDS, rng.randint(1, 30)))
+        curves = {"baseline": random_sets(rng, 8), "gate": random_sets(rng, 3), "empty": []}
+        table = stability_table(origin, curves, decimals=3)
+        assert table["empty"] == []
+        for cond, sets in curves.items():
+            assert table[cond] == [jaccard(s, origin) for s in sets]
+
+
+def test_empty_origin_edge_cases(engine):
+    table = stability_table(set(), {"c": [set(), {"a"}]})
+    assert table["c"] == [1.0, 0.0]
+
+
+def test_rows_and_matrix_match_unrounded_jaccard(engine):
+    rng = random.Random(11)
+    a_sets, b_sets = random_sets(rng, 6), random_sets(rng, 5)
+    vocab = Vocab()
+    bits = vocab.pack(a_sets + b_sets)
+    a, b = bits[:len(a_sets)], bits[len(a_sets):]
+    m = jaccard_matrix(a, b)
+    assert m.tolist() == [[unrounded(x, y) for y in b_sets] for x in a_sets]
+    rows = jaccard_rows(a[:len(b_sets)], b)
+    assert rows.tolist() == [unrounded(x, y) for x, y in zip(a_sets, b_sets)]
+
+
+def test_byte_table_popcount_agrees_with_bin_count():
+    rng = np.random.default_rng(3)
+    bits = rng.integers(0, 2**63, size=(50, 4), dtype=np.uint64) | np.uint64(1 << 63)
+    expected = [sum(bin(int(x)).count("1") for x in row) for row in bits]
+    assert popcount_bytes(bits).tolist() == expected
+    assert popcount_bytes(bits[:, 1:3]).tolist() == [
+        sum(bin(int(x)).count("1") for x in row) for row in bits[:, 1:3]]
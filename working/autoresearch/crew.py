@@ -2,7 +2,7 @@
 """
 autoresearch/crew.py — Convergence Study Analysis Crew
 Agents: Theorist → Adversary → Reporter
-Run: python3 crew.py [path/to/convergence_full_*.json]
+Run: python3 crew.py [path/to/convergence_full_*.jsonl]
 
 Loads the latest (or specified) convergence run, analyzes it against the
 Conservation Law of Commitment, and generates a structured research report.
@@ -15,19 +15,23 @@ GitHub:              github.com/SunrisesIllNeverSee/commitment-conservation
 Owner:               Deric J. McHenry / Ello Cello LLC
 """
 
-import json
 import sys
 import time
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 
-import requests
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "paper_harness"))
+from llm_backends import make_backend
+from results_io import ResultFile
+from results_table import flatten
 
 # ── Config ────────────────────────────────────────────────────────────────────
 
-OPENAI_KEY = (Path.home() / ".hange/openai_api_key").read_text().strip()
-OPENAI_URL = "https://api.openai.com/v1/chat/completions"
-MODEL      = "gpt-4o-mini"
+MODEL      = "gpt-4o-mini"   # key/URL/backend: see paper_harness/llm_backends.py
+BACKEND    = make_backend(MODEL, timeout=60)
 
 RUNS_DIR   = Path(__file__).parent.parent / "runs"
 REF_README = Path(__file__).parent.parent / "README.md"
@@ -44,58 +48,48 @@ CITATION = {
 # ── LLM ──────────────────────────────────────────────────────────────────────
 
 def llm(system: str, user: str, max_tokens: int = 600) -> str:
-    r = requests.post(OPENAI_URL,
-        headers={"Authorization": f"Bearer {OPENAI_KEY}", "Content-Type": "application/json"},
-        json={"model": MODEL,
-              "messages": [{"role": "system", "content": system},
-                           {"role": "user",   "content": user}],
-              "max_tokens": max_tokens, "temperature": 0.3},
-        timeout=60)
-    if r.status_code == 200:
-        return r.json()["choices"][0]["message"]["content"].strip()
-    print(f"  OpenAI error: {r.status_code} — {r.text[:200]}")
-    return ""
+    return BACKEND.chat([{"role": "system", "content": system},
+                         {"role": "user",   "content": user}],
+                        max_tokens=max_tokens, temperature=0.3)
 
 def log(msg): print(msg, flush=True)
 
 # ── Data loader ───────────────────────────────────────────────────────────────
 
-def load_latest_run() -> tuple[dict, Path]:
-    """Find the most recent convergence_full_*.json across all run dates."""
-    jsons = sorted(RUNS_DIR.glob("*/convergence_full_*.json"))
-    if not jsons:
-        raise FileNotFoundError(f"No convergence_full_*.json found under {RUNS_DIR}")
-    path = jsons[-1]
-    return json.loads(path.read_text()), path
-
-def summarize_results(data: list) -> str:
-    """Build a compact results table for agent context."""
-    from collections import defaultdict
-    groups = defaultdict(lambda: {"baseline": [], "enforced": []})
-    for sig in data:
-        for cond in sig["conditions"]:
-            key  = (cond["n_turns"], cond["label"])
-            side = "enforced" if cond["enforce"] else "baseline"
-            groups[key][side].append(cond["result"]["total_tokens"])
+def load_latest_run() -> tuple[ResultFile, Path]:
+    """
+    Find the most recent convergence_full_*.jsonl (or legacy .json) across
+    all run dates. Signals are streamed from disk on each pass over the result.
+    """
+    runs = sorted(RUNS_DIR.glob("*/convergence_full_*.json*"), key=lambda p: (p.parent.name, p.stem))
+    if not runs:
+        raise FileNotFoundError(f"No convergence_full_*.jsonl found under {RUNS_DIR}")
+    path = runs[-1]
+    return ResultFile(path), path
+
+def summarize_results(data) -> str:
+    """Build a compact results table for agent context (columnar over the run file)."""
+    df = pd.DataFrame(flatten(data.path), columns=["signal", "condition", "tokens"])
+    totals = df.groupby(["signal", "condition"], sort=False)["tokens"].sum().reset_index()
+    parts = totals["condition"].str.extract(r"^(?P<side>base|enf)_(?P<label>.+)_t(?P<n_turns>\d+)$")
+    totals = totals.join(parts).astype({"n_turns": int})
+    avg = totals.pivot_table(index=["n_turns", "label"], columns="side", values="tokens", aggfunc="mean")
+    n_sig = totals[totals["side"] == "base"].groupby(["n_turns", "label"])["signal"].nunique()
 
     lines = ["Condition | Turns | N_signals | Avg_Baseline | Avg_Enforced | Delta | Compression%"]
-    for (n_turns, label), sides in sorted(groups.items()):
-        if sides["baseline"] and sides["enforced"]:
-            avg_b = sum(sides["baseline"]) / len(sides["baseline"])
-            avg_e = sum(sides["enforced"]) / len(sides["enforced"])
-            delta = avg_b - avg_e
-            pct   = (delta / avg_b * 100) if avg_b else 0
-            n_sig = len(sides["baseline"])
-            lines.append(f"{label} | {n_turns} | {n_sig} | {avg_b:.1f} | {avg_e:.1f} | {delta:.1f} | {pct:.1f}%")
-
-    # Per-signal kernel retention rates
+    for (n_turns, label), row in avg.dropna(subset=["base", "enf"]).iterrows():
+        avg_b, avg_e = row["base"], row["enf"]
+        delta = avg_b - avg_e
+        pct   = (delta / avg_b * 100) if avg_b else 0
+        lines.append(f"{label} | {n_turns} | {n_sig[(n_turns, label)]} | {avg_b:.1f} | {avg_e:.1f} | {delta:.1f} | {pct:.1f}%")
+
+    # Per-signal kernel retention rates (sample first 3 signals)
     lines.append("\nKernel Retention Rates (enforced conditions):")
-    for sig in data[:3]:  # sample first 3 signals
-        cat = sig["category"]
+    for sig in islice(data, 3):
         for cond in sig["conditions"]:
             if cond["enforce"]:
                 kr = cond["result"]["kernel_retention_rate"]
-                lines.append(f"  [{cat}] {cond['label']} t{cond['n_turns']}: {kr:.1%}")
+                lines.append(f"  [{sig['category']}] {cond['label']} t{cond['n_turns']}: {kr:.1%}")
 
     return "\n".join(lines)
 
@@ -128,14 +122,16 @@ Format: clean Markdown with sections. No hype. No filler."""
 
 def run(run_path: Path = None):
     if run_path:
-        data = json.loads(run_path.read_text())
+        data = ResultFile(run_path)
         source = run_path
     else:
         data, source = load_latest_run()
 
+    first = next(iter(data), None)
     log(f"\n=== CONVERGENCE ANALYSIS CREW ===")
     log(f"Source: {source}")
-    log(f"Signals: {len(data)} | Conditions per signal: {len(data[0]['conditions']) if data else 0}")
+    log(f"Signals: {sum(1 for r in data.records() if r['condition'] == 'signal')} | "
+        f"Conditions per signal: {len(first['conditions']) if first else 0}")
     log(f"Citing: {CITATION['doi']}\n")
 
     results_summary = summarize_results(data)
@@ -229,6 +225,8 @@ Keep under 900 words. Clean Markdown. Cite: Patent {CITATION['patent']}, DOI {CI
     )
     out_path.write_text(header + report)
     log(f"\nReport saved: {out_path}")
+    if BACKEND.http:
+        log(BACKEND.latency.summary())
     return out_path
 
 